@@ -0,0 +1,301 @@
+import fnmatch
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django_redis.cache import RedisCache
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "yamtrack:cache:invalidate"
+CLEAR_ALL = "*"
+_MISSING = object()
+
+
+class LocalLRU:
+    """Bounded, thread-safe LRU of pickled values with a per-entry expiry."""
+
+    def __init__(self, max_entries, timeout):
+        """Initialize the LRU with its size and TTL limits."""
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the unpickled value for the key or _MISSING."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+
+        # callers mutate metadata dicts, so always hand out a fresh copy
+        return pickle.loads(payload)  # noqa: S301
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entries."""
+        if self.max_entries <= 0 or self.timeout <= 0:
+            return
+        payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.timeout, payload)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """Remove a key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_pattern(self, pattern):
+        """Remove every key matching a glob pattern."""
+        with self._lock:
+            for key in [k for k in self._data if fnmatch.fnmatchcase(k, pattern)]:
+                del self._data[key]
+
+    def clear(self):
+        """Remove every key."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        """Return the number of stored entries."""
+        return len(self._data)
+
+
+class TwoTierRedisCache(RedisCache):
+    """Redis cache with a per-process LRU in front of it.
+
+    Only keys starting with one of LOCAL_CACHE_KEY_PREFIXES use the local tier,
+    their reads are served from it when possible. Writes and deletes evict
+    the local copy and are broadcast over Redis pub/sub so the other workers drop
+    their copies too. Local entries also expire after LOCAL_CACHE_TIMEOUT seconds,
+    which bounds staleness if an invalidation message is missed.
+    """
+
+    def __init__(self, server, params):
+        """Initialize the Redis backend and the local tier."""
+        super().__init__(server, params)
+        options = params.get("OPTIONS", {})
+        self.local = LocalLRU(
+            max_entries=options.get("LOCAL_CACHE_MAX_ENTRIES", 1000),
+            timeout=options.get("LOCAL_CACHE_TIMEOUT", 300),
+        )
+        # other keys coordinate workers and are always read from Redis
+        self.local_key_prefixes = tuple(options.get("LOCAL_CACHE_KEY_PREFIXES", ()))
+        self._pubsub_enabled = options.get("LOCAL_CACHE_PUBSUB", True)
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+
+    def get(self, key, default=None, version=None, client=None):
+        """Return the value from the local tier, falling back to Redis."""
+        if not self._is_local(key):
+            return super().get(key, default=default, version=version, client=client)
+
+        self._ensure_listener()
+        local_key = self.make_key(key, version=version)
+
+        value = self.local.get(local_key)
+        if value is not _MISSING:
+            return value
+
+        value = super().get(key, default=_MISSING, version=version, client=client)
+        if value is _MISSING:
+            return default
+
+        self.local.set(local_key, value)
+        return value
+
+    def set(
+        self,
+        key,
+        value,
+        timeout=DEFAULT_TIMEOUT,
+        version=None,
+        client=None,
+        nx=False,  # noqa: FBT002
+        xx=False,  # noqa: FBT002
+    ):
+        """Set the value in Redis and invalidate every local copy."""
+        result = super().set(
+            key,
+            value,
+            timeout=timeout,
+            version=version,
+            client=client,
+            nx=nx,
+            xx=xx,
+        )
+        self._invalidate_key(key, version)
+        return result
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        """Add the value in Redis and invalidate every local copy."""
+        result = super().add(
+            key,
+            value,
+            timeout=timeout,
+            version=version,
+            client=client,
+        )
+        self._invalidate_key(key, version)
+        return result
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None, client=None):
+        """Set many values in Redis and invalidate every local copy."""
+        result = super().set_many(
+            data,
+            timeout=timeout,
+            version=version,
+            client=client,
+        )
+        for key in data:
+            self._invalidate_key(key, version)
+        return result
+
+    def delete(self, key, version=None, prefix=None, client=None):
+        """Delete the key from Redis and every local tier."""
+        result = super().delete(key, version=version, prefix=prefix, client=client)
+        self._invalidate_key(key, version)
+        return result
+
+    def delete_many(self, keys, version=None, client=None):
+        """Delete the keys from Redis and every local tier."""
+        keys = list(keys)
+        result = super().delete_many(keys, version=version, client=client)
+        for key in keys:
+            self._invalidate_key(key, version)
+        return result
+
+    def delete_pattern(
+        self,
+        pattern,
+        version=None,
+        prefix=None,
+        client=None,
+        itersize=None,
+    ):
+        """Delete keys matching the pattern from Redis and every local tier."""
+        result = super().delete_pattern(
+            pattern,
+            version=version,
+            prefix=prefix,
+            client=client,
+            itersize=itersize,
+        )
+        # the pattern may match local keys without sharing their prefix
+        self._invalidate(self.make_key(pattern, version=version))
+        return result
+
+    def incr(self, key, delta=1, version=None, client=None, ignore_key_check=False):  # noqa: FBT002
+        """Increment the value in Redis and invalidate every local copy."""
+        result = super().incr(
+            key,
+            delta=delta,
+            version=version,
+            client=client,
+            ignore_key_check=ignore_key_check,
+        )
+        self._invalidate_key(key, version)
+        return result
+
+    def decr(self, key, delta=1, version=None, client=None):
+        """Decrement the value in Redis and invalidate every local copy."""
+        result = super().decr(key, delta=delta, version=version, client=client)
+        self._invalidate_key(key, version)
+        return result
+
+    def clear(self, *args, **kwargs):
+        """Clear Redis and every local tier."""
+        result = super().clear(*args, **kwargs)
+        self._invalidate(CLEAR_ALL)
+        return result
+
+    def _is_local(self, key):
+        """Return whether the key is kept in the local tier."""
+        return isinstance(key, str) and key.startswith(self.local_key_prefixes)
+
+    def _invalidate_key(self, key, version):
+        """Invalidate the local copies of a key kept in the local tier."""
+        if self._is_local(key):
+            self._invalidate(self.make_key(key, version=version))
+
+    def _invalidate(self, local_key):
+        """Evict a key or glob pattern locally and notify the other workers."""
+        self._evict(local_key)
+
+        if not self._pubsub_enabled:
+            return
+
+        try:
+            self.client.get_client(write=True).publish(
+                INVALIDATION_CHANNEL,
+                f"{os.getpid()}:{local_key}",
+            )
+        except RedisError:
+            # other workers will drop the entry once the local TTL expires
+            logger.warning("Failed to publish cache invalidation for %s", local_key)
+
+    def _evict(self, local_key):
+        """Evict a key or glob pattern from this process' local tier."""
+        if local_key == CLEAR_ALL:
+            self.local.clear()
+        elif "*" in local_key:
+            self.local.delete_pattern(local_key)
+        else:
+            self.local.delete(local_key)
+
+    def _ensure_listener(self):
+        """Start the invalidation listener once per process."""
+        if not self._pubsub_enabled or self._listener_pid == os.getpid():
+            return
+
+        with self._listener_lock:
+            if self._listener_pid == os.getpid():
+                return
+            # entries inherited through fork may have missed invalidations
+            self.local.clear()
+            self._listener_pid = os.getpid()
+            threading.Thread(
+                target=self._listen,
+                name="cache-invalidation-listener",
+                daemon=True,
+            ).start()
+
+    def _listen(self):
+        """Evict local entries announced by other workers."""
+        pid = str(os.getpid())
+
+        while True:
+            try:
+                pubsub = self.client.get_client(write=False).pubsub(
+                    ignore_subscribe_messages=True,
+                )
+                pubsub.subscribe(INVALIDATION_CHANNEL)
+                for message in pubsub.listen():
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode()
+                    sender, _, local_key = data.partition(":")
+                    if sender != pid:
+                        self._evict(local_key)
+            except RedisError:
+                logger.warning(
+                    "Cache invalidation listener disconnected, retrying",
+                    exc_info=True,
+                )
+                # we may have missed messages while disconnected
+                self.local.clear()
+                time.sleep(5)
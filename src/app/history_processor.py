@@ -1,3 +1,6 @@
+import functools
+from collections import defaultdict
+
 from django.apps import apps
 from django.template.defaultfilters import pluralize
 
@@ -6,17 +9,43 @@ from app.models import MediaTypes, Status
 from app.templatetags import app_tags
 
 
+def get_media_history(medias):
+    """Return the history records of the media instances grouped by their id.
+
+    The records of all the instances are fetched in a single query, each list
+    ordered from the newest to the oldest record.
+    """
+    history_by_media = defaultdict(list)
+    if not medias:
+        return history_by_media
+
+    history_model = medias[0].history.model
+    for record in history_model.objects.filter(
+        id__in=[media.id for media in medias],
+    ).order_by("-history_date", "-history_id"):
+        history_by_media[record.id].append(record)
+
+    return history_by_media
+
+
 def process_history_entries(history_records, media_type, media_entry_number):
-    """Process all history records into timeline entries."""
+    """Process all history records into timeline entries.
+
+    The records belong to a single media instance, newest first. Each one is
+    diffed in memory against the record that follows it.
+    """
+    history_records = list(history_records)
     timeline_entries = []
-    last = history_records.first()
 
-    for _ in range(history_records.count()):
-        entry = process_history_entry((last, last.prev_record), media_type)
+    for new_record, old_record in zip(
+        history_records,
+        [*history_records[1:], None],
+        strict=True,
+    ):
+        entry = process_history_entry((new_record, old_record), media_type)
         if entry["changes"]:
             entry["media_entry_number"] = media_entry_number
             timeline_entries.append(entry)
-        last = last.prev_record
 
     return timeline_entries
 
@@ -42,7 +71,10 @@ def process_history_entry(entry, media_type):
 
 def process_changed_entry(new_record, old_record, media_type, processed_entry):
     """Process an entry representing a change to existing media."""
-    delta = new_record.diff_against(old_record)
+    delta = new_record.diff_against(
+        old_record,
+        included_fields=get_diff_fields(type(new_record)),
+    )
     changes = organize_changes(delta.changes, media_type)
     apply_date_status_integration(changes)
     build_changes_list(changes, processed_entry)
@@ -62,6 +94,24 @@ def process_creation_entry(new_record, media_type, processed_entry):
     return processed_entry
 
 
+@functools.cache
+def get_diff_fields(history_model):
+    """Return the names of the tracked fields compared between two records."""
+    return frozenset(
+        field.name for field in history_model.tracked_fields if field.editable
+    )
+
+
+@functools.cache
+def get_creation_fields(history_model):
+    """Return the fields of a historical model shown on a creation entry."""
+    return [
+        field
+        for field in history_model._meta.get_fields()
+        if not field.name.startswith("history_") and field.name != "id"
+    ]
+
+
 def organize_changes(changes, media_type):
     """Organize changes into categories."""
     organized = {
@@ -111,12 +161,9 @@ def collect_creation_changes(new_record, history_model, media_type):
         "other_changes": [],
     }
 
-    for field in history_model._meta.get_fields():
-        if (
-            field.name.startswith("history_")
-            or field.name in ["id"]
-            or not hasattr(new_record, field.attname)
-            or (field.name == "progress" and media_type == MediaTypes.MOVIE.value)
+    for field in get_creation_fields(history_model):
+        if not hasattr(new_record, field.attname) or (
+            field.name == "progress" and media_type == MediaTypes.MOVIE.value
         ):
             continue
 
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from app.models import TV, Season
+
+
+class Command(BaseCommand):
+    """Recompute the denormalized watch stats of all seasons and TV shows."""
+
+    help = "Recompute the watch stats of seasons and TV shows from their episodes"
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of seasons to refresh per batch",
+        )
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Refresh the watch stats in batches of seasons."""
+        batch_size = options["batch_size"]
+        season_ids = list(Season.objects.order_by("id").values_list("id", flat=True))
+
+        for start in range(0, len(season_ids), batch_size):
+            Season.refresh_watch_stats(season_ids[start : start + batch_size])
+
+        # TV shows without seasons are not reached through their seasons
+        TV.objects.filter(seasons__isnull=True).update(
+            watched_episodes=0,
+            first_watched_at=None,
+            last_watched_at=None,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Refreshed watch stats of {len(season_ids)} seasons"),
+        )
@@ -0,0 +1,107 @@
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from app.models import BasicMedia, MediaTypes, Status
+from events.models import Event
+from users.models import MediaStatusChoices
+
+
+class Command(BaseCommand):
+    """Print the query plans of the hot media and event queries.
+
+    Run it before and after applying the index migrations and diff the output
+    to compare the plans.
+    """
+
+    help = "Print EXPLAIN plans of the media list, search and event queries"
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument("username", help="User whose media are queried")
+        parser.add_argument(
+            "--media-type",
+            default=MediaTypes.MOVIE.value,
+            choices=[
+                media_type
+                for media_type in MediaTypes.values
+                if media_type != MediaTypes.EPISODE.value
+            ],
+            help="Media type of the list queries",
+        )
+        parser.add_argument(
+            "--search",
+            default="the",
+            help="Search term of the title search query",
+        )
+        parser.add_argument(
+            "--analyze",
+            action="store_true",
+            help="Run the queries and report actual timings (PostgreSQL only)",
+        )
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Explain every query and print its plan."""
+        try:
+            user = get_user_model().objects.get(username=options["username"])
+        except get_user_model().DoesNotExist as error:
+            msg = f"User {options['username']} does not exist"
+            raise CommandError(msg) from error
+
+        media_type = options["media_type"]
+        model = apps.get_model(app_label="app", model_name=media_type)
+        explain_options = {}
+        if options["analyze"] and connection.vendor == "postgresql":
+            explain_options = {"analyze": True, "buffers": True}
+
+        media = model.objects.filter(user=user).select_related("item").first()
+        item_id = media.item_id if media else 0
+        now = timezone.now()
+
+        queries = {
+            "Media list sorted by title": BasicMedia.objects.get_media_list(
+                user=user,
+                media_type=media_type,
+                status_filter=MediaStatusChoices.ALL,
+                sort_filter="title",
+            ),
+            "In progress media list sorted by score": (
+                BasicMedia.objects.get_media_list(
+                    user=user,
+                    media_type=media_type,
+                    status_filter=Status.IN_PROGRESS.value,
+                    sort_filter="score",
+                )
+            ),
+            "Media list title search": BasicMedia.objects.get_media_list(
+                user=user,
+                media_type=media_type,
+                status_filter=MediaStatusChoices.ALL,
+                sort_filter="title",
+                search=options["search"],
+            ),
+            "Instances of an item": model.objects.filter(
+                user=user,
+                item_id=item_id,
+            ).order_by("-created_at"),
+            "Recently added media": model.objects.filter(user=user).order_by(
+                "-created_at",
+            ),
+            "Next event of an item": Event.objects.filter(
+                item_id=item_id,
+                datetime__gt=now,
+            ).order_by("datetime")[:1],
+            "Latest released event of an item": Event.objects.filter(
+                item_id=item_id,
+                datetime__lte=now,
+                content_number__isnull=False,
+            ).order_by("-content_number")[:1],
+        }
+
+        self.stdout.write(f"Database: {connection.vendor}\n")
+        for title, queryset in queries.items():
+            self.stdout.write(self.style.MIGRATE_HEADING(title))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write("")
@@ -1,5 +1,6 @@
 from django.shortcuts import render
 
+from app.mixins import memoize_metadata
 from app.providers import services
 
 
@@ -27,3 +28,16 @@ class ProviderAPIErrorMiddleware:
                 status=500,
             )
         return None
+
+
+class MetadataMemoMiddleware:
+    """Middleware to dedupe metadata lookups within a request."""
+
+    def __init__(self, get_response):
+        """Initialize the middleware with the get_response callable."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Process the request with a request-scoped metadata memo."""
+        with memoize_metadata():
+            return self.get_response(request)
@@ -0,0 +1,98 @@
+# Generated by Django 5.2.11 on 2026-10-17 10:00
+
+from collections import Counter, defaultdict
+
+from django.db import migrations, models
+from django.db.models import Max, Min, Sum
+
+
+def backfill_watch_stats(apps, schema_editor):
+    """Fill the watch stats of existing seasons and TV shows from their episodes."""
+    Episode = apps.get_model("app", "Episode")
+    Season = apps.get_model("app", "Season")
+    TV = apps.get_model("app", "TV")
+
+    watched = defaultdict(list)
+    for season_id, episode_number, end_date in Episode.objects.filter(
+        item__isnull=False,
+    ).values_list("related_season_id", "item__episode_number", "end_date"):
+        watched[season_id].append((episode_number, end_date))
+
+    seasons = list(Season.objects.filter(id__in=watched.keys()).only("id", "status"))
+    for season in seasons:
+        episode_numbers = [number for number, _ in watched[season.id]]
+        dates = [date for _, date in watched[season.id] if date is not None]
+        if season.status == "In progress":
+            counts = Counter(episode_numbers)
+            season.watched_episodes = max(
+                episode_numbers,
+                key=lambda num: (counts[num], num),
+            )
+        else:
+            season.watched_episodes = max(episode_numbers)
+        season.first_watched_at = min(dates, default=None)
+        season.last_watched_at = max(dates, default=None)
+
+    fields = ["watched_episodes", "first_watched_at", "last_watched_at"]
+    Season.objects.bulk_update(seasons, fields, batch_size=500)
+
+    tvs = []
+    for row in (
+        Season.objects.filter(item__season_number__gt=0)
+        .values("related_tv_id")
+        .annotate(
+            total_watched=Sum("watched_episodes"),
+            first_watched=Min("first_watched_at"),
+            last_watched=Max("last_watched_at"),
+        )
+    ):
+        tvs.append(
+            TV(
+                id=row["related_tv_id"],
+                watched_episodes=row["total_watched"] or 0,
+                first_watched_at=row["first_watched"],
+                last_watched_at=row["last_watched"],
+            ),
+        )
+    TV.objects.bulk_update(tvs, fields, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0051_migrate_simkl_periodoc_tasks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='season',
+            name='first_watched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='season',
+            name='last_watched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='season',
+            name='watched_episodes',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='tv',
+            name='first_watched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tv',
+            name='last_watched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='tv',
+            name='watched_episodes',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_watch_stats, reverse_code=migrations.RunPython.noop),
+    ]
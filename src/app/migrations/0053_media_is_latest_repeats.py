@@ -0,0 +1,162 @@
+# Generated by Django 5.2.11 on 2026-10-17 11:00
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+REPEATABLE_MODELS = ["anime", "basicmedia", "book", "comic", "game", "manga", "movie"]
+
+
+def backfill_latest(apps, schema_editor):
+    """Flag the latest instance of each user and item and count the instances."""
+    for model_name in REPEATABLE_MODELS:
+        model = apps.get_model("app", model_name)
+
+        instances = defaultdict(list)
+        for instance_id, user_id, item_id in model.objects.order_by(
+            "user_id",
+            "item_id",
+            "-created_at",
+            "-id",
+        ).values_list("id", "user_id", "item_id"):
+            instances[(user_id, item_id)].append(instance_id)
+
+        to_update = []
+        for instance_ids in instances.values():
+            if len(instance_ids) == 1:
+                continue
+            to_update.extend(
+                model(id=instance_id, is_latest=index == 0, repeats=len(instance_ids))
+                for index, instance_id in enumerate(instance_ids)
+            )
+
+        model.objects.bulk_update(to_update, ["is_latest", "repeats"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0052_season_watch_stats_tv_watch_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='anime',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='anime',
+            name='repeats',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='basicmedia',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='basicmedia',
+            name='repeats',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='repeats',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='comic',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='comic',
+            name='repeats',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='game',
+            name='repeats',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='manga',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='manga',
+            name='repeats',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='repeats',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='season',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='season',
+            name='repeats',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name='tv',
+            name='is_latest',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AddField(
+            model_name='tv',
+            name='repeats',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddIndex(
+            model_name='anime',
+            index=models.Index(condition=models.Q(('is_latest', True)), fields=['user', 'status'], name='app_anime_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='basicmedia',
+            index=models.Index(condition=models.Q(('is_latest', True)), fields=['user', 'status'], name='app_basicmedia_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(condition=models.Q(('is_latest', True)), fields=['user', 'status'], name='app_book_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comic',
+            index=models.Index(condition=models.Q(('is_latest', True)), fields=['user', 'status'], name='app_comic_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(condition=models.Q(('is_latest', True)), fields=['user', 'status'], name='app_game_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='manga',
+            index=models.Index(condition=models.Q(('is_latest', True)), fields=['user', 'status'], name='app_manga_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(condition=models.Q(('is_latest', True)), fields=['user', 'status'], name='app_movie_latest_idx'),
+        ),
+        migrations.RunPython(backfill_latest, reverse_code=migrations.RunPython.noop),
+    ]
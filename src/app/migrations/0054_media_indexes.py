@@ -0,0 +1,120 @@
+# Generated by Django 5.2.11 on 2026-10-17 12:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+def create_title_trigram_index(apps, schema_editor):
+    """Index the title for icontains searches on PostgreSQL.
+
+    Django compiles icontains to UPPER("title"::text) LIKE UPPER(%s), so the
+    trigram index is built on the same expression. SQLite can't use an index
+    for LIKE with a leading wildcard, so nothing is created there.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS app_item_title_trgm_idx "
+        'ON app_item USING gin ((UPPER("title"::text)) gin_trgm_ops)',
+    )
+
+
+def drop_title_trigram_index(apps, schema_editor):
+    """Drop the PostgreSQL trigram index of the title."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS app_item_title_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0053_media_is_latest_repeats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(django.db.models.functions.text.Lower('title'), name='item_title_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='anime',
+            index=models.Index(fields=['user', 'item', '-created_at'], name='app_anime_user_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='anime',
+            index=models.Index(fields=['user', '-created_at'], name='app_anime_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='basicmedia',
+            index=models.Index(fields=['user', 'item', '-created_at'], name='app_basicmedia_user_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='basicmedia',
+            index=models.Index(fields=['user', '-created_at'], name='app_basicmedia_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['user', 'item', '-created_at'], name='app_book_user_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['user', '-created_at'], name='app_book_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comic',
+            index=models.Index(fields=['user', 'item', '-created_at'], name='app_comic_user_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comic',
+            index=models.Index(fields=['user', '-created_at'], name='app_comic_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['user', 'item', '-created_at'], name='app_game_user_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['user', '-created_at'], name='app_game_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='manga',
+            index=models.Index(fields=['user', 'item', '-created_at'], name='app_manga_user_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='manga',
+            index=models.Index(fields=['user', '-created_at'], name='app_manga_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['user', 'item', '-created_at'], name='app_movie_user_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['user', '-created_at'], name='app_movie_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tv',
+            index=models.Index(fields=['user', 'status'], name='app_tv_user_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tv',
+            index=models.Index(fields=['user', '-created_at'], name='app_tv_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='season',
+            index=models.Index(fields=['user', 'status'], name='app_season_user_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='season',
+            index=models.Index(fields=['user', 'item'], name='app_season_user_item_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='season',
+            index=models.Index(fields=['user', '-created_at'], name='app_season_recent_idx'),
+        ),
+        migrations.RunPython(create_title_trigram_index, reverse_code=drop_title_trigram_index),
+    ]
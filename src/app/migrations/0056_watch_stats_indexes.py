@@ -0,0 +1,39 @@
+# Generated by Django 5.2.11 on 2026-10-17 08:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0055_item_next_refresh'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='season',
+            index=models.Index(fields=['user', 'first_watched_at'], name='app_season_first_watched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='season',
+            index=models.Index(fields=['user', '-last_watched_at'], name='app_season_last_watched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='season',
+            index=models.Index(fields=['user', '-watched_episodes'], name='app_season_watched_eps_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tv',
+            index=models.Index(fields=['user', 'first_watched_at'], name='app_tv_first_watched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tv',
+            index=models.Index(fields=['user', '-last_watched_at'], name='app_tv_last_watched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tv',
+            index=models.Index(fields=['user', '-watched_episodes'], name='app_tv_watched_eps_idx'),
+        ),
+    ]
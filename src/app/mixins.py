@@ -1,3 +1,12 @@
+import copy
+import logging
+from contextvars import ContextVar
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
 class CalendarTriggerMixin:
     """Mixin to handle calendar trigger disabling functionality."""
 
@@ -28,3 +37,138 @@ class _DisableCalendarTriggers:
         from app.models import Item  # noqa: PLC0415
 
         Item._disable_calendar_triggers = self.original_value
+
+
+_active_metadata_memo = ContextVar("active_metadata_memo", default=None)
+METADATA_MEMO_MAX_ENTRIES = 512
+
+
+def memoize_metadata():
+    """Context manager to dedupe metadata lookups within one unit of work.
+
+    Applies to providers.services.get_media_metadata. Nested contexts share the
+    outermost memo so its counters cover the whole unit of work.
+    """
+    return _MetadataMemo()
+
+
+def get_metadata_memo():
+    """Return the active metadata memo, if any."""
+    return _active_metadata_memo.get()
+
+
+class _MetadataMemo:
+    """Context manager caching metadata results by their lookup arguments."""
+
+    def __init__(self):
+        """Initialize an empty memo."""
+        self.values = {}
+        self.hits = 0
+        self.misses = 0
+        self._token = None
+        self._outer = None
+
+    def __enter__(self):
+        """Activate the memo unless an outer one is already active."""
+        self._outer = _active_metadata_memo.get()
+        if self._outer is not None:
+            return self._outer
+
+        self._token = _active_metadata_memo.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Deactivate the memo and report its counters."""
+        if self._token is None:
+            return
+
+        _active_metadata_memo.reset(self._token)
+        self._token = None
+        if self.hits or self.misses:
+            logger.debug(
+                "Metadata memo: %s hits, %s misses",
+                self.hits,
+                self.misses,
+            )
+
+    def get_or_fetch(self, key, fetch):
+        """Return the memoized value for the key, calling fetch on a miss."""
+        # callers mutate metadata dicts, so always hand out a fresh copy
+        if key in self.values:
+            self.hits += 1
+            return copy.deepcopy(self.values[key])
+
+        self.misses += 1
+        value = fetch()
+        if len(self.values) >= METADATA_MEMO_MAX_ENTRIES:
+            # long-running tasks touch many items, drop the oldest entry
+            del self.values[next(iter(self.values))]
+        self.values[key] = copy.deepcopy(value)
+        return value
+
+
+_deferred_episode_updates = ContextVar("deferred_episode_updates", default=None)
+
+
+def defer_episode_status_updates(*, batch=False):
+    """Context manager to coalesce season/TV status updates of episode inserts.
+
+    Episode saves inside the context only record the watched episode number. On
+    commit, each season gets a single status update, either inline or, with
+    batch=True, through a delayed task that also merges updates from other
+    requests, e.g. webhook bursts.
+    """
+    return _DeferEpisodeStatusUpdates(batch=batch)
+
+
+def get_deferred_episode_updates():
+    """Return the active deferred episode updates, if any."""
+    return _deferred_episode_updates.get()
+
+
+class _DeferEpisodeStatusUpdates:
+    """Context manager collecting watched episode numbers per season."""
+
+    def __init__(self, *, batch):
+        """Initialize with no pending updates."""
+        self.batch = batch
+        self.pending = {}
+        self._token = None
+
+    def __enter__(self):
+        """Start collecting unless an outer context already does."""
+        outer = _deferred_episode_updates.get()
+        if outer is not None:
+            return outer
+
+        self._token = _deferred_episode_updates.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Schedule the status updates once the transaction commits."""
+        if self._token is None:
+            return
+
+        _deferred_episode_updates.reset(self._token)
+        self._token = None
+        if exc_type is None and self.pending:
+            transaction.on_commit(self.flush)
+
+    def add(self, season, episode_number):
+        """Record a watched episode of a season."""
+        _, episode_numbers = self.pending.setdefault(season.id, (season, []))
+        episode_numbers.append(episode_number)
+
+    def flush(self):
+        """Apply or enqueue one status update per season."""
+        from app import statistics, tasks  # noqa: PLC0415
+
+        for user_id in {season.user_id for season, _ in self.pending.values()}:
+            statistics.invalidate_statistics(user_id)
+
+        for season, episode_numbers in self.pending.values():
+            if self.batch:
+                tasks.queue_season_status_update(season.id, episode_numbers)
+            else:
+                season.update_status_from_episodes(episode_numbers)
+        self.pending = {}
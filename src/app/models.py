@@ -1,4 +1,5 @@
 import logging
+from collections import Counter, defaultdict
 
 from django.apps import apps
 from django.conf import settings
@@ -9,28 +10,38 @@ from django.core.validators import (
 )
 from django.db import models
 from django.db.models import (
+    Case,
     CheckConstraint,
-    Count,
     F,
+    FloatField,
     IntegerField,
     Max,
+    Min,
+    OuterRef,
     Prefetch,
     Q,
+    Subquery,
+    Sum,
     UniqueConstraint,
-    Window,
+    Value,
+    When,
 )
-from django.db.models.functions import Cast, RowNumber
+from django.db.models.functions import Cast, Coalesce
 from django.utils import timezone
 from model_utils import FieldTracker
 from model_utils.fields import MonitorField
 from simple_history.models import HistoricalRecords
-from simple_history.utils import bulk_create_with_history, bulk_update_with_history
 
 import app
 import events
 import users
 from app import providers
-from app.mixins import CalendarTriggerMixin
+from app.history import bulk_create_with_history, bulk_update_with_history
+from app.mixins import (
+    CalendarTriggerMixin,
+    get_deferred_episode_updates,
+    memoize_metadata,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +90,8 @@ class Item(CalendarTriggerMixin, models.Model):
     image = models.URLField()  # if add default, custom media entry will show the value
     season_number = models.PositiveIntegerField(null=True, blank=True)
     episode_number = models.PositiveIntegerField(null=True, blank=True)
+    # when the scheduled calendar reload fetches the releases again
+    next_refresh = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         """Meta options for the model."""
@@ -154,6 +167,11 @@ class Item(CalendarTriggerMixin, models.Model):
                 name="%(app_label)s_%(class)s_media_type_valid",
             ),
         ]
+        indexes = [
+            # case-insensitive title sorting of the media lists
+            models.Index(models.functions.Lower("title"), name="item_title_lower_idx"),
+            models.Index(fields=["next_refresh"], name="item_next_refresh_idx"),
+        ]
         ordering = ["media_id"]
 
     def __str__(self):
@@ -240,17 +258,8 @@ class MediaManager(models.Manager):
         if search:
             queryset = queryset.filter(item__title__icontains=search)
 
-        queryset = queryset.annotate(
-            repeats=Window(
-                expression=Count("id"),
-                partition_by=[F("item")],
-            ),
-            row_number=Window(
-                expression=RowNumber(),
-                partition_by=[F("item")],
-                order_by=F("created_at").desc(),
-            ),
-        ).filter(row_number=1)
+        # only show the latest instance of each item
+        queryset = queryset.filter(is_latest=True)
 
         queryset = queryset.select_related("item")
         queryset = self._apply_prefetch_related(queryset, media_type)
@@ -263,14 +272,15 @@ class MediaManager(models.Manager):
         """Apply appropriate prefetch_related based on media type."""
         # Apply media-specific prefetches
         if media_type == MediaTypes.TV.value:
-            return queryset.prefetch_related(
-                Prefetch(
-                    "seasons",
-                    queryset=Season.objects.select_related("item"),
+            # progress and dates are read from the watch columns, only the
+            # last watched episode has to be looked up
+            last_episodes = get_last_watched_episodes(OuterRef("pk"))
+            return queryset.annotate(
+                last_watched_season=Subquery(
+                    last_episodes.values("related_season__item__season_number")[:1],
                 ),
-                Prefetch(
-                    "seasons__episodes",
-                    queryset=Episode.objects.select_related("item"),
+                last_watched_episode=Subquery(
+                    last_episodes.values("item__episode_number")[:1],
                 ),
             )
 
@@ -303,78 +313,29 @@ class MediaManager(models.Manager):
 
     def _sort_tv_media_list(self, queryset, sort_filter):
         """Sort TV media list based on the sort criteria."""
-        if sort_filter == "start_date":
-            # Annotate with the minimum start_date from related seasons/episodes
-            queryset = queryset.annotate(
-                calculated_start_date=models.Min(
-                    "seasons__episodes__end_date",
-                    filter=models.Q(seasons__item__season_number__gt=0),
-                ),
-            )
-            return queryset.order_by(
-                models.F("calculated_start_date").asc(nulls_last=True),
-                models.functions.Lower("item__title"),
-            )
-
-        if sort_filter == "end_date":
-            # Annotate with the maximum end_date from related seasons/episodes
-            queryset = queryset.annotate(
-                calculated_end_date=models.Max(
-                    "seasons__episodes__end_date",
-                    filter=models.Q(seasons__item__season_number__gt=0),
-                ),
-            )
-            return queryset.order_by(
-                models.F("calculated_end_date").desc(nulls_last=True),
-                models.functions.Lower("item__title"),
-            )
-
-        if sort_filter == "progress":
-            # Annotate with the sum of episodes watched (excluding season 0)
-            queryset = queryset.annotate(
-                # Count episodes in regular seasons (season_number > 0)
-                calculated_progress=models.Count(
-                    "seasons__episodes",
-                    filter=models.Q(seasons__item__season_number__gt=0),
-                ),
-            )
-            return queryset.order_by(
-                "-calculated_progress",
-                models.functions.Lower("item__title"),
-            )
-
-        # Default to generic sorting
-        return self._sort_generic_media_list(queryset, sort_filter)
+        return self._sort_by_watch_stats(queryset, sort_filter)
 
     def _sort_season_media_list(self, queryset, sort_filter):
         """Sort Season media list based on the sort criteria."""
+        return self._sort_by_watch_stats(queryset, sort_filter)
+
+    def _sort_by_watch_stats(self, queryset, sort_filter):
+        """Sort TV or Season media list using their denormalized watch columns."""
         if sort_filter == "start_date":
-            # Annotate with the minimum end_date from related episodes
-            queryset = queryset.annotate(
-                calculated_start_date=models.Min("episodes__end_date"),
-            )
             return queryset.order_by(
-                models.F("calculated_start_date").asc(nulls_last=True),
+                models.F("first_watched_at").asc(nulls_last=True),
                 models.functions.Lower("item__title"),
             )
 
         if sort_filter == "end_date":
-            # Annotate with the maximum end_date from related episodes
-            queryset = queryset.annotate(
-                calculated_end_date=models.Max("episodes__end_date"),
-            )
             return queryset.order_by(
-                models.F("calculated_end_date").desc(nulls_last=True),
+                models.F("last_watched_at").desc(nulls_last=True),
                 models.functions.Lower("item__title"),
             )
 
         if sort_filter == "progress":
-            # Annotate with the maximum episode number
-            queryset = queryset.annotate(
-                calculated_progress=models.Max("episodes__item__episode_number"),
-            )
             return queryset.order_by(
-                "-calculated_progress",
+                "-watched_episodes",
                 models.functions.Lower("item__title"),
             )
 
@@ -416,7 +377,11 @@ class MediaManager(models.Manager):
         )
 
     def get_in_progress(self, user, sort_by, items_limit, specific_media_type=None):
-        """Get a media list of in progress media by type."""
+        """Get a media list of in progress media by type.
+
+        Sorting and pagination happen in the database, so only the displayed
+        rows are materialized.
+        """
         list_by_type = {}
         media_types = self._get_media_types_to_process(user, specific_media_type)
 
@@ -429,22 +394,20 @@ class MediaManager(models.Manager):
                 sort_filter=None,
             )
 
-            if not media_list:
+            total_count = media_list.count()
+            if not total_count:
                 continue
 
-            # Annotate with max_progress and next_event
-            self.annotate_max_progress(media_list, media_type)
-            self._annotate_next_event(media_list)
-
-            # Sort the media list
-            sorted_list = self._sort_in_progress_media(media_list, sort_by)
+            media_list = self._annotate_in_progress(media_list, media_type)
+            media_list = self._sort_in_progress_media(media_list, sort_by)
 
             # Apply pagination
-            total_count = len(sorted_list)
             if specific_media_type:
-                paginated_list = sorted_list[items_limit:]
+                paginated_list = list(media_list[items_limit:])
             else:
-                paginated_list = sorted_list[:items_limit]
+                paginated_list = list(media_list[:items_limit])
+
+            self._attach_next_event(paginated_list)
 
             list_by_type[media_type] = {
                 "items": paginated_list,
@@ -465,62 +428,118 @@ class MediaManager(models.Manager):
             if media_type != MediaTypes.TV.value
         ]
 
-    def _annotate_next_event(self, media_list):
-        """Annotate next_event for media items."""
+    def _annotate_in_progress(self, queryset, media_type):
+        """Annotate the values the in-progress sort options need."""
         current_time = timezone.now()
 
-        for media in media_list:
-            # Get future events sorted by datetime
-            future_events = sorted(
-                [
-                    event
-                    for event in getattr(media.item, "prefetched_events", [])
-                    if event.datetime > current_time
-                ],
-                key=lambda e: e.datetime,
+        future_events = events.models.Event.objects.filter(
+            item=OuterRef("item"),
+            datetime__gt=current_time,
+        ).order_by("datetime")
+
+        if media_type in (MediaTypes.TV.value, MediaTypes.SEASON.value):
+            current_progress = F("watched_episodes")
+            last_progressed = Coalesce("last_watched_at", "created_at")
+        else:
+            current_progress = F("progress")
+            last_progressed = Coalesce("progressed_at", "created_at")
+
+        queryset = queryset.annotate(
+            next_event_id=Subquery(future_events.values("id")[:1]),
+            next_event_datetime=Subquery(future_events.values("datetime")[:1]),
+            max_progress=self._max_progress_expression(media_type, current_time),
+            current_progress=current_progress,
+            last_progressed=last_progressed,
+        )
+
+        return queryset.annotate(
+            completion=Case(
+                When(max_progress__isnull=True, then=Value(None)),
+                When(
+                    max_progress__gt=0,
+                    then=Cast("current_progress", FloatField())
+                    / Cast("max_progress", FloatField()),
+                ),
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
+            episodes_left=Case(
+                When(max_progress__isnull=True, then=Value(None)),
+                When(max_progress=0, then=Value(0)),
+                default=F("max_progress") - F("current_progress"),
+                output_field=IntegerField(),
+            ),
+        )
+
+    def _max_progress_expression(self, media_type, current_datetime):
+        """Return the expression equivalent to annotate_max_progress."""
+        if media_type == MediaTypes.MOVIE.value:
+            return Value(1, output_field=IntegerField())
+
+        released_events = events.models.Event.objects.filter(
+            datetime__lte=current_datetime,
+            content_number__isnull=False,
+        )
+
+        if media_type == MediaTypes.TV.value:
+            # sum of the latest released episode of every season
+            latest_in_season = released_events.filter(
+                item=OuterRef("pk"),
+            ).order_by("-content_number")
+            season_latest = (
+                Item.objects.filter(
+                    media_id=OuterRef("item__media_id"),
+                    source=OuterRef("item__source"),
+                    media_type=MediaTypes.SEASON.value,
+                    season_number__gt=0,
+                )
+                .annotate(
+                    latest=Subquery(latest_in_season.values("content_number")[:1]),
+                )
+                .order_by()
+                .values("media_id")
+                .annotate(total=Sum("latest"))
+                .values("total")
             )
+            return Coalesce(Subquery(season_latest), Value(0))
 
-            media.next_event = future_events[0] if future_events else None
+        latest_released = released_events.filter(item=OuterRef("item")).order_by(
+            "-content_number",
+        )
+        return Subquery(latest_released.values("content_number")[:1])
 
-    def _sort_in_progress_media(self, media_list, sort_by):
+    def _sort_in_progress_media(self, queryset, sort_by):
         """Sort in-progress media based on the sort criteria."""
-        # Define primary sort functions based on sort_by
-        primary_sort_functions = {
-            users.models.HomeSortChoices.UPCOMING: lambda x: (
-                x.next_event is None,
-                x.next_event.datetime if x.next_event else None,
+        primary_orderings = {
+            users.models.HomeSortChoices.UPCOMING: F("next_event_datetime").asc(
+                nulls_last=True,
             ),
-            users.models.HomeSortChoices.RECENT: lambda x: -timezone.datetime.timestamp(
-                x.progressed_at if x.progressed_at is not None else x.created_at,
+            users.models.HomeSortChoices.RECENT: F("last_progressed").desc(),
+            users.models.HomeSortChoices.COMPLETION: F("completion").desc(
+                nulls_last=True,
             ),
-            users.models.HomeSortChoices.COMPLETION: lambda x: (
-                x.max_progress is None,
-                -(
-                    x.progress / x.max_progress * 100
-                    if x.max_progress and x.max_progress > 0
-                    else 0
-                ),
-            ),
-            users.models.HomeSortChoices.EPISODES_LEFT: lambda x: (
-                x.max_progress is None,
-                (x.max_progress - x.progress if x.max_progress else 0),
+            users.models.HomeSortChoices.EPISODES_LEFT: F("episodes_left").asc(
+                nulls_last=True,
             ),
-            users.models.HomeSortChoices.TITLE: lambda x: x.item.title.lower(),
+            users.models.HomeSortChoices.TITLE: models.functions.Lower("item__title"),
         }
 
-        primary_sort_function = primary_sort_functions[sort_by]
+        return queryset.order_by(
+            primary_orderings[sort_by],
+            F("last_progressed").desc(),
+            models.functions.Lower("item__title"),
+        )
 
-        return sorted(
-            media_list,
-            key=lambda x: (
-                primary_sort_function(x),
-                -timezone.datetime.timestamp(
-                    x.progressed_at if x.progressed_at is not None else x.created_at,
-                ),
-                x.item.title.lower(),
-            ),
+    def _attach_next_event(self, media_list):
+        """Replace the annotated next event ids with the event instances."""
+        event_ids = [media.next_event_id for media in media_list if media.next_event_id]
+        next_events = events.models.Event.objects.select_related("item").in_bulk(
+            event_ids,
         )
 
+        for media in media_list:
+            media.next_event = next_events.get(media.next_event_id)
+
     def annotate_max_progress(self, media_list, media_type):
         """Annotate max_progress for all media items."""
         current_datetime = timezone.now()
@@ -731,6 +750,65 @@ class Status(models.TextChoices):
     DROPPED = "Dropped", "Dropped"
 
 
+# denormalized from episodes, maintained by Season/TV.refresh_watch_stats
+WATCH_STATS_FIELDS = ["watched_episodes", "first_watched_at", "last_watched_at"]
+
+
+def get_update_fields(instance, update_fields):
+    """Return the fields written by a save of a TV show or season.
+
+    Full saves of existing rows leave out the watch columns, only
+    refresh_watch_stats writes them so a stale instance can't overwrite them.
+    """
+    if update_fields is not None or instance._state.adding:
+        return update_fields
+
+    deferred_fields = instance.get_deferred_fields()
+    return [
+        field.name
+        for field in instance._meta.concrete_fields
+        if not field.primary_key
+        and field.attname not in deferred_fields
+        and field.name not in WATCH_STATS_FIELDS
+    ]
+
+
+# latest instance per user and item, maintained by Media.refresh_latest
+LATEST_FIELDS = ["is_latest", "repeats"]
+
+
+def get_last_watched_episodes(tv_id):
+    """Return the watched episodes of a TV show, the latest first.
+
+    Specials (season 0) are excluded like in the watch columns.
+    """
+    return Episode.objects.filter(
+        related_season__related_tv=tv_id,
+        related_season__item__season_number__gt=0,
+        end_date__isnull=False,
+    ).order_by(
+        "-end_date",
+        "-related_season__item__season_number",
+        "-item__episode_number",
+    )
+
+
+def get_season_progress(episode_numbers, status):
+    """Return the current episode number of a season from its watched episodes.
+
+    In-progress seasons use the most repeated episode so rewatches show the
+    episode being rewatched, other seasons use the highest episode number.
+    """
+    if not episode_numbers:
+        return 0
+
+    if status == Status.IN_PROGRESS.value:
+        episode_counts = Counter(episode_numbers)
+        return max(episode_numbers, key=lambda num: (episode_counts[num], num))
+
+    return max(episode_numbers)
+
+
 class Media(models.Model):
     """Abstract model for all media types."""
 
@@ -743,6 +821,8 @@ class Media(models.Model):
             "user",
             "related_tv",
             "created_at",
+            *WATCH_STATS_FIELDS,
+            *LATEST_FIELDS,
         ],
     )
 
@@ -770,12 +850,32 @@ class Media(models.Model):
     start_date = models.DateTimeField(null=True, blank=True)
     end_date = models.DateTimeField(null=True, blank=True)
     notes = models.TextField(blank=True, default="")
+    is_latest = models.BooleanField(default=True)
+    repeats = models.PositiveIntegerField(default=1)
+
+    # whether a user can have several instances of the same item
+    allows_repeats = True
 
     class Meta:
         """Meta options for the model."""
 
         abstract = True
         ordering = ["user", "item", "-created_at"]
+        indexes = [
+            models.Index(
+                fields=["user", "status"],
+                condition=Q(is_latest=True),
+                name="%(app_label)s_%(class)s_latest_idx",
+            ),
+            models.Index(
+                fields=["user", "item", "-created_at"],
+                name="%(app_label)s_%(class)s_user_item_idx",
+            ),
+            models.Index(
+                fields=["user", "-created_at"],
+                name="%(app_label)s_%(class)s_recent_idx",
+            ),
+        ]
 
     def __str__(self):
         """Return the title of the media."""
@@ -783,14 +883,59 @@ class Media(models.Model):
 
     def save(self, *args, **kwargs):
         """Save the media instance."""
-        if self.tracker.has_changed("progress"):
-            self.process_progress()
+        with memoize_metadata():
+            if self.tracker.has_changed("progress"):
+                self.process_progress()
 
-        if self.tracker.has_changed("status"):
-            self.process_status()
+            if self.tracker.has_changed("status"):
+                self.process_status()
 
+        created = self._state.adding
         super().save(*args, **kwargs)
 
+        if created:
+            for instance in self.refresh_latest(self.user_id, [self.item_id]):
+                if instance.id == self.id:
+                    self.is_latest = instance.is_latest
+                    self.repeats = instance.repeats
+
+    def delete(self, *args, **kwargs):
+        """Delete the media instance and promote the previous one if needed."""
+        user_id, item_id = self.user_id, self.item_id
+        result = super().delete(*args, **kwargs)
+        self.refresh_latest(user_id, [item_id])
+        return result
+
+    @classmethod
+    def refresh_latest(cls, user_id, item_ids):
+        """Recompute is_latest and repeats of the user's instances of the items.
+
+        The most recently created instance of each item is the latest one and
+        every instance stores how many there are. Returns the changed instances.
+        """
+        item_ids = set(item_ids)
+        if not cls.allows_repeats or not item_ids:
+            return []
+
+        instances_by_item = defaultdict(list)
+        for row in (
+            cls.objects.filter(user_id=user_id, item_id__in=item_ids)
+            .order_by("item_id", "-created_at", "-id")
+            .values_list("id", "item_id", "is_latest", "repeats")
+        ):
+            instances_by_item[row[1]].append(row)
+
+        changed = []
+        for rows in instances_by_item.values():
+            for index, (instance_id, _, is_latest, repeats) in enumerate(rows):
+                if (is_latest, repeats) != (index == 0, len(rows)):
+                    changed.append(
+                        cls(id=instance_id, is_latest=index == 0, repeats=len(rows)),
+                    )
+
+        cls.objects.bulk_update(changed, LATEST_FIELDS, batch_size=500)
+        return changed
+
     def process_progress(self):
         """Update fields depending on the progress of the media."""
         if self.progress < 0:
@@ -863,6 +1008,13 @@ class BasicMedia(Media):
 class TV(Media):
     """Model for TV shows."""
 
+    watched_episodes = models.PositiveIntegerField(default=0)
+    first_watched_at = models.DateTimeField(null=True, blank=True)
+    last_watched_at = models.DateTimeField(null=True, blank=True)
+
+    # unique per user, rewatches are tracked through the episodes
+    allows_repeats = False
+
     tracker = FieldTracker()
 
     class Meta:
@@ -875,93 +1027,97 @@ class TV(Media):
                 name="%(app_label)s_%(class)s_unique_item_user",
             ),
         ]
+        indexes = [
+            models.Index(fields=["user", "status"], name="app_tv_user_status_idx"),
+            models.Index(fields=["user", "-created_at"], name="app_tv_recent_idx"),
+            models.Index(
+                fields=["user", "first_watched_at"],
+                name="app_tv_first_watched_idx",
+            ),
+            models.Index(
+                fields=["user", "-last_watched_at"],
+                name="app_tv_last_watched_idx",
+            ),
+            models.Index(
+                fields=["user", "-watched_episodes"],
+                name="app_tv_watched_eps_idx",
+            ),
+        ]
 
     @tracker  # postpone field reset until after the save
     def save(self, *args, **kwargs):
         """Save the media instance."""
+        kwargs["update_fields"] = get_update_fields(self, kwargs.get("update_fields"))
         super(Media, self).save(*args, **kwargs)
 
-        if self.tracker.has_changed("status"):
-            if self.status == Status.COMPLETED.value:
-                self._completed()
+        with memoize_metadata():
+            if self.tracker.has_changed("status"):
+                if self.status == Status.COMPLETED.value:
+                    self._completed()
 
-            elif self.status == Status.DROPPED.value:
-                self._mark_in_progress_seasons_as_dropped()
+                elif self.status == Status.DROPPED.value:
+                    self._mark_in_progress_seasons_as_dropped()
 
-            elif (
-                self.status == Status.IN_PROGRESS.value
-                and not self.seasons.filter(status=Status.IN_PROGRESS.value).exists()
-            ):
-                self._start_next_available_season()
+                elif (
+                    self.status == Status.IN_PROGRESS.value
+                    and not self.seasons.filter(
+                        status=Status.IN_PROGRESS.value,
+                    ).exists()
+                ):
+                    self._start_next_available_season()
 
-            self.item.fetch_releases(delay=True)
+                self.item.fetch_releases(delay=True)
 
     @property
     def progress(self):
         """Return the total episodes watched for the TV show."""
-        return sum(
-            season.progress
-            for season in self.seasons.all()
-            if season.item.season_number != 0
-        )
+        return self.watched_episodes
 
     @property
     def last_watched(self):
         """Return the latest watched episode in SxxExx format."""
-        watched_episodes = [
-            {
-                "season": season.item.season_number,
-                "episode": episode.item.episode_number,
-                "end_date": episode.end_date,
-            }
-            for season in self.seasons.all()
-            if hasattr(season, "episodes") and season.item.season_number != 0
-            for episode in season.episodes.all()
-            if episode.end_date is not None
-        ]
+        if not hasattr(self, "last_watched_episode"):
+            # not annotated by MediaManager._apply_prefetch_related
+            last_episode = (
+                get_last_watched_episodes(self.id)
+                .values_list(
+                    "related_season__item__season_number",
+                    "item__episode_number",
+                )
+                .first()
+            )
+            self.last_watched_season, self.last_watched_episode = last_episode or (
+                None,
+                None,
+            )
 
-        if not watched_episodes:
+        if self.last_watched_episode is None:
             return ""
 
-        latest_episode = max(
-            watched_episodes,
-            key=lambda x: (x["end_date"], x["season"], x["episode"]),
-        )
-
-        return f"S{latest_episode['season']:02d}E{latest_episode['episode']:02d}"
+        return f"S{self.last_watched_season:02d}E{self.last_watched_episode:02d}"
 
     @property
     def progressed_at(self):
         """Return the date when the last episode was watched."""
-        dates = [
-            season.progressed_at
-            for season in self.seasons.all()
-            if season.progressed_at and season.item.season_number != 0
-        ]
-        return max(dates) if dates else None
+        return self.last_watched_at
 
     @property
     def start_date(self):
         """Return the date of the first episode watched."""
-        dates = [
-            season.start_date
-            for season in self.seasons.all()
-            if season.start_date and season.item.season_number != 0
-        ]
-        return min(dates) if dates else None
+        return self.first_watched_at
 
     @property
     def end_date(self):
         """Return the date of the last episode watched."""
-        dates = [
-            season.end_date
-            for season in self.seasons.all()
-            if season.end_date and season.item.season_number != 0
-        ]
-        return max(dates) if dates else None
+        return self.last_watched_at
 
     def _completed(self):
-        """Create remaining seasons and episodes for a TV show."""
+        """Create remaining seasons and episodes for a TV show.
+
+        Works on whole sets instead of per season: existing seasons and their
+        episodes are prefetched once, missing items and seasons are bulk created
+        and the remaining episodes of every season are created in one batch.
+        """
         tv_metadata = providers.services.get_media_metadata(
             self.item.media_type,
             self.item.media_id,
@@ -969,12 +1125,20 @@ class TV(Media):
         )
         max_progress = tv_metadata["max_progress"]
 
-        if not max_progress or self.progress > max_progress:
-            return
+        existing_seasons = {
+            season.item.season_number: season
+            for season in self.seasons.select_related("item").prefetch_related(
+                Prefetch("episodes", queryset=Episode.objects.select_related("item")),
+            )
+        }
+        progress = sum(
+            season.progress
+            for season_number, season in existing_seasons.items()
+            if season_number != 0
+        )
 
-        seasons_to_create = []
-        seasons_to_update = []
-        episodes_to_create = []
+        if not max_progress or progress > max_progress:
+            return
 
         season_numbers = [
             season["season_number"]
@@ -987,33 +1151,16 @@ class TV(Media):
             self.item.source,
             season_numbers,
         )
-        for season_number in season_numbers:
-            season_metadata = tv_with_seasons_metadata[f"season/{season_number}"]
-
-            item, _ = Item.objects.get_or_create(
-                media_id=self.item.media_id,
-                source=self.item.source,
-                media_type=MediaTypes.SEASON.value,
-                season_number=season_number,
-                defaults={
-                    "title": self.item.title,
-                    "image": season_metadata["image"],
-                },
-            )
-            try:
-                season_instance = Season.objects.get(
-                    item=item,
-                    user=self.user,
-                )
+        season_items = self._get_season_items(season_numbers, tv_with_seasons_metadata)
 
-                if season_instance.status != Status.COMPLETED.value:
-                    season_instance.status = Status.COMPLETED.value
-                    seasons_to_update.append(season_instance)
-
-            except Season.DoesNotExist:
+        seasons_to_create = []
+        seasons_to_update = []
+        for season_number in season_numbers:
+            season_instance = existing_seasons.get(season_number)
+            if season_instance is None:
                 seasons_to_create.append(
                     Season(
-                        item=item,
+                        item=season_items[season_number],
                         score=None,
                         status=Status.COMPLETED.value,
                         notes="",
@@ -1021,18 +1168,172 @@ class TV(Media):
                         user=self.user,
                     ),
                 )
+            elif season_instance.status != Status.COMPLETED.value:
+                season_instance.status = Status.COMPLETED.value
+                seasons_to_update.append(season_instance)
 
         bulk_create_with_history(seasons_to_create, Season)
         bulk_update_with_history(seasons_to_update, Season, ["status"])
 
-        for season_instance in seasons_to_create + seasons_to_update:
+        episodes_to_create = self._get_remaining_episodes(
+            seasons_to_create + seasons_to_update,
+            tv_with_seasons_metadata,
+        )
+        bulk_create_with_history(episodes_to_create, Episode)
+
+        self._refresh_season_watch_stats(seasons_to_create + seasons_to_update)
+
+    def _get_season_items(self, season_numbers, tv_with_seasons_metadata):
+        """Return a dict of season number to item, bulk creating missing ones."""
+        show_items = Item.objects.filter(
+            media_id=self.item.media_id,
+            source=self.item.source,
+            media_type=MediaTypes.SEASON.value,
+        )
+        season_items = {
+            item.season_number: item
+            for item in show_items.filter(season_number__in=season_numbers)
+        }
+
+        missing_season_nums = set(season_numbers) - season_items.keys()
+        if missing_season_nums:
+            Item.objects.bulk_create(
+                [
+                    Item(
+                        media_id=self.item.media_id,
+                        source=self.item.source,
+                        media_type=MediaTypes.SEASON.value,
+                        season_number=season_number,
+                        title=self.item.title,
+                        image=tv_with_seasons_metadata[f"season/{season_number}"][
+                            "image"
+                        ],
+                    )
+                    for season_number in sorted(missing_season_nums)
+                ],
+                ignore_conflicts=True,
+            )
+            # ignore_conflicts doesn't return primary keys, fetch them back
+            season_items.update(
+                {
+                    item.season_number: item
+                    for item in show_items.filter(
+                        season_number__in=missing_season_nums,
+                    )
+                },
+            )
+
+        return season_items
+
+    def _get_remaining_episodes(self, seasons, tv_with_seasons_metadata):
+        """Return unsaved episodes needed to complete all the given seasons."""
+        if not seasons:
+            return []
+
+        latest_watched = dict(
+            Episode.objects.filter(related_season__in=seasons)
+            .values("related_season")
+            .annotate(latest_watched_ep_num=Max("item__episode_number"))
+            .values_list("related_season", "latest_watched_ep_num"),
+        )
+
+        remaining = []
+        for season in seasons:
             season_metadata = tv_with_seasons_metadata[
-                f"season/{season_instance.item.season_number}"
+                f"season/{season.item.season_number}"
             ]
-            episodes_to_create.extend(
-                season_instance.get_remaining_eps(season_metadata),
+            latest_watched_ep_num = latest_watched.get(season.id) or 0
+            for episode in reversed(season_metadata["episodes"]):
+                if episode["episode_number"] <= latest_watched_ep_num:
+                    break
+                remaining.append((season, episode))
+
+        if not remaining:
+            return []
+
+        show_items = Item.objects.filter(
+            media_id=self.item.media_id,
+            source=self.item.source,
+            media_type=MediaTypes.EPISODE.value,
+            season_number__in={season.item.season_number for season in seasons},
+        )
+        episode_items = {
+            (item.season_number, item.episode_number): item for item in show_items
+        }
+
+        missing_items = {}
+        for season, episode in remaining:
+            key = (season.item.season_number, episode["episode_number"])
+            if key not in episode_items:
+                missing_items[key] = Item(
+                    media_id=self.item.media_id,
+                    source=self.item.source,
+                    media_type=MediaTypes.EPISODE.value,
+                    season_number=key[0],
+                    episode_number=key[1],
+                    title=self.item.title,
+                    image=get_episode_image(episode),
+                )
+
+        if missing_items:
+            Item.objects.bulk_create(missing_items.values(), ignore_conflicts=True)
+            # ignore_conflicts doesn't return primary keys, fetch them back
+            episode_items.update(
+                {
+                    (item.season_number, item.episode_number): item
+                    for item in show_items.filter(
+                        episode_number__in={key[1] for key in missing_items},
+                    )
+                },
             )
-        bulk_create_with_history(episodes_to_create, Episode)
+
+        now = timezone.now().replace(second=0, microsecond=0)
+        return [
+            Episode(
+                related_season=season,
+                item=episode_items[
+                    (season.item.season_number, episode["episode_number"])
+                ],
+                end_date=now,
+            )
+            for season, episode in remaining
+        ]
+
+    @classmethod
+    def refresh_watch_stats(cls, tv_ids):
+        """Recompute the denormalized watch columns from the seasons.
+
+        Specials (season 0) are excluded like in the progress properties.
+        Returns the updated instances.
+        """
+        tv_ids = set(tv_ids)
+        if not tv_ids:
+            return []
+
+        stats = {
+            row["related_tv_id"]: row
+            for row in Season.objects.filter(
+                related_tv_id__in=tv_ids,
+                item__season_number__gt=0,
+            )
+            .values("related_tv_id")
+            .annotate(
+                total_watched=Sum("watched_episodes"),
+                first_watched=Min("first_watched_at"),
+                last_watched=Max("last_watched_at"),
+            )
+        }
+
+        # the tracker loads deferred fields one query each when they're set
+        tvs = list(cls.objects.filter(id__in=tv_ids).only("id", *WATCH_STATS_FIELDS))
+        for tv in tvs:
+            row = stats.get(tv.id, {})
+            tv.watched_episodes = row.get("total_watched") or 0
+            tv.first_watched_at = row.get("first_watched")
+            tv.last_watched_at = row.get("last_watched")
+
+        cls.objects.bulk_update(tvs, WATCH_STATS_FIELDS, batch_size=500)
+        return tvs
 
     def _mark_in_progress_seasons_as_dropped(self):
         """Mark all in-progress seasons as dropped."""
@@ -1049,6 +1350,8 @@ class TV(Media):
                 Season,
                 fields=["status"],
             )
+            # the status decides how the progress is calculated
+            self._refresh_season_watch_stats(in_progress_seasons)
 
     def _start_next_available_season(self):
         """Find the next available season to watch and set it to in-progress."""
@@ -1102,6 +1405,12 @@ class TV(Media):
                 Season,
                 fields=["status"],
             )
+            self._refresh_season_watch_stats([next_unwatched_season])
+
+    def _refresh_season_watch_stats(self, seasons):
+        """Refresh the watch columns of the seasons and of this TV show."""
+        Season.refresh_watch_stats(season.id for season in seasons)
+        self.refresh_from_db(fields=WATCH_STATS_FIELDS)
 
 
 class Season(Media):
@@ -1112,6 +1421,12 @@ class Season(Media):
         on_delete=models.CASCADE,
         related_name="seasons",
     )
+    watched_episodes = models.PositiveIntegerField(default=0)
+    first_watched_at = models.DateTimeField(null=True, blank=True)
+    last_watched_at = models.DateTimeField(null=True, blank=True)
+
+    # unique per user, rewatches are tracked through the episodes
+    allows_repeats = False
 
     tracker = FieldTracker()
 
@@ -1127,6 +1442,23 @@ class Season(Media):
                 name="%(app_label)s_season_unique_tv_item",
             ),
         ]
+        indexes = [
+            models.Index(fields=["user", "status"], name="app_season_user_status_idx"),
+            models.Index(fields=["user", "item"], name="app_season_user_item_idx"),
+            models.Index(fields=["user", "-created_at"], name="app_season_recent_idx"),
+            models.Index(
+                fields=["user", "first_watched_at"],
+                name="app_season_first_watched_idx",
+            ),
+            models.Index(
+                fields=["user", "-last_watched_at"],
+                name="app_season_last_watched_idx",
+            ),
+            models.Index(
+                fields=["user", "-watched_episodes"],
+                name="app_season_watched_eps_idx",
+            ),
+        ]
 
     def __str__(self):
         """Return the title of the media and season number."""
@@ -1139,107 +1471,127 @@ class Season(Media):
         if self.related_tv_id is None:
             self.related_tv = self.get_tv()
 
+        kwargs["update_fields"] = get_update_fields(self, kwargs.get("update_fields"))
         super(Media, self).save(*args, **kwargs)
 
-        if self.tracker.has_changed("status"):
-            if self.status == Status.COMPLETED.value:
-                season_metadata = providers.services.get_media_metadata(
-                    MediaTypes.SEASON.value,
-                    self.item.media_id,
-                    self.item.source,
-                    [self.item.season_number],
-                )
-                episodes_to_create = self.get_remaining_eps(season_metadata)
-                if episodes_to_create:
-                    bulk_create_with_history(
-                        episodes_to_create,
-                        Episode,
+        with memoize_metadata():
+            if self.tracker.has_changed("status"):
+                if self.status == Status.COMPLETED.value:
+                    season_metadata = providers.services.get_media_metadata(
+                        MediaTypes.SEASON.value,
+                        self.item.media_id,
+                        self.item.source,
+                        [self.item.season_number],
+                    )
+                    episodes_to_create = self.get_remaining_eps(season_metadata)
+                    if episodes_to_create:
+                        bulk_create_with_history(
+                            episodes_to_create,
+                            Episode,
+                        )
+
+                elif (
+                    self.status == Status.DROPPED.value
+                    and self.related_tv.status != Status.DROPPED.value
+                ):
+                    self.related_tv.status = Status.DROPPED.value
+                    bulk_update_with_history(
+                        [self.related_tv],
+                        TV,
+                        fields=["status"],
                     )
 
-            elif (
-                self.status == Status.DROPPED.value
-                and self.related_tv.status != Status.DROPPED.value
-            ):
-                self.related_tv.status = Status.DROPPED.value
-                bulk_update_with_history(
-                    [self.related_tv],
-                    TV,
-                    fields=["status"],
-                )
+                elif (
+                    self.status == Status.IN_PROGRESS.value
+                    and self.related_tv.status != Status.IN_PROGRESS.value
+                ):
+                    self.related_tv.status = Status.IN_PROGRESS.value
+                    bulk_update_with_history(
+                        [self.related_tv],
+                        TV,
+                        fields=["status"],
+                    )
 
-            elif (
-                self.status == Status.IN_PROGRESS.value
-                and self.related_tv.status != Status.IN_PROGRESS.value
-            ):
-                self.related_tv.status = Status.IN_PROGRESS.value
-                bulk_update_with_history(
-                    [self.related_tv],
-                    TV,
-                    fields=["status"],
-                )
+                # the status decides how the progress is calculated
+                self.update_watch_stats()
+
+                self.item.fetch_releases(delay=True)
+
+    def delete(self, *args, **kwargs):
+        """Delete the season and update the watch stats of its TV show."""
+        related_tv_id = self.related_tv_id
+        result = super().delete(*args, **kwargs)
+        TV.refresh_watch_stats([related_tv_id])
+        return result
 
-            self.item.fetch_releases(delay=True)
+    @classmethod
+    def refresh_watch_stats(cls, season_ids):
+        """Recompute the denormalized watch columns from the episodes.
+
+        The TV shows of the seasons are refreshed too. Returns the updated
+        season instances.
+        """
+        season_ids = set(season_ids)
+        if not season_ids:
+            return []
+
+        watched = defaultdict(list)
+        for season_id, episode_number, end_date in Episode.objects.filter(
+            related_season_id__in=season_ids,
+            item__isnull=False,
+        ).values_list("related_season_id", "item__episode_number", "end_date"):
+            watched[season_id].append((episode_number, end_date))
+
+        seasons = list(
+            cls.objects.filter(id__in=season_ids).only(
+                "id",
+                "status",
+                "related_tv",
+                *WATCH_STATS_FIELDS,
+            ),
+        )
+        for season in seasons:
+            episodes = watched[season.id]
+            dates = [end_date for _, end_date in episodes if end_date is not None]
+            season.watched_episodes = get_season_progress(
+                [episode_number for episode_number, _ in episodes],
+                season.status,
+            )
+            season.first_watched_at = min(dates, default=None)
+            season.last_watched_at = max(dates, default=None)
+
+        cls.objects.bulk_update(seasons, WATCH_STATS_FIELDS, batch_size=500)
+        TV.refresh_watch_stats(season.related_tv_id for season in seasons)
+        return seasons
+
+    def update_watch_stats(self):
+        """Refresh the watch columns of this season and its TV show in place."""
+        refreshed = Season.refresh_watch_stats([self.id])
+        for field in WATCH_STATS_FIELDS:
+            setattr(self, field, getattr(refreshed[0], field))
+
+        tv = self.related_tv
+        tv.refresh_from_db(fields=WATCH_STATS_FIELDS)
 
     @property
     def progress(self):
         """Return the current episode number of the season."""
-        episodes = self.episodes.all()
-        if not episodes:
-            return 0
-
-        if self.status == Status.IN_PROGRESS.value:
-            # Calculate repeat counts for each episode number
-            episode_counts = {}
-            for ep in episodes:
-                ep_num = ep.item.episode_number
-                episode_counts[ep_num] = episode_counts.get(ep_num, 0) + 1
-
-            # Sort by repeat count then episode_number
-            sorted_episodes = sorted(
-                episodes,
-                key=lambda e: (
-                    -episode_counts[e.item.episode_number],
-                    -e.item.episode_number,
-                ),
-            )
-        else:
-            # Default sorting by episode_number
-            sorted_episodes = sorted(
-                episodes,
-                key=lambda e: -e.item.episode_number,
-            )
-
-        return sorted_episodes[0].item.episode_number
+        return self.watched_episodes
 
     @property
     def progressed_at(self):
         """Return the date when the last episode was watched."""
-        dates = [
-            episode.end_date
-            for episode in self.episodes.all()
-            if episode.end_date is not None
-        ]
-        return max(dates) if dates else None
+        return self.last_watched_at
 
     @property
     def start_date(self):
         """Return the date of the first episode watched."""
-        dates = [
-            episode.end_date
-            for episode in self.episodes.all()
-            if episode.end_date is not None
-        ]
-        return min(dates) if dates else None
+        return self.first_watched_at
 
     @property
     def end_date(self):
         """Return the date of the last episode watched."""
-        dates = [
-            episode.end_date
-            for episode in self.episodes.all()
-            if episode.end_date is not None
-        ]
-        return max(dates) if dates else None
+        return self.last_watched_at
 
     def increase_progress(self):
         """Watch the next episode of the season."""
@@ -1315,6 +1667,52 @@ class Season(Media):
             remaining_count,
         )
 
+    def update_status_from_episodes(self, episode_numbers):
+        """Update the season and TV status after watching the given episodes.
+
+        The episode numbers are applied in watch order, so several inserts
+        result in the same statuses as saving them one by one but with at most
+        one write per instance.
+        """
+        season_number = self.item.season_number
+        tv_with_seasons_metadata = providers.services.get_media_metadata(
+            "tv_with_seasons",
+            self.item.media_id,
+            self.item.source,
+            [season_number],
+        )
+        season_metadata = tv_with_seasons_metadata[f"season/{season_number}"]
+        max_progress = len(season_metadata["episodes"])
+
+        # clear prefetch cache to get the updated episodes
+        self.refresh_from_db()
+        tv = self.related_tv
+        season_status = self.status
+        tv_status = tv.status
+
+        for episode_number in episode_numbers:
+            if episode_number == max_progress:
+                season_status = Status.COMPLETED.value
+                last_season = tv_with_seasons_metadata["related"]["seasons"][-1][
+                    "season_number"
+                ]
+                # mark the TV show as completed if it's the last season
+                if season_number == last_season:
+                    tv_status = Status.COMPLETED.value
+            else:
+                season_status = Status.IN_PROGRESS.value
+                tv_status = Status.IN_PROGRESS.value
+
+        if season_status != self.status:
+            self.status = season_status
+            bulk_update_with_history([self], Season, fields=["status"])
+
+        if tv_status != tv.status:
+            tv.status = tv_status
+            bulk_update_with_history([tv], TV, fields=["status"])
+
+        self.update_watch_stats()
+
     def get_tv(self):
         """Get related TV instance for a season and create it if it doesn't exist."""
         try:
@@ -1375,24 +1773,24 @@ class Season(Media):
         if latest_watched_ep_num is None:
             latest_watched_ep_num = 0
 
-        episodes_to_create = []
-        now = timezone.now().replace(second=0, microsecond=0)
-
-        # Create Episode objects for the remaining episodes
+        remaining_ep_nums = []
         for episode in reversed(season_metadata["episodes"]):
             if episode["episode_number"] <= latest_watched_ep_num:
                 break
+            remaining_ep_nums.append(episode["episode_number"])
 
-            item = self.get_episode_item(episode["episode_number"], season_metadata)
+        items = self.get_episode_items(remaining_ep_nums, season_metadata)
+        now = timezone.now().replace(second=0, microsecond=0)
 
-            episode_db = Episode(
+        # Create Episode objects for the remaining episodes
+        return [
+            Episode(
                 related_season=self,
-                item=item,
+                item=items[episode_number],
                 end_date=now,
             )
-            episodes_to_create.append(episode_db)
-
-        return episodes_to_create
+            for episode_number in remaining_ep_nums
+        ]
 
     def get_episode_item(self, episode_number, season_metadata=None):
         """Get the episode item instance, create it if it doesn't exist."""
@@ -1404,19 +1802,14 @@ class Season(Media):
                 [self.item.season_number],
             )
 
-        image = settings.IMG_NONE
-        for episode in season_metadata["episodes"]:
-            if episode["episode_number"] == int(episode_number):
-                if episode.get("still_path"):
-                    image = (
-                        f"https://image.tmdb.org/t/p/original{episode['still_path']}"
-                    )
-                elif "image" in episode:
-                    # for manual seasons
-                    image = episode["image"]
-                else:
-                    image = settings.IMG_NONE
-                break
+        episode_metadata = next(
+            (
+                episode
+                for episode in season_metadata["episodes"]
+                if episode["episode_number"] == int(episode_number)
+            ),
+            None,
+        )
 
         item, _ = Item.objects.get_or_create(
             media_id=self.item.media_id,
@@ -1426,12 +1819,78 @@ class Season(Media):
             episode_number=episode_number,
             defaults={
                 "title": self.item.title,
-                "image": image,
+                "image": get_episode_image(episode_metadata),
             },
         )
 
         return item
 
+    def get_episode_items(self, episode_numbers, season_metadata):
+        """Return a dict of episode number to item, creating missing items.
+
+        Existing items are fetched in one query and the missing ones are bulk
+        created, so the cost doesn't grow with the number of episodes.
+        """
+        episode_numbers = {int(episode_number) for episode_number in episode_numbers}
+        if not episode_numbers:
+            return {}
+
+        season_items = Item.objects.filter(
+            media_id=self.item.media_id,
+            source=self.item.source,
+            media_type=MediaTypes.EPISODE.value,
+            season_number=self.item.season_number,
+        )
+        items = {
+            item.episode_number: item
+            for item in season_items.filter(episode_number__in=episode_numbers)
+        }
+
+        missing_ep_nums = episode_numbers - items.keys()
+        if missing_ep_nums:
+            episodes_metadata = {
+                episode["episode_number"]: episode
+                for episode in season_metadata["episodes"]
+            }
+            Item.objects.bulk_create(
+                [
+                    Item(
+                        media_id=self.item.media_id,
+                        source=self.item.source,
+                        media_type=MediaTypes.EPISODE.value,
+                        season_number=self.item.season_number,
+                        episode_number=episode_number,
+                        title=self.item.title,
+                        image=get_episode_image(
+                            episodes_metadata.get(episode_number),
+                        ),
+                    )
+                    for episode_number in sorted(missing_ep_nums)
+                ],
+                ignore_conflicts=True,
+            )
+            # ignore_conflicts doesn't return primary keys, fetch them back
+            items.update(
+                {
+                    item.episode_number: item
+                    for item in season_items.filter(
+                        episode_number__in=missing_ep_nums,
+                    )
+                },
+            )
+
+        return items
+
+
+def get_episode_image(episode_metadata):
+    """Return the image URL of an episode from its season metadata entry."""
+    if not episode_metadata:
+        return settings.IMG_NONE
+    if episode_metadata.get("still_path"):
+        return f"https://image.tmdb.org/t/p/original{episode_metadata['still_path']}"
+    # for manual seasons
+    return episode_metadata.get("image", settings.IMG_NONE)
+
 
 class Episode(models.Model):
     """Model for episodes of a season."""
@@ -1468,56 +1927,22 @@ class Episode(models.Model):
         """Save the episode instance."""
         super().save(*args, **kwargs)
 
-        season_number = self.item.season_number
-        tv_with_seasons_metadata = providers.services.get_media_metadata(
-            "tv_with_seasons",
-            self.item.media_id,
-            self.item.source,
-            [season_number],
-        )
-        season_metadata = tv_with_seasons_metadata[f"season/{season_number}"]
-        max_progress = len(season_metadata["episodes"])
-
-        # clear prefetch cache to get the updated episodes
-        self.related_season.refresh_from_db()
-
-        season_just_completed = False
-        if self.item.episode_number == max_progress:
-            self.related_season.status = Status.COMPLETED.value
-            bulk_update_with_history(
-                [self.related_season],
-                Season,
-                fields=["status"],
-            )
-            season_just_completed = True
+        deferred_updates = get_deferred_episode_updates()
+        if deferred_updates is not None:
+            deferred_updates.add(self.related_season, self.item.episode_number)
+            return
 
-        elif self.related_season.status != Status.IN_PROGRESS.value:
-            self.related_season.status = Status.IN_PROGRESS.value
-            bulk_update_with_history(
-                [self.related_season],
-                Season,
-                fields=["status"],
+        with memoize_metadata():
+            self.related_season.update_status_from_episodes(
+                [self.item.episode_number],
             )
 
-        if season_just_completed:
-            last_season = tv_with_seasons_metadata["related"]["seasons"][-1][
-                "season_number"
-            ]
-            # mark the TV show as completed if it's the last season
-            if season_number == last_season:
-                self.related_season.related_tv.status = Status.COMPLETED.value
-                bulk_update_with_history(
-                    [self.related_season.related_tv],
-                    TV,
-                    fields=["status"],
-                )
-        elif self.related_season.related_tv.status != Status.IN_PROGRESS.value:
-            self.related_season.related_tv.status = Status.IN_PROGRESS.value
-            bulk_update_with_history(
-                [self.related_season.related_tv],
-                TV,
-                fields=["status"],
-            )
+    def delete(self, *args, **kwargs):
+        """Delete the episode and update the watch stats of its season."""
+        related_season_id = self.related_season_id
+        result = super().delete(*args, **kwargs)
+        Season.refresh_watch_stats([related_season_id])
+        return result
 
 
 class Manga(Media):
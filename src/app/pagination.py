@@ -0,0 +1,168 @@
+import datetime
+import json
+import logging
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, OrderBy, Q
+from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "keyset_"
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """JSON encoder that keeps the full precision of datetimes."""
+
+    def default(self, o):
+        """Encode datetimes with microseconds, they are compared for equality."""
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPage:
+    """A page of results that continues after the last row of the previous one.
+
+    Exposes the subset of Django's Page API used by the infinite-scroll
+    templates, plus the cursor of the next page.
+    """
+
+    def __init__(self, object_list, next_cursor):
+        """Initialize the page with its rows and the cursor of the next page."""
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+
+    def __iter__(self):
+        """Iterate over the rows of the page."""
+        return iter(self.object_list)
+
+    def __len__(self):
+        """Return the number of rows in the page."""
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        """Return the row at the index."""
+        return self.object_list[index]
+
+    def has_next(self):
+        """Return whether there are more rows after this page."""
+        return self.next_cursor is not None
+
+
+def keyset_paginate(queryset, cursor, per_page):
+    """Return the page of an ordered queryset that follows the cursor.
+
+    The ordering of the queryset, with the primary key as a final tiebreaker,
+    is turned into a seek condition. Deep pages cost the same as the first
+    one and no COUNT query is needed.
+    """
+    keys = _get_keys(queryset)
+    aliases = [f"{KEY_PREFIX}{index}" for index in range(len(keys))]
+
+    queryset = queryset.annotate(
+        **{
+            alias: expression
+            for alias, (_, expression, _) in zip(aliases, keys, strict=True)
+        },
+    ).order_by(
+        *[
+            OrderBy(
+                F(alias),
+                descending=descending,
+                nulls_first=nulls_first or None,
+                nulls_last=not nulls_first or None,
+            )
+            for alias, (descending, _, nulls_first) in zip(aliases, keys, strict=True)
+        ],
+        "pk",
+    )
+
+    values = decode_cursor(cursor)
+    if values is not None and len(values) == len(keys) + 1:
+        queryset = queryset.filter(_seek_condition(keys, aliases, values))
+
+    rows = list(queryset[: per_page + 1])
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            [getattr(last, alias) for alias in aliases] + [last.pk],
+        )
+
+    return KeysetPage(rows, next_cursor)
+
+
+def encode_cursor(values):
+    """Encode the sort values of a row into an URL-safe cursor."""
+    return urlsafe_base64_encode(json.dumps(values, cls=CursorEncoder).encode())
+
+
+def decode_cursor(cursor):
+    """Decode a cursor into its sort values, None if missing or invalid."""
+    if not cursor:
+        return None
+
+    try:
+        values = json.loads(urlsafe_base64_decode(cursor))
+    except (ValueError, TypeError):
+        logger.warning("Ignoring invalid pagination cursor %s", cursor)
+        return None
+
+    return values if isinstance(values, list) else None
+
+
+def _get_keys(queryset):
+    """Return (descending, expression, nulls_first) tuples of the ordering."""
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    keys = []
+
+    for field in ordering:
+        if isinstance(field, str):
+            if field.lstrip("-") in ("pk", "id"):
+                continue
+            keys.append(
+                (
+                    field.startswith("-"),
+                    F(field.lstrip("-")),
+                    False,
+                ),
+            )
+        elif isinstance(field, OrderBy):
+            keys.append(
+                (
+                    field.descending,
+                    field.expression,
+                    bool(field.nulls_first),
+                ),
+            )
+        else:
+            keys.append((False, field, False))
+
+    return keys
+
+
+def _seek_condition(keys, aliases, values):
+    """Build the condition selecting the rows that sort after the values."""
+    *key_values, last_pk = values
+    condition = Q(pk__gt=last_pk)
+
+    for alias, (descending, _, nulls_first), value in reversed(
+        list(zip(aliases, keys, key_values, strict=True)),
+    ):
+        if value is None:
+            equal = Q(**{f"{alias}__isnull": True})
+            # with nulls last, nothing but other nulls sorts after a null
+            after = Q(**{f"{alias}__isnull": False}) if nulls_first else None
+        else:
+            equal = Q(**{alias: value})
+            after = Q(**{f"{alias}__{'lt' if descending else 'gt'}": value})
+            if not nulls_first:
+                after |= Q(**{f"{alias}__isnull": True})
+
+        condition = equal & condition
+        if after is not None:
+            condition = after | condition
+
+    return condition
@@ -3,11 +3,13 @@ import time
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from pyrate_limiter import RedisBucket
 from redis import ConnectionPool
 from requests.adapters import HTTPAdapter
 from requests_ratelimiter import LimiterAdapter, LimiterSession
 
+from app.mixins import get_metadata_memo
 from app.models import MediaTypes, Sources
 from app.providers import (
     comicvine,
@@ -22,6 +24,9 @@ from app.providers import (
 
 logger = logging.getLogger(__name__)
 
+# how long responses with validators are kept to revalidate them once stale
+VALIDATORS_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 7 days
+
 
 def get_redis_connection():
     """Return a Redis connection pool."""
@@ -96,6 +101,18 @@ class ProviderAPIError(Exception):
 
 def api_request(provider, method, url, params=None, data=None, headers=None):
     """Make a request to the API and return the response as a dictionary."""
+    return send_request(
+        provider,
+        method,
+        url,
+        params=params,
+        data=data,
+        headers=headers,
+    ).json()
+
+
+def send_request(provider, method, url, params=None, data=None, headers=None):
+    """Make a request to the API and return the response."""
     try:
         request_kwargs = {
             "url": url,
@@ -113,7 +130,6 @@ def api_request(provider, method, url, params=None, data=None, headers=None):
 
         response = request_func(**request_kwargs)
         response.raise_for_status()
-        return response.json()
 
     except requests.exceptions.HTTPError as error:
         error_resp = error.response
@@ -125,7 +141,7 @@ def api_request(provider, method, url, params=None, data=None, headers=None):
             logger.warning("Rate limited, waiting %s seconds", seconds_to_wait)
             time.sleep(seconds_to_wait + 3)
             logger.info("Retrying request")
-            return api_request(
+            return send_request(
                 provider,
                 method,
                 url,
@@ -136,6 +152,71 @@ def api_request(provider, method, url, params=None, data=None, headers=None):
 
         raise error from None
 
+    return response
+
+
+def cached_request(provider, url, cache_key, process=None, params=None):
+    """Return the processed response of a GET request, cached under the key.
+
+    Responses with an ETag or Last-Modified header are kept for
+    VALIDATORS_CACHE_TIMEOUT and their validators are stored next to them.
+    Once CACHE_TIMEOUT has passed, a conditional request is sent and a 304
+    Not Modified keeps the cached data without downloading or processing the
+    response again.
+    """
+    data = cache.get(cache_key)
+    validators_key = f"{cache_key}_validators"
+    validators = None
+    if data is not None:
+        validators = cache.get(validators_key)
+        if validators is None or validators.get("expires", 0) > time.time():
+            return data
+
+    headers = {}
+    if validators:
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = send_request(provider, "GET", url, params=params, headers=headers)
+
+    if validators and response.status_code == requests.codes.not_modified:
+        logger.debug("%s - Not modified, reusing the cached response", cache_key)
+        cache.touch(cache_key, VALIDATORS_CACHE_TIMEOUT)
+    else:
+        data = response.json()
+        if process:
+            data = process(data)
+
+        validators = get_validators(response)
+        if not validators:
+            cache.set(cache_key, data)
+            cache.delete(validators_key)
+            return data
+
+        cache.set(cache_key, data, VALIDATORS_CACHE_TIMEOUT)
+
+    validators["expires"] = time.time() + settings.CACHE_TIMEOUT
+    cache.set(validators_key, validators, VALIDATORS_CACHE_TIMEOUT)
+    return data
+
+
+def get_cache_timeout(cache_key):
+    """Return the timeout a response was cached with by cached_request."""
+    if cache.get(f"{cache_key}_validators") is not None:
+        return VALIDATORS_CACHE_TIMEOUT
+    return settings.CACHE_TIMEOUT
+
+
+def get_validators(response):
+    """Return the ETag and Last-Modified validators of a response."""
+    validators = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    return {key: value for key, value in validators.items() if isinstance(value, str)}
+
 
 def get_media_metadata(
     media_type,
@@ -145,6 +226,43 @@ def get_media_metadata(
     episode_number=None,
 ):
     """Return the metadata for the selected media."""
+    memo = get_metadata_memo()
+    if memo is None:
+        return _fetch_media_metadata(
+            media_type,
+            media_id,
+            source,
+            season_numbers,
+            episode_number,
+        )
+
+    key = (
+        media_type,
+        str(media_id),
+        source,
+        tuple(season_numbers) if season_numbers else None,
+        episode_number,
+    )
+    return memo.get_or_fetch(
+        key,
+        lambda: _fetch_media_metadata(
+            media_type,
+            media_id,
+            source,
+            season_numbers,
+            episode_number,
+        ),
+    )
+
+
+def _fetch_media_metadata(
+    media_type,
+    media_id,
+    source,
+    season_numbers,
+    episode_number,
+):
+    """Return the metadata for the selected media from its provider."""
     if source == Sources.MANUAL.value:
         if media_type == MediaTypes.SEASON.value:
             return manual.season(media_id, season_numbers[0])
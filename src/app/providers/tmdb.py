@@ -125,57 +125,55 @@ def find(external_id, external_source):
 def movie(media_id):
     """Return the metadata for the selected movie from The Movie Database."""
     cache_key = f"{Sources.TMDB.value}_{MediaTypes.MOVIE.value}_{media_id}"
-    data = cache.get(cache_key)
-
-    if data is None:
-        url = f"{base_url}/movie/{media_id}"
-        params = {
-            **base_params,
-            "append_to_response": "recommendations",
-        }
+    params = {
+        **base_params,
+        "append_to_response": "recommendations",
+    }
 
-        try:
-            response = services.api_request(
-                Sources.TMDB.value,
-                "GET",
-                url,
-                params=params,
-            )
-        except requests.exceptions.HTTPError as error:
-            handle_error(error)
+    try:
+        data = services.cached_request(
+            Sources.TMDB.value,
+            f"{base_url}/movie/{media_id}",
+            cache_key,
+            process=lambda response: process_movie(response, media_id),
+            params=params,
+        )
+    except requests.exceptions.HTTPError as error:
+        handle_error(error)
 
-        data = {
-            "media_id": media_id,
-            "source": Sources.TMDB.value,
-            "source_url": f"https://www.themoviedb.org/movie/{media_id}",
-            "media_type": MediaTypes.MOVIE.value,
-            "title": response["title"],
-            "max_progress": 1,
-            "image": get_image_url(response["poster_path"]),
-            "synopsis": get_synopsis(response["overview"]),
-            "genres": get_genres(response["genres"]),
-            "score": get_score(response["vote_average"]),
-            "score_count": response["vote_count"],
-            "details": {
-                "format": "Movie",
-                "release_date": get_start_date(response["release_date"]),
-                "status": response["status"],
-                "runtime": get_readable_duration(response["runtime"]),
-                "studios": get_companies(response["production_companies"]),
-                "country": get_country(response["production_countries"]),
-                "languages": get_languages(response["spoken_languages"]),
-            },
-            "related": {
-                "recommendations": get_related(
-                    response.get("recommendations", {}).get("results", [])[:15],
-                    MediaTypes.MOVIE.value,
-                ),
-            },
-        }
+    return data
 
-        cache.set(cache_key, data)
 
-    return data
+def process_movie(response, media_id):
+    """Process the metadata for the selected movie from The Movie Database."""
+    return {
+        "media_id": media_id,
+        "source": Sources.TMDB.value,
+        "source_url": f"https://www.themoviedb.org/movie/{media_id}",
+        "media_type": MediaTypes.MOVIE.value,
+        "title": response["title"],
+        "max_progress": 1,
+        "image": get_image_url(response["poster_path"]),
+        "synopsis": get_synopsis(response["overview"]),
+        "genres": get_genres(response["genres"]),
+        "score": get_score(response["vote_average"]),
+        "score_count": response["vote_count"],
+        "details": {
+            "format": "Movie",
+            "release_date": get_start_date(response["release_date"]),
+            "status": response["status"],
+            "runtime": get_readable_duration(response["runtime"]),
+            "studios": get_companies(response["production_companies"]),
+            "country": get_country(response["production_countries"]),
+            "languages": get_languages(response["spoken_languages"]),
+        },
+        "related": {
+            "recommendations": get_related(
+                response.get("recommendations", {}).get("results", [])[:15],
+                MediaTypes.MOVIE.value,
+            ),
+        },
+    }
 
 
 def get_cached_seasons(media_id, season_numbers):
@@ -304,27 +302,21 @@ def tv_with_seasons(media_id, season_numbers):
 def tv(media_id):
     """Return the metadata for the selected tv show from The Movie Database."""
     cache_key = f"{Sources.TMDB.value}_{MediaTypes.TV.value}_{media_id}"
-    data = cache.get(cache_key)
-
-    if data is None:
-        url = f"{base_url}/tv/{media_id}"
-        params = {
-            **base_params,
-            "append_to_response": "recommendations,external_ids",
-        }
-
-        try:
-            response = services.api_request(
-                Sources.TMDB.value,
-                "GET",
-                url,
-                params=params,
-            )
-        except requests.exceptions.HTTPError as error:
-            handle_error(error)
+    params = {
+        **base_params,
+        "append_to_response": "recommendations,external_ids",
+    }
 
-        data = process_tv(response)
-        cache.set(cache_key, data)
+    try:
+        data = services.cached_request(
+            Sources.TMDB.value,
+            f"{base_url}/tv/{media_id}",
+            cache_key,
+            process=process_tv,
+            params=params,
+        )
+    except requests.exceptions.HTTPError as error:
+        handle_error(error)
 
     return data
 
@@ -2,10 +2,17 @@ import logging
 
 from celery import states
 from celery.signals import before_task_publish
+from django.apps import apps
+from django.conf import settings
 from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django_celery_results.models import TaskResult
 
+from app import statistics
+from app.mixins import get_deferred_episode_updates
+from app.models import Episode, Media, MediaTypes, Season
+
 logger = logging.getLogger(__name__)
 
 
@@ -38,3 +45,50 @@ def create_task_result_on_publish(sender=None, headers=None, body=None, **kwargs
         task_args=headers.get("argsrepr", ""),
         task_kwargs=headers.get("kwargsrepr", ""),
     )
+
+
+# user preferences the statistics depend on
+STATISTICS_USER_FIELDS = frozenset(
+    f"{media_type}_enabled"
+    for media_type in MediaTypes.values
+    if media_type != MediaTypes.EPISODE.value
+)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def invalidate_user_statistics(sender, instance, update_fields=None, **kwargs):  # noqa: ARG001
+    """Drop the statistics snapshots when the enabled media types change."""
+    if update_fields is not None and not STATISTICS_USER_FIELDS & update_fields:
+        return
+
+    statistics.invalidate_statistics(instance.id)
+
+
+def invalidate_media_statistics(sender, instance, signal, origin=None, **kwargs):  # noqa: ARG001
+    """Drop the statistics snapshots of the user owning the saved media."""
+    # the snapshots were already dropped for the deleted parent media
+    if isinstance(origin, (Media, Episode)) and origin is not instance:
+        return
+
+    if isinstance(instance, Media):
+        user_id = instance.user_id
+    elif signal is post_save and get_deferred_episode_updates() is not None:
+        # the flush drops the snapshots once per user of the updated seasons
+        return
+    elif Episode.related_season.is_cached(instance):
+        user_id = instance.related_season.user_id
+    else:
+        user_id = (
+            Season.objects.filter(id=instance.related_season_id)
+            .values_list("user_id", flat=True)
+            .first()
+        )
+
+    if user_id is not None:
+        statistics.invalidate_statistics(user_id)
+
+
+for media_type in MediaTypes.values:
+    media_model = apps.get_model(app_label="app", model_name=media_type)
+    post_save.connect(invalidate_media_statistics, sender=media_model)
+    post_delete.connect(invalidate_media_statistics, sender=media_model)
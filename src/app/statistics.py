@@ -3,10 +3,13 @@ import datetime
 import heapq
 import itertools
 import logging
+import time
 from collections import defaultdict
 
 from dateutil.relativedelta import relativedelta
 from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.db.models import (
     Prefetch,
@@ -21,6 +24,76 @@ from app.templatetags import app_tags
 logger = logging.getLogger(__name__)
 
 
+def get_statistics(user, start_date, end_date):
+    """Return the statistics of the user within the date range.
+
+    The statistics are computed once and kept in the cache as a snapshot until
+    the user's media change or the day ends.
+    """
+    cache_key = _get_statistics_cache_key(user, start_date, end_date)
+    snapshot = cache.get(cache_key)
+    if snapshot is None:
+        snapshot = compute_statistics(user, start_date, end_date)
+        cache.set(cache_key, snapshot, settings.STATISTICS_CACHE_TIMEOUT)
+    else:
+        logger.info("%s - Using cached statistics", user)
+    return snapshot
+
+
+def compute_statistics(user, start_date, end_date):
+    """Compute every statistic shown on the statistics page."""
+    # Get all user media data in a single operation
+    user_media, media_count = get_user_media(user, start_date, end_date)
+
+    # Calculate all statistics from the retrieved data
+    score_distribution, top_rated = get_score_distribution(user_media)
+    status_distribution = get_status_distribution(user_media)
+
+    return {
+        "media_count": media_count,
+        "activity_data": get_activity_data(user, start_date, end_date),
+        "media_type_distribution": get_media_type_distribution(media_count),
+        "score_distribution": score_distribution,
+        "top_rated": top_rated,
+        "status_distribution": status_distribution,
+        "status_pie_chart_data": get_status_pie_chart_data(status_distribution),
+        "timeline": get_timeline(user_media),
+    }
+
+
+def invalidate_statistics(user_id):
+    """Drop the statistics snapshots of the user."""
+    cache.set(_get_statistics_version_key(user_id), time.time_ns(), timeout=None)
+
+
+def _get_statistics_version_key(user_id):
+    """Return the cache key of the version of the user's snapshots."""
+    return f"statistics_version_{user_id}"
+
+
+def _get_statistics_cache_key(user, start_date, end_date):
+    """Return the cache key of a statistics snapshot.
+
+    Bumping the version of the user makes the previous snapshots unreachable,
+    they are left to expire. The current day is part of the key as the
+    activity streaks depend on it.
+    """
+    version = cache.get_or_set(
+        _get_statistics_version_key(user.id),
+        time.time_ns,
+        timeout=None,
+    )
+    date_range = "_".join(
+        "all" if date is None else date.strftime("%Y-%m-%d")
+        for date in (start_date, end_date)
+    )
+    media_types = "-".join(user.get_active_media_types())
+    return (
+        f"statistics_{user.id}_{version}_{date_range}_"
+        f"{timezone.localdate():%Y-%m-%d}_{media_types}"
+    )
+
+
 def get_user_media(user, start_date, end_date):
     """Get all media items and their counts for a user within date range."""
     media_models = [
@@ -341,10 +414,11 @@ def get_timeline(user_media):
         if media_type == MediaTypes.TV.value:
             continue
         for media in queryset:
-            local_start_date = timezone.localdate(media.start_date)
-            local_end_date = timezone.localdate(media.end_date)
+            start_date, end_date = get_timeline_dates(media)
+            local_start_date = timezone.localdate(start_date)
+            local_end_date = timezone.localdate(end_date)
 
-            if media.start_date and media.end_date:
+            if start_date and end_date:
                 # add media to all months between start and end
                 current_date = local_start_date
                 while current_date <= local_end_date:
@@ -358,7 +432,7 @@ def get_timeline(user_media):
                     # Move to next month
                     current_date += relativedelta(months=1)
                     current_date = current_date.replace(day=1)
-            elif media.start_date:
+            elif start_date:
                 # If only start date, add to the start month
                 year = local_start_date.year
                 month = local_start_date.month
@@ -366,7 +440,7 @@ def get_timeline(user_media):
                 month_year = f"{month_name} {year}"
 
                 timeline[month_year].append(media)
-            elif media.end_date:
+            elif end_date:
                 # If only end date, add to the end month
                 year = local_end_date.year
                 month = local_end_date.month
@@ -395,11 +469,28 @@ def get_timeline(user_media):
     return result
 
 
+def get_timeline_dates(media):
+    """Return the start and end dates of the media within the timeline.
+
+    Seasons use their prefetched episodes, which are limited to the date
+    range, instead of their watch columns covering every episode.
+    """
+    if isinstance(media, Season):
+        dates = [
+            episode.end_date
+            for episode in media.episodes.all()
+            if episode.end_date is not None
+        ]
+        return min(dates, default=None), max(dates, default=None)
+    return media.start_date, media.end_date
+
+
 def time_line_sort_key(media):
     """Sort media items in the timeline."""
-    if media.end_date is not None:
-        return timezone.localdate(media.end_date)
-    return timezone.localdate(media.start_date)
+    start_date, end_date = get_timeline_dates(media)
+    if end_date is not None:
+        return timezone.localdate(end_date)
+    return timezone.localdate(start_date)
 
 
 def get_activity_data(user, start_date, end_date):
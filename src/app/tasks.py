@@ -0,0 +1,66 @@
+import logging
+
+from celery import shared_task
+from django.core.cache import cache
+from django_redis import get_redis_connection
+
+from app import statistics
+from app.models import Season
+
+logger = logging.getLogger(__name__)
+
+# wait for more episodes of the same season before updating its status
+SEASON_STATUS_DELAY = 30  # seconds
+
+
+def _pending_key(season_id):
+    return f"season_status_pending_{season_id}"
+
+
+def _scheduled_key(season_id):
+    return f"season_status_scheduled_{season_id}"
+
+
+def queue_season_status_update(season_id, episode_numbers):
+    """Queue watched episodes and schedule one status update per season."""
+    redis = get_redis_connection("default")
+    pending_key = _pending_key(season_id)
+    redis.rpush(pending_key, *episode_numbers)
+    redis.expire(pending_key, 60 * 60)
+
+    if cache.add(_scheduled_key(season_id), value=True, timeout=60 * 60):
+        update_season_status.apply_async(
+            args=[season_id],
+            countdown=SEASON_STATUS_DELAY,
+        )
+
+
+@shared_task(name="Update season status")
+def update_season_status(season_id):
+    """Apply the queued watched episodes to the season and TV status."""
+    # clear the flag first so episodes queued from now on schedule a new run
+    cache.delete(_scheduled_key(season_id))
+
+    redis = get_redis_connection("default")
+    pending_key = _pending_key(season_id)
+    with redis.pipeline() as pipe:
+        pipe.lrange(pending_key, 0, -1)
+        pipe.delete(pending_key)
+        episode_numbers, _ = pipe.execute()
+
+    episode_numbers = [int(number) for number in episode_numbers]
+    if not episode_numbers:
+        return "No pending episodes"
+
+    try:
+        season = Season.objects.select_related("item", "related_tv").get(
+            id=season_id,
+        )
+    except Season.DoesNotExist:
+        logger.info("Season %s was deleted before its status update", season_id)
+        return "Season not found"
+
+    season.update_status_from_episodes(episode_numbers)
+    # the bulk status updates send no signals
+    statistics.invalidate_statistics(season.user_id)
+    return f"Updated status of {season} from {len(episode_numbers)} episodes"
@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import TestCase
+
+from app.cache import LocalLRU
+
+
+class LocalLRUTests(TestCase):
+    """Test the bounded in-process LRU."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the oldest untouched entry is evicted first."""
+        lru = LocalLRU(max_entries=2, timeout=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        self.assertEqual(lru.get("a"), 1)
+        self.assertEqual(lru.get("c"), 3)
+        self.assertEqual(len(lru), 2)
+        self.assertNotEqual(lru.get("b"), 2)
+
+    def test_returns_copies(self):
+        """Test that mutating a returned value does not alter the stored one."""
+        lru = LocalLRU(max_entries=10, timeout=60)
+        lru.set("a", {"episodes": [1, 2]})
+
+        value = lru.get("a")
+        value["episodes"].append(3)
+
+        self.assertEqual(lru.get("a"), {"episodes": [1, 2]})
+
+    @patch("app.cache.time.monotonic")
+    def test_entries_expire(self, mock_monotonic):
+        """Test that entries are dropped after the local timeout."""
+        mock_monotonic.return_value = 100
+        lru = LocalLRU(max_entries=10, timeout=60)
+        lru.set("a", 1)
+
+        mock_monotonic.return_value = 161
+
+        self.assertEqual(len(lru), 1)
+        self.assertNotEqual(lru.get("a"), 1)
+        self.assertEqual(len(lru), 0)
+
+    def test_delete_pattern(self):
+        """Test that glob patterns evict matching keys only."""
+        lru = LocalLRU(max_entries=10, timeout=60)
+        lru.set(":1:search_tv", 1)
+        lru.set(":1:tmdb_tv_1", 2)
+
+        lru.delete_pattern(":1:search_*")
+
+        self.assertEqual(len(lru), 1)
+        self.assertEqual(lru.get(":1:tmdb_tv_1"), 2)
+
+
+class TwoTierRedisCacheTests(TestCase):
+    """Test the local tier in front of Redis."""
+
+    def setUp(self):
+        """Start every test from an empty cache."""
+        cache.clear()
+
+    def test_repeated_get_served_locally(self):
+        """Test that a second read does not hit Redis."""
+        cache.set("tmdb_movie_1", {"title": "Movie"})
+        cache.get("tmdb_movie_1")
+
+        with patch("django_redis.cache.RedisCache.get") as mock_get:
+            self.assertEqual(cache.get("tmdb_movie_1"), {"title": "Movie"})
+            mock_get.assert_not_called()
+
+    def test_delete_invalidates_local_tier(self):
+        """Test that deleting a key drops the local copy."""
+        cache.set("tmdb_movie_1", {"title": "Movie"})
+        cache.get("tmdb_movie_1")
+
+        cache.delete("tmdb_movie_1")
+
+        self.assertIsNone(cache.get("tmdb_movie_1"))
+
+    def test_set_invalidates_local_tier(self):
+        """Test that overwriting a key drops the stale local copy."""
+        cache.set("tmdb_movie_1", {"title": "Old"})
+        cache.get("tmdb_movie_1")
+
+        cache.set("tmdb_movie_1", {"title": "New"})
+
+        self.assertEqual(cache.get("tmdb_movie_1"), {"title": "New"})
+
+    def test_missing_key_returns_default(self):
+        """Test that misses are not cached and return the default."""
+        self.assertEqual(cache.get("missing", "default"), "default")
+        self.assertEqual(len(cache.local), 0)
+
+    def test_other_keys_bypass_local_tier(self):
+        """Test that keys outside the metadata prefixes are read from Redis."""
+        cache.set("statistics_version_1", 1)
+        cache.get("statistics_version_1")
+
+        self.assertEqual(len(cache.local), 0)
+
+    def test_positional_version_invalidates_local_tier(self):
+        """Test that a version passed positionally drops the right local copy."""
+        cache.set("tmdb_movie_1", {"title": "Old"}, None, 2)
+        cache.get("tmdb_movie_1", version=2)
+
+        cache.set("tmdb_movie_1", {"title": "New"}, None, 2)
+
+        self.assertEqual(cache.get("tmdb_movie_1", version=2), {"title": "New"})
@@ -0,0 +1,70 @@
+from datetime import UTC, datetime
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from app.history import bulk_create_with_history, bulk_update_with_history
+from app.models import Item, MediaTypes, Movie, Sources, Status
+
+
+class BulkHistoryTests(TestCase):
+    """Test the bulk history writer."""
+
+    def setUp(self):
+        """Create a user and the items of the movies."""
+        self.user = get_user_model().objects.create_user(username="test")
+        self.items = [
+            Item.objects.create(
+                media_id=str(media_id),
+                source=Sources.TMDB.value,
+                media_type=MediaTypes.MOVIE.value,
+                title=f"Movie {media_id}",
+            )
+            for media_id in range(2)
+        ]
+
+    def create_movies(self, **kwargs):
+        """Bulk create a planned movie for each item."""
+        movies = [
+            Movie(item=item, user=self.user, status=Status.PLANNING.value, score=7)
+            for item in self.items
+        ]
+        movies[0]._history_date = datetime(2024, 1, 1, tzinfo=UTC)
+        return bulk_create_with_history(movies, Movie, default_user=self.user, **kwargs)
+
+    def test_bulk_create_with_history(self):
+        """Test that a creation record is written for each movie."""
+        movies = self.create_movies()
+
+        records = Movie.history.order_by("id")
+        self.assertEqual(
+            [record.id for record in records],
+            [movie.id for movie in movies],
+        )
+        for record in records:
+            self.assertEqual(record.history_type, "+")
+            self.assertEqual(record.history_user, self.user)
+            self.assertEqual(record.score, 7)
+            self.assertEqual(record.status, Status.PLANNING.value)
+        self.assertEqual(records[0].history_date, datetime(2024, 1, 1, tzinfo=UTC))
+
+    def test_bulk_create_without_history(self):
+        """Test that only the movies are created without history."""
+        self.create_movies(history=False)
+
+        self.assertEqual(Movie.objects.count(), 2)
+        self.assertFalse(Movie.history.exists())
+
+    def test_bulk_update_with_history(self):
+        """Test that an update record is written for each updated movie."""
+        movies = self.create_movies()
+        for movie in movies:
+            movie.status = Status.COMPLETED.value
+
+        bulk_update_with_history(movies, Movie, ["status"])
+
+        updates = Movie.history.filter(history_type="~")
+        self.assertEqual(updates.count(), 2)
+        self.assertTrue(
+            all(record.status == Status.COMPLETED.value for record in updates),
+        )
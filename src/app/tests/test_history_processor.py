@@ -1,8 +1,14 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
 
 from app import media_type_config
-from app.history_processor import format_description
-from app.models import MediaTypes, Status
+from app.history import bulk_create_with_history, bulk_update_with_history
+from app.history_processor import (
+    format_description,
+    get_media_history,
+    process_history_entries,
+)
+from app.models import Item, MediaTypes, Movie, Sources, Status
 
 
 class HistoryProcessorTests(TestCase):
@@ -198,3 +204,45 @@ class HistoryProcessorTests(TestCase):
             format_description("custom_field", "old", "new"),
             "Updated custom field from old to new",
         )
+
+    def test_process_history_entries(self):
+        """Test that the history is fetched once and diffed in memory."""
+        user = get_user_model().objects.create_user(username="test")
+        item = Item.objects.create(
+            media_id="238",
+            source=Sources.TMDB.value,
+            media_type=MediaTypes.MOVIE.value,
+            title="The Godfather",
+            image="http://example.com/image.jpg",
+        )
+        # the bulk helpers record the history without fetching the metadata
+        movies = bulk_create_with_history(
+            [
+                Movie(item=item, user=user, status=Status.PLANNING.value)
+                for _ in range(2)
+            ],
+            Movie,
+        )
+        for score in (7, 9):
+            movies[0].score = score
+            bulk_update_with_history([movies[0]], Movie, ["score"])
+
+        with self.assertNumQueries(1):
+            history_by_media = get_media_history(movies)
+
+        with self.assertNumQueries(0):
+            entries = process_history_entries(
+                history_by_media[movies[0].id],
+                MediaTypes.MOVIE.value,
+                1,
+            )
+
+        self.assertEqual(
+            [entry["changes"][0]["description"] for entry in entries],
+            [
+                "Changed rating from 7.0 to 9.0",
+                "Rated 7.0/10",
+                "Added to watching list",
+            ],
+        )
+        self.assertEqual(len(history_by_media[movies[1].id]), 1)
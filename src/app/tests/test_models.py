@@ -1,12 +1,16 @@
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.db.models import Prefetch
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+from app.history import bulk_update_with_history
+from app.mixins import defer_episode_status_updates
 from app.models import (
     TV,
     Anime,
@@ -240,6 +244,36 @@ class MediaManagerTests(TestCase):
 
         self.assertEqual(len(media_list), 1)
 
+    def test_get_media_list_latest_instance(self):
+        """Test that repeated instances are listed once through is_latest."""
+        manager = MediaManager()
+        rewatch = Anime.objects.create(
+            item=self.anime_item,
+            user=self.user,
+            status=Status.IN_PROGRESS.value,
+            progress=2,
+        )
+
+        self.anime.refresh_from_db()
+        self.assertFalse(self.anime.is_latest)
+        self.assertTrue(rewatch.is_latest)
+        self.assertEqual(rewatch.repeats, 2)
+
+        media_list = manager.get_media_list(
+            user=self.user,
+            media_type=MediaTypes.ANIME.value,
+            status_filter=MediaStatusChoices.ALL,
+            sort_filter="score",
+        )
+        self.assertEqual(list(media_list), [rewatch])
+        self.assertEqual(media_list[0].repeats, 2)
+
+        # deleting the latest instance promotes the previous one
+        rewatch.delete()
+        self.anime.refresh_from_db()
+        self.assertTrue(self.anime.is_latest)
+        self.assertEqual(self.anime.repeats, 1)
+
     def test_get_media_list_with_search(self):
         """Test the get_media_list method with search parameter."""
         manager = MediaManager()
@@ -574,26 +608,17 @@ class MediaManagerTests(TestCase):
         self.assertNotIn(MediaTypes.MANGA.value, media_types)
         self.assertIn(MediaTypes.MOVIE.value, media_types)
 
-    def test_annotate_next_event(self):
-        """Test the _annotate_next_event method."""
-        manager = MediaManager()
-
-        # Get anime queryset
-        queryset = Anime.objects.filter(user=self.user.id).select_related("item")
-        anime_list = list(queryset)
-
-        # Prefetch events
-        for anime in anime_list:
-            anime.item.prefetched_events = list(Event.objects.filter(item=anime.item))
-
-        # Annotate next_event
-        manager._annotate_next_event(anime_list)
-
-        # Verify next_event is set correctly
-        self.assertIsNotNone(anime_list[0].next_event)
-        self.assertEqual(anime_list[0].next_event.item, self.anime_item)
+    def _in_progress_anime(self, sort_by):
+        """Return the in-progress anime list sorted by the given criteria."""
+        in_progress = MediaManager().get_in_progress(
+            user=self.user,
+            sort_by=sort_by,
+            items_limit=10,
+        )
+        return in_progress[MediaTypes.ANIME.value]["items"]
 
-        # Create anime with no future events
+    def test_in_progress_next_event(self):
+        """Test that in-progress media get their closest future event."""
         anime_item2 = Item.objects.create(
             media_id="5",
             source=Sources.MAL.value,
@@ -602,7 +627,7 @@ class MediaManagerTests(TestCase):
             image="http://example.com/naruto.jpg",
         )
 
-        Anime.objects.create(
+        anime2 = Anime.objects.create(
             item=anime_item2,
             user=self.user,
             status=Status.IN_PROGRESS.value,
@@ -617,36 +642,26 @@ class MediaManagerTests(TestCase):
             notification_sent=True,
         )
 
-        # Get updated queryset
-        queryset = Anime.objects.filter(
-            user=self.user.id,
-            item=anime_item2,
-        ).select_related("item")
-        anime_list = list(queryset)
-
-        # Prefetch events
-        for anime in anime_list:
-            anime.item.prefetched_events = list(Event.objects.filter(item=anime.item))
+        anime_list = {anime.id: anime for anime in self._in_progress_anime("title")}
 
-        # Annotate next_event
-        manager._annotate_next_event(anime_list)
+        # Verify next_event is the closest future event
+        next_event = anime_list[self.anime.id].next_event
+        self.assertEqual(next_event.item, self.anime_item)
+        self.assertEqual(next_event.content_number, 17)
 
         # Verify next_event is None for anime with no future events
-        self.assertIsNone(anime_list[0].next_event)
+        self.assertIsNone(anime_list[anime2.id].next_event)
 
     def test_sort_in_progress_media(self):
-        """Test the _sort_in_progress_media method."""
-        manager = MediaManager()
-
-        # Create test media items with different properties
-        anime_list = []
-
+        """Test the in-progress sort options."""
         # Anime with next event and high completion
         anime1 = self.anime
-        anime1.max_progress = 20
-        anime1.progress = 13
-        anime1.next_event = Event.objects.filter(item=self.anime_item).first()
-        anime_list.append(anime1)
+        Event.objects.create(
+            item=self.anime_item,
+            content_number=20,
+            datetime=timezone.now() - timedelta(days=1),
+            notification_sent=True,
+        )
 
         # Anime with no next event and low completion
         anime_item2 = Item.objects.create(
@@ -664,9 +679,12 @@ class MediaManagerTests(TestCase):
             score=6,
             progress=5,
         )
-        anime2.max_progress = 100
-        anime2.next_event = None
-        anime_list.append(anime2)
+        Event.objects.create(
+            item=anime_item2,
+            content_number=100,
+            datetime=timezone.now() - timedelta(days=1),
+            notification_sent=True,
+        )
 
         # Anime with next event and medium completion
         anime_item3 = Item.objects.create(
@@ -684,41 +702,115 @@ class MediaManagerTests(TestCase):
             score=9,
             progress=30,
         )
-        anime3.max_progress = 50
-        anime3.next_event = Event.objects.create(
+        Event.objects.create(
+            item=anime_item3,
+            content_number=50,
+            datetime=timezone.now() - timedelta(days=1),
+            notification_sent=True,
+        )
+        Event.objects.create(
             item=anime_item3,
             content_number=31,
             datetime=timezone.now() + timedelta(days=10),  # Further in the future
             notification_sent=False,
         )
-        anime_list.append(anime3)
 
-        # Test sort by upcoming
-        sorted_list = manager._sort_in_progress_media(anime_list, "upcoming")
         # Items with next_event should come first, sorted by datetime
-        self.assertEqual(sorted_list, [anime1, anime3, anime2])
+        self.assertEqual(self._in_progress_anime("upcoming"), [anime1, anime3, anime2])
 
-        # Test sort by title
-        sorted_list = manager._sort_in_progress_media(anime_list, "title")
         # Should be sorted alphabetically
-        self.assertEqual(
-            sorted_list,
-            sorted(anime_list, key=lambda x: x.item.title.lower()),
-        )
+        self.assertEqual(self._in_progress_anime("title"), [anime3, anime1, anime2])
 
-        # Test sort by completion
-        sorted_list = manager._sort_in_progress_media(anime_list, "completion")
         # Higher completion percentage first
-        self.assertEqual(sorted_list, [anime1, anime3, anime2])
+        self.assertEqual(
+            self._in_progress_anime("completion"),
+            [anime1, anime3, anime2],
+        )
 
-        # Test sort by episodes_left
-        sorted_list = manager._sort_in_progress_media(anime_list, "episodes_left")
         # Fewer episodes left first
-        self.assertEqual(sorted_list, [anime1, anime3, anime2])
+        self.assertEqual(
+            self._in_progress_anime("episodes_left"),
+            [anime1, anime3, anime2],
+        )
 
-        # Test sort by recent
-        sorted_list = manager._sort_in_progress_media(anime_list, sort_by="recent")
-        self.assertEqual(sorted_list, [anime3, anime2, anime1])
+        # Most recently progressed first
+        self.assertEqual(self._in_progress_anime("recent"), [anime3, anime2, anime1])
+
+        anime_list = self._in_progress_anime("completion")
+        self.assertEqual(anime_list[0].max_progress, 20)
+        self.assertEqual(anime_list[0].next_event.content_number, 17)
+
+    def test_get_in_progress_materializes_page_only(self):
+        """Test that only the displayed rows are fetched from the database."""
+        for i in range(10):
+            anime_item = Item.objects.create(
+                media_id=f"100{i}",
+                source=Sources.MAL.value,
+                media_type=MediaTypes.ANIME.value,
+                title=f"Test Anime {i}",
+                image=f"http://example.com/anime{i}.jpg",
+            )
+            Anime.objects.create(
+                item=anime_item,
+                user=self.user,
+                status=Status.IN_PROGRESS.value,
+            )
+
+        in_progress = MediaManager().get_in_progress(
+            user=self.user,
+            sort_by="upcoming",
+            items_limit=3,
+        )
+
+        self.assertEqual(len(in_progress[MediaTypes.ANIME.value]["items"]), 3)
+        self.assertEqual(in_progress[MediaTypes.ANIME.value]["total"], 11)
+        # the anime with upcoming events comes first
+        self.assertEqual(in_progress[MediaTypes.ANIME.value]["items"][0], self.anime)
+
+    def test_in_progress_tv_max_progress(self):
+        """Test that TV shows sum the latest released episode of every season."""
+        season2_item = Item.objects.create(
+            media_id="1668",
+            source=Sources.TMDB.value,
+            media_type=MediaTypes.SEASON.value,
+            title="Friends",
+            image="http://example.com/image.jpg",
+            season_number=2,
+        )
+        specials_item = Item.objects.create(
+            media_id="1668",
+            source=Sources.TMDB.value,
+            media_type=MediaTypes.SEASON.value,
+            title="Friends",
+            image="http://example.com/image.jpg",
+            season_number=0,
+        )
+        released = timezone.now() - timedelta(days=1)
+        Event.objects.bulk_create(
+            [
+                *(
+                    Event(item=self.season1_item, content_number=i, datetime=released)
+                    for i in range(1, 11)
+                ),
+                *(
+                    Event(item=season2_item, content_number=i, datetime=released)
+                    for i in range(1, 6)
+                ),
+                Event(
+                    item=season2_item,
+                    content_number=6,
+                    datetime=timezone.now() + timedelta(days=1),
+                ),
+                Event(item=specials_item, content_number=3, datetime=released),
+            ],
+        )
+
+        tv = MediaManager()._annotate_in_progress(
+            TV.objects.filter(user=self.user),
+            MediaTypes.TV.value,
+        )
+
+        self.assertEqual(tv.get().max_progress, 15)
 
     def test_annotate_max_progress(self):
         """Test the annotate_max_progress method."""
@@ -1237,6 +1329,60 @@ class TVStatusTests(TestCase):
         for season in self.tv.seasons.all():
             self.assertTrue(season.episodes.exists())
 
+    def _completion_query_count(self, media_id, num_seasons):
+        """Return the number of queries needed to complete a new TV show."""
+        tv = TV.objects.create(
+            item=Item.objects.create(
+                media_id=media_id,
+                source=Sources.TMDB.value,
+                media_type=MediaTypes.TV.value,
+                title="Long Show",
+                image="http://example.com/image.jpg",
+            ),
+            user=self.user,
+            status=Status.PLANNING.value,
+        )
+        season_numbers = range(1, num_seasons + 1)
+        mock_metadata = {
+            "max_progress": num_seasons * 10,
+            "related": {
+                "seasons": [
+                    {"season_number": number, "image": "img.jpg"}
+                    for number in season_numbers
+                ],
+            },
+        }
+        for number in season_numbers:
+            mock_metadata[f"season/{number}"] = {
+                "image": "http://example.com/image.jpg",
+                "season_number": number,
+                "episodes": [{"episode_number": ep} for ep in range(1, 11)],
+            }
+
+        with (
+            patch(
+                "app.models.providers.services.get_media_metadata",
+                return_value=mock_metadata,
+            ),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            tv._completed()
+
+        self.assertEqual(tv.seasons.count(), num_seasons)
+        self.assertEqual(
+            Episode.objects.filter(related_season__related_tv=tv).count(),
+            num_seasons * 10,
+        )
+        return len(queries)
+
+    def test_completed_query_count_independent_of_seasons(self):
+        """Test completing a show doesn't issue queries per season or episode."""
+        short_show_queries = self._completion_query_count("200", 2)
+        # kept below SQLite's bulk insert batch size
+        long_show_queries = self._completion_query_count("300", 6)
+
+        self.assertEqual(short_show_queries, long_show_queries)
+
     def test_dropped_status_marks_in_progress_seasons_dropped(self):
         """Test setting status to DROPPED marks in-progress seasons as dropped."""
         # Create another in-progress season
@@ -1270,6 +1416,77 @@ class TVStatusTests(TestCase):
             1,
         )
 
+    def test_dropped_status_refreshes_watch_stats(self):
+        """Test dropping a show recomputes the progress of its dropped seasons."""
+        episode_items = [
+            Item.objects.create(
+                media_id="123",
+                source=Sources.TMDB.value,
+                media_type=MediaTypes.EPISODE.value,
+                title="Test Show",
+                image="http://example.com/image.jpg",
+                season_number=1,
+                episode_number=number,
+            )
+            for number in (1, 2)
+        ]
+        # episode 1 is being rewatched
+        Episode.objects.bulk_create(
+            Episode(
+                item=episode_items[number - 1],
+                related_season=self.season1,
+                end_date=timezone.now(),
+            )
+            for number in (1, 1, 2)
+        )
+        Season.refresh_watch_stats([self.season1.id])
+        self.season1.refresh_from_db()
+        self.assertEqual(self.season1.progress, 1)
+
+        self.tv.status = Status.DROPPED.value
+        self.tv.save()
+
+        # dropped seasons count up to their highest episode
+        self.season1.refresh_from_db()
+        self.assertEqual(self.season1.progress, 2)
+        self.assertEqual(self.tv.progress, 2)
+
+    def test_save_keeps_refreshed_watch_stats(self):
+        """Test saving a stale instance doesn't overwrite the watch columns."""
+        stale_tv = TV.objects.get(pk=self.tv.pk)
+        stale_season = Season.objects.get(pk=self.season1.pk)
+        episode_item = Item.objects.create(
+            media_id="123",
+            source=Sources.TMDB.value,
+            media_type=MediaTypes.EPISODE.value,
+            title="Test Show",
+            image="http://example.com/image.jpg",
+            season_number=1,
+            episode_number=1,
+        )
+        Episode.objects.bulk_create(
+            [
+                Episode(
+                    item=episode_item,
+                    related_season=self.season1,
+                    end_date=timezone.now(),
+                ),
+            ],
+        )
+        Season.refresh_watch_stats([self.season1.id])
+
+        stale_season.notes = "Rewatching soon"
+        stale_season.save()
+        stale_tv.notes = "Rewatching soon"
+        stale_tv.save()
+
+        self.season1.refresh_from_db()
+        self.assertEqual(self.season1.watched_episodes, 1)
+        self.assertEqual(self.season1.notes, "Rewatching soon")
+        self.tv.refresh_from_db()
+        self.assertEqual(self.tv.watched_episodes, 1)
+        self.assertIsNotNone(self.tv.last_watched_at)
+
     @patch("app.models.providers.services.get_media_metadata")
     def test_in_progress_status_activates_next_season(self, _):
         """Test setting status to IN_PROGRESS activates next available season."""
@@ -1700,6 +1917,43 @@ class SeasonStatusTests(TestCase):
             # bulk_create shouldn't have been called
             mock_bulk_create.assert_not_called()
 
+    def test_get_remaining_eps_batches_item_creation(self):
+        """Test remaining episodes resolve their items in a constant query count."""
+        season_metadata = {
+            "episodes": [
+                {"episode_number": number, "still_path": f"/ep{number}.jpg"}
+                for number in range(1, 25)
+            ],
+        }
+        # one episode item already exists
+        Item.objects.create(
+            media_id="123",
+            source=Sources.TMDB.value,
+            media_type=MediaTypes.EPISODE.value,
+            title="Test Show",
+            image="http://example.com/image.jpg",
+            season_number=1,
+            episode_number=24,
+        )
+
+        # latest watched, existing items, bulk create, created items
+        with self.assertNumQueries(4):
+            episodes = self.season.get_remaining_eps(season_metadata)
+
+        self.assertEqual(len(episodes), 24)
+        self.assertEqual(
+            [episode.item.episode_number for episode in episodes],
+            list(range(24, 0, -1)),
+        )
+        self.assertEqual(
+            episodes[-1].item.image,
+            "https://image.tmdb.org/t/p/original/ep1.jpg",
+        )
+        self.assertEqual(
+            Item.objects.filter(media_type=MediaTypes.EPISODE.value).count(),
+            24,
+        )
+
     def test_get_tv_creates_tv_if_not_exists(self):
         """Test get_tv creates TV instance if it doesn't exist."""
         # Delete existing TV
@@ -1970,6 +2224,167 @@ class EpisodeStatusTests(TestCase):
         self.assertEqual(self.tv.status, Status.PLANNING.value)
 
 
+    def _create_episode_items(self, episode_numbers):
+        """Create episode items for the test season."""
+        return [
+            Item.objects.create(
+                media_id="123",
+                source=Sources.TMDB.value,
+                media_type=MediaTypes.EPISODE.value,
+                title="Test Episode",
+                image="http://example.com/image.jpg",
+                season_number=1,
+                episode_number=number,
+            )
+            for number in episode_numbers
+        ]
+
+    @patch("app.models.providers.services.get_media_metadata")
+    def test_deferred_updates_coalesce_per_season(self, mock_get_metadata):
+        """Test deferred episode saves update the statuses once per season."""
+        mock_get_metadata.return_value = {
+            "season/1": {
+                "episodes": [{"episode_number": number} for number in range(1, 4)],
+            },
+            "related": {
+                "seasons": [{"season_number": 1}],
+            },
+        }
+        episode_items = [self.episode_item, *self._create_episode_items([2, 3])]
+
+        with (
+            patch(
+                "app.models.bulk_update_with_history",
+                wraps=bulk_update_with_history,
+            ) as mock_bulk_update,
+            self.captureOnCommitCallbacks(execute=True),
+            defer_episode_status_updates(),
+        ):
+            for episode_item in episode_items:
+                Episode.objects.create(
+                    item=episode_item,
+                    related_season=self.season,
+                    end_date=timezone.now(),
+                )
+            # nothing is recomputed until the context exits
+            mock_get_metadata.assert_not_called()
+
+        mock_get_metadata.assert_called_once()
+        # one write for the season and one for the TV show
+        self.assertEqual(mock_bulk_update.call_count, 2)
+        self.season.refresh_from_db()
+        self.assertEqual(self.season.status, Status.COMPLETED.value)
+        self.tv.refresh_from_db()
+        self.assertEqual(self.tv.status, Status.COMPLETED.value)
+
+    @patch("app.models.providers.services.get_media_metadata")
+    def test_deferred_updates_batch_task(self, mock_get_metadata):
+        """Test batch mode applies the updates through the season status task."""
+        mock_get_metadata.return_value = {
+            "season/1": {
+                "episodes": [{"episode_number": number} for number in range(1, 4)],
+            },
+            "related": {
+                "seasons": [{"season_number": 1}, {"season_number": 2}],
+            },
+        }
+        episode_items = [self.episode_item, *self._create_episode_items([2])]
+
+        with (
+            patch("app.statistics.invalidate_statistics") as mock_invalidate,
+            self.captureOnCommitCallbacks(execute=True),
+            defer_episode_status_updates(batch=True),
+        ):
+            for episode_item in episode_items:
+                Episode.objects.create(
+                    item=episode_item,
+                    related_season=self.season,
+                    end_date=timezone.now(),
+                )
+
+        mock_get_metadata.assert_called_once()
+        # dropped on the flush and again once the task wrote the statuses
+        self.assertEqual(
+            mock_invalidate.call_args_list,
+            [call(self.season.user_id), call(self.season.user_id)],
+        )
+        self.season.refresh_from_db()
+        self.assertEqual(self.season.status, Status.IN_PROGRESS.value)
+        self.tv.refresh_from_db()
+        self.assertEqual(self.tv.status, Status.IN_PROGRESS.value)
+
+    @patch("app.models.providers.services.get_media_metadata")
+    def test_watch_stats_follow_episodes(self, mock_get_metadata):
+        """Test the denormalized watch stats follow episode inserts and deletes."""
+        mock_get_metadata.return_value = {
+            "season/1": {
+                "episodes": [{"episode_number": number} for number in range(1, 4)],
+            },
+            "related": {
+                "seasons": [{"season_number": 1}],
+            },
+        }
+        first_date = timezone.now() - timedelta(days=1)
+        last_date = timezone.now()
+
+        Episode.objects.create(
+            item=self.episode_item,
+            related_season=self.season,
+            end_date=first_date,
+        )
+        episode = Episode.objects.create(
+            item=self._create_episode_items([2])[0],
+            related_season=self.season,
+            end_date=last_date,
+        )
+
+        self.season.refresh_from_db()
+        self.assertEqual(self.season.watched_episodes, 2)
+        self.assertEqual(self.season.first_watched_at, first_date)
+        self.assertEqual(self.season.last_watched_at, last_date)
+        self.tv.refresh_from_db()
+        self.assertEqual(self.tv.watched_episodes, 2)
+        self.assertEqual(self.tv.last_watched_at, last_date)
+
+        episode.delete()
+
+        self.season.refresh_from_db()
+        self.assertEqual(self.season.watched_episodes, 1)
+        self.assertEqual(self.season.last_watched_at, first_date)
+        self.tv.refresh_from_db()
+        self.assertEqual(self.tv.watched_episodes, 1)
+
+    def test_tv_list_reads_watch_stats(self):
+        """Test TV lists read the watch columns without loading the episodes."""
+        last_date = timezone.now()
+        Episode.objects.bulk_create(
+            [
+                Episode(
+                    item=self.episode_item,
+                    related_season=self.season,
+                    end_date=last_date - timedelta(days=1),
+                ),
+                Episode(
+                    item=self._create_episode_items([2])[0],
+                    related_season=self.season,
+                    end_date=last_date,
+                ),
+            ],
+        )
+        Season.refresh_watch_stats([self.season.id])
+
+        with self.assertNumQueries(1):
+            tv = MediaManager().get_media_list(
+                self.user,
+                MediaTypes.TV.value,
+                MediaStatusChoices.ALL,
+                "progress",
+            )[0]
+            self.assertEqual(tv.progress, 2)
+            self.assertEqual(tv.end_date, last_date)
+            self.assertEqual(tv.last_watched, "S01E02")
+
+
 class GameModel(TestCase):
     """Test case for the Game model methods."""
 
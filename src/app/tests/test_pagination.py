@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.test import TestCase
+
+from app.models import Item, MediaTypes, Movie, Sources, Status
+from app.pagination import decode_cursor, encode_cursor, keyset_paginate
+
+
+class KeysetPaginationTests(TestCase):
+    """Test the keyset pagination helper."""
+
+    def setUp(self):
+        """Create movies with repeated and missing scores."""
+        self.user = get_user_model().objects.create_user(username="test")
+        movies = []
+        for i in range(7):
+            item = Item.objects.create(
+                media_id=str(i),
+                source=Sources.TMDB.value,
+                media_type=MediaTypes.MOVIE.value,
+                title=f"Movie {i}",
+                image="http://example.com/image.jpg",
+            )
+            movies.append(
+                Movie(
+                    item=item,
+                    user=self.user,
+                    status=Status.COMPLETED.value,
+                    score=None if i % 3 == 0 else i % 2,
+                ),
+            )
+        # bulk_create skips the metadata lookup done by save
+        Movie.objects.bulk_create(movies)
+
+    def _walk(self, queryset, per_page):
+        """Return the ids of every page following the cursors."""
+        seen = []
+        cursor = None
+        while True:
+            page = keyset_paginate(queryset, cursor, per_page)
+            seen.extend(movie.id for movie in page)
+            if not page.has_next():
+                return seen
+            cursor = page.next_cursor
+
+    def test_nulls_first_ordering(self):
+        """Test that null sort values are paginated before the others."""
+        queryset = Movie.objects.order_by(F("score").asc(nulls_first=True))
+
+        expected = list(
+            queryset.order_by(F("score").asc(nulls_first=True), "id").values_list(
+                "id",
+                flat=True,
+            ),
+        )
+        self.assertEqual(self._walk(queryset, per_page=2), expected)
+
+    def test_invalid_cursor_returns_first_page(self):
+        """Test that a tampered cursor falls back to the first page."""
+        queryset = Movie.objects.order_by("-score")
+
+        page = keyset_paginate(queryset, "not-a-cursor", 3)
+
+        self.assertEqual(
+            [movie.id for movie in page],
+            [movie.id for movie in keyset_paginate(queryset, None, 3)],
+        )
+
+    def test_cursor_round_trip(self):
+        """Test that cursors decode to the encoded values."""
+        self.assertEqual(decode_cursor(encode_cursor(["a", None, 3])), ["a", None, 3])
@@ -1,12 +1,16 @@
 import json
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import requests
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 
-from app.models import Episode, Item, MediaTypes, Sources
+from app.mixins import memoize_metadata
+from app.models import Anime, Episode, Item, MediaTypes, Sources, Status
 from app.providers import (
     comicvine,
     hardcover,
@@ -886,6 +890,61 @@ class ServicesTests(TestCase):
         self.assertEqual(kwargs["data"], {"form_data": "value"})
         self.assertIn("timeout", kwargs)
 
+    @patch("app.providers.services.session.get")
+    def test_cached_request_not_modified(self, mock_get):
+        """Test that an unchanged response is revalidated without processing."""
+        cache.delete("test_conditional")
+        cache.delete("test_conditional_validators")
+        process = MagicMock(return_value={"processed": True})
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            headers={"ETag": '"abc"'},
+        )
+        mock_get.return_value.json.return_value = {"data": "test"}
+
+        result = services.cached_request(
+            "TEST",
+            "https://example.com/api",
+            "test_conditional",
+            process=process,
+        )
+        self.assertEqual(result, {"processed": True})
+
+        # the validators only hold the headers, the data is cached once
+        validators = cache.get("test_conditional_validators")
+        self.assertEqual(set(validators), {"etag", "expires"})
+
+        # fresh responses are served from the cache
+        services.cached_request(
+            "TEST",
+            "https://example.com/api",
+            "test_conditional",
+            process=process,
+        )
+        mock_get.assert_called_once()
+
+        # the cache entry went stale and the provider answers 304
+        validators["expires"] = 0
+        cache.set("test_conditional_validators", validators)
+        mock_get.return_value = MagicMock(status_code=304, headers={})
+
+        result = services.cached_request(
+            "TEST",
+            "https://example.com/api",
+            "test_conditional",
+            process=process,
+        )
+
+        self.assertEqual(result, {"processed": True})
+        self.assertEqual(cache.get("test_conditional"), {"processed": True})
+        process.assert_called_once_with({"data": "test"})
+        _, kwargs = mock_get.call_args
+        self.assertEqual(kwargs["headers"], {"If-None-Match": '"abc"'})
+        self.assertGreater(
+            cache.get("test_conditional_validators")["expires"],
+            time.time(),
+        )
+
     @patch("app.providers.services.api_request")
     def test_request_error_handling_rate_limit(self, mock_api_request):
         """Test the request_error_handling function with rate limiting."""
@@ -1468,3 +1527,101 @@ class ServicesTests(TestCase):
 
         # Verify the correct function was called
         mock_search.assert_called_once_with("test", 1)
+
+    @patch("app.providers.tmdb.tv_with_seasons")
+    def test_get_media_metadata_memoized(self, mock_tv_with_seasons):
+        """Test that repeated lookups inside a memo hit the provider once."""
+        mock_tv_with_seasons.return_value = {"title": "Test TV with Seasons"}
+
+        with memoize_metadata() as memo:
+            for _ in range(3):
+                result = services.get_media_metadata(
+                    "tv_with_seasons",
+                    "1",
+                    Sources.TMDB.value,
+                    [1],
+                )
+            services.get_media_metadata(
+                "tv_with_seasons",
+                "1",
+                Sources.TMDB.value,
+                [2],
+            )
+
+        self.assertEqual(result, {"title": "Test TV with Seasons"})
+        self.assertEqual(mock_tv_with_seasons.call_count, 2)
+        self.assertEqual(memo.hits, 2)
+        self.assertEqual(memo.misses, 2)
+
+    @patch("app.providers.tmdb.tv")
+    def test_get_media_metadata_memo_copies(self, mock_tv):
+        """Test that mutating a memoized result doesn't leak into later lookups."""
+        mock_tv.return_value = {"title": "Test TV", "episodes": [1, 2]}
+
+        with memoize_metadata():
+            first = services.get_media_metadata(
+                MediaTypes.TV.value,
+                "1",
+                Sources.TMDB.value,
+            )
+            first["episodes"] = []
+            second = services.get_media_metadata(
+                MediaTypes.TV.value,
+                "1",
+                Sources.TMDB.value,
+            )
+            second["episodes"].append(3)
+            third = services.get_media_metadata(
+                MediaTypes.TV.value,
+                "1",
+                Sources.TMDB.value,
+            )
+
+        self.assertEqual(second["episodes"], [1, 2, 3])
+        self.assertEqual(third["episodes"], [1, 2])
+        mock_tv.assert_called_once_with("1")
+
+    @patch("app.models.Item.fetch_releases")
+    @patch("app.providers.mal.anime")
+    def test_media_save_memoizes_metadata(self, mock_anime, _):
+        """Test that the progress and status checks of a save share a lookup."""
+        mock_anime.return_value = {"max_progress": 26}
+        user = get_user_model().objects.create_user(username="test")
+        item = Item.objects.create(
+            media_id="1",
+            source=Sources.MAL.value,
+            media_type=MediaTypes.ANIME.value,
+            title="Cowboy Bebop",
+        )
+        # bulk_create skips the metadata lookup done by save
+        anime = Anime.objects.bulk_create(
+            [Anime(item=item, user=user, status=Status.PLANNING.value)],
+        )[0]
+
+        anime.status = Status.COMPLETED.value
+        anime.progress = 26
+        anime.save()
+
+        mock_anime.assert_called_once_with("1")
+
+    @patch("app.providers.tmdb.tv")
+    def test_get_media_metadata_nested_memo(self, mock_tv):
+        """Test that nested memo contexts share the outermost memo."""
+        mock_tv.return_value = {"title": "Test TV"}
+
+        with memoize_metadata() as outer:
+            services.get_media_metadata(MediaTypes.TV.value, "1", Sources.TMDB.value)
+            with memoize_metadata() as inner:
+                services.get_media_metadata(
+                    MediaTypes.TV.value,
+                    "1",
+                    Sources.TMDB.value,
+                )
+
+        self.assertIs(inner, outer)
+        self.assertEqual(outer.hits, 1)
+        mock_tv.assert_called_once_with("1")
+
+        # no memo outside the context
+        services.get_media_metadata(MediaTypes.TV.value, "1", Sources.TMDB.value)
+        self.assertEqual(mock_tv.call_count, 2)
@@ -3,8 +3,10 @@ from unittest.mock import MagicMock, patch
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
 
 from app import statistics
+from app.mixins import defer_episode_status_updates
 from app.models import (
     TV,
     Anime,
@@ -960,3 +962,121 @@ class StatisticsTests(TestCase):
         )
         self.assertEqual(current_streak, 0)
         self.assertEqual(longest_streak, 0)
+
+
+class StatisticsSnapshotTests(TestCase):
+    """Test the cached statistics snapshots."""
+
+    def setUp(self):
+        """Create a user with a movie."""
+        self.user = get_user_model().objects.create_user(username="test")
+        item = Item.objects.create(
+            media_id="238",
+            source=Sources.TMDB.value,
+            media_type=MediaTypes.MOVIE.value,
+            title="Test Movie",
+        )
+        # bulk_create skips the metadata lookup done by save
+        self.movie = Movie.objects.bulk_create(
+            [
+                Movie(
+                    item=item,
+                    user=self.user,
+                    status=Status.PLANNING.value,
+                    score=7,
+                ),
+            ],
+        )[0]
+
+    def test_snapshot_reused(self):
+        """Test that the statistics are only computed once."""
+        first = statistics.get_statistics(self.user, None, None)
+
+        with self.assertNumQueries(0):
+            second = statistics.get_statistics(self.user, None, None)
+
+        self.assertEqual(first["media_count"], second["media_count"])
+        self.assertEqual(first["score_distribution"]["average_score"], 7)
+
+    def test_snapshot_invalidated_on_media_change(self):
+        """Test that deleting a media drops the snapshots of its user."""
+        statistics.get_statistics(self.user, None, None)
+
+        self.movie.delete()
+
+        snapshot = statistics.get_statistics(self.user, None, None)
+        self.assertEqual(snapshot["media_count"]["total"], 0)
+        self.assertIsNone(snapshot["score_distribution"]["average_score"])
+
+    @patch("app.statistics.invalidate_statistics")
+    def test_snapshot_kept_on_unrelated_user_update(self, mock_invalidate):
+        """Test that only the enabled media types invalidate on user saves."""
+        self.user.last_login = timezone.now()
+        self.user.save(update_fields=["last_login"])
+        self.user.update_preference("last_search_type", MediaTypes.MOVIE.value)
+        mock_invalidate.assert_not_called()
+
+        self.user.movie_enabled = False
+        self.user.save(update_fields=["movie_enabled"])
+        mock_invalidate.assert_called_once_with(self.user.id)
+
+    @patch("app.models.Season.update_status_from_episodes")
+    @patch("app.statistics.invalidate_statistics")
+    def test_snapshot_invalidated_once_per_deferred_flush(
+        self,
+        mock_invalidate,
+        mock_update_status,
+    ):
+        """Test that deferred episode saves drop the snapshots once."""
+        tv_item = Item.objects.create(
+            media_id="1668",
+            source=Sources.TMDB.value,
+            media_type=MediaTypes.TV.value,
+            title="Friends",
+        )
+        tv = TV.objects.bulk_create(
+            [TV(item=tv_item, user=self.user, status=Status.PLANNING.value)],
+        )[0]
+        season_item = Item.objects.create(
+            media_id="1668",
+            source=Sources.TMDB.value,
+            media_type=MediaTypes.SEASON.value,
+            title="Friends",
+            season_number=1,
+        )
+        season = Season.objects.bulk_create(
+            [
+                Season(
+                    item=season_item,
+                    related_tv=tv,
+                    user=self.user,
+                    status=Status.PLANNING.value,
+                ),
+            ],
+        )[0]
+        episode_items = [
+            Item.objects.create(
+                media_id="1668",
+                source=Sources.TMDB.value,
+                media_type=MediaTypes.EPISODE.value,
+                title="Friends",
+                season_number=1,
+                episode_number=number,
+            )
+            for number in range(1, 4)
+        ]
+
+        with (
+            self.captureOnCommitCallbacks(execute=True),
+            defer_episode_status_updates(),
+        ):
+            for episode_item in episode_items:
+                Episode.objects.create(
+                    item=episode_item,
+                    related_season_id=season.id,
+                    end_date=timezone.now(),
+                )
+            mock_invalidate.assert_not_called()
+
+        mock_invalidate.assert_called_once_with(self.user.id)
+        mock_update_status.assert_called_once_with([1, 2, 3])
@@ -3,6 +3,8 @@ from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Lower
 from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
@@ -228,7 +230,7 @@ class MediaListViewTests(TestCase):
 
         # Check that media items are in the context
         self.assertIn("media_list", response.context)
-        self.assertEqual(response.context["media_list"].paginator.count, 5)
+        self.assertEqual(len(response.context["media_list"]), 5)
 
         # Check that filter options are in the context
         self.assertIn("sort_choices", response.context)
@@ -257,7 +259,7 @@ class MediaListViewTests(TestCase):
         self.assertEqual(response.context["current_layout"], "table")
 
         # Check that only completed items are shown
-        self.assertEqual(response.context["media_list"].paginator.count, 2)
+        self.assertEqual(len(response.context["media_list"]), 2)
 
         # Check that user preferences were updated
         self.user.refresh_from_db()
@@ -265,6 +267,50 @@ class MediaListViewTests(TestCase):
         self.assertEqual(self.user.movie_sort, "score")
         self.assertEqual(self.user.movie_layout, "table")
 
+    def test_media_list_cursor_pagination(self):
+        """Test the infinite scroll pages follow each other without gaps."""
+        for i in range(40):
+            item = Item.objects.create(
+                media_id=str(1000 + i),
+                source=Sources.TMDB.value,
+                media_type=MediaTypes.MOVIE.value,
+                title=f"Extra Movie {i}",
+                image="http://example.com/image.jpg",
+            )
+            # repeated and missing scores exercise the tiebreakers
+            Movie.objects.create(
+                item=item,
+                user=self.user,
+                status=Status.COMPLETED.value,
+                score=None if i % 4 == 0 else i % 3,
+            )
+
+        url = reverse("medialist", args=[MediaTypes.MOVIE.value]) + "?sort=score"
+        response = self.client.get(url)
+        media_page = response.context["media_list"]
+        self.assertEqual(len(media_page), 32)
+        self.assertTrue(media_page.has_next())
+
+        seen = [media.id for media in media_page]
+        while media_page.has_next():
+            response = self.client.get(
+                f"{url}&cursor={media_page.next_cursor}",
+                HTTP_HX_REQUEST="true",
+            )
+            media_page = response.context["media_list"]
+            seen.extend(media.id for media in media_page)
+
+        expected = list(
+            Movie.objects.filter(user=self.user)
+            .order_by(
+                F("score").desc(nulls_last=True),
+                Lower("item__title"),
+                "id",
+            )
+            .values_list("id", flat=True),
+        )
+        self.assertEqual(seen, expected)
+
     def test_media_list_htmx_request(self):
         """Test the media list view with HTMX request."""
         headers = {"HTTP_HX_REQUEST": "true"}
@@ -1,10 +1,8 @@
 import logging
 
 from django.apps import apps
-from django.conf import settings
 from django.contrib import messages
 from django.core.cache import cache
-from django.core.paginator import Paginator
 from django.db import IntegrityError
 from django.db.models import prefetch_related_objects
 from django.http import HttpResponse, HttpResponseBadRequest, JsonResponse
@@ -19,6 +17,7 @@ from app import helpers, history_processor
 from app import statistics as stats
 from app.forms import EpisodeForm, ManualItemForm, get_form_class
 from app.models import TV, BasicMedia, Item, MediaTypes, Season, Sources, Status
+from app.pagination import keyset_paginate
 from app.providers import manual, services, tmdb
 from app.templatetags import app_tags
 from users.models import HomeSortChoices, MediaSortChoices, MediaStatusChoices
@@ -103,7 +102,7 @@ def media_list(request, media_type):
         request.GET.get("status"),
     )
     search_query = request.GET.get("search", "")
-    page = request.GET.get("page", 1)
+    cursor = request.GET.get("cursor")
 
     # Prepare status filter for database query
     if not status_filter:
@@ -118,10 +117,9 @@ def media_list(request, media_type):
         search=search_query,
     )
 
-    # Paginate results
+    # Paginate results, infinite scroll continues after the cursor
     items_per_page = 32
-    paginator = Paginator(media_queryset, items_per_page)
-    media_page = paginator.get_page(page)
+    media_page = keyset_paginate(media_queryset, cursor, items_per_page)
 
     BasicMedia.objects.annotate_max_progress(
         media_page.object_list,
@@ -292,7 +290,8 @@ def sync_metadata(request, source, media_type, media_id, season_number=None):
     ttl = cache.ttl(cache_key)
     logger.debug("%s - Cache TTL for: %s", cache_key, ttl)
 
-    if ttl is not None and ttl > (settings.CACHE_TIMEOUT - 3):
+    timeout = services.get_cache_timeout(cache_key)
+    if ttl is not None and ttl > (timeout - 3):
         msg = "The data was recently synced, please wait a few seconds."
         messages.error(request, msg)
         logger.error(msg)
@@ -717,10 +716,13 @@ def history_modal(
         episode_number=episode_number,
     )
 
-    total_medias = user_medias.count()
+    user_medias = list(user_medias)
+    history_by_media = history_processor.get_media_history(user_medias)
+
+    total_medias = len(user_medias)
     timeline_entries = []
     for index, media in enumerate(user_medias, start=1):
-        if history := media.history.all():
+        if history := history_by_media.get(media.id):
             media_entry_number = total_medias - index + 1
             timeline_entries.extend(
                 history_processor.process_history_entries(
@@ -754,6 +756,7 @@ def delete_history_record(request, media_type, history_id):
             history_id=history_id,
             history_user=request.user,
         ).delete()
+        stats.invalidate_statistics(request.user.id)
 
         logger.info(
             "Deleted history record %s",
@@ -802,37 +805,10 @@ def statistics(request):
                 datetime.combine(end_date, datetime.max.time()),
             )
 
-    # Get all user media data in a single operation
-    user_media, media_count = stats.get_user_media(
-        request.user,
-        start_date,
-        end_date,
-    )
-
-    # Calculate all statistics from the retrieved data
-    media_type_distribution = stats.get_media_type_distribution(
-        media_count,
-    )
-    score_distribution, top_rated = stats.get_score_distribution(user_media)
-    status_distribution = stats.get_status_distribution(user_media)
-    status_pie_chart_data = stats.get_status_pie_chart_data(
-        status_distribution,
-    )
-    timeline = stats.get_timeline(user_media)
-
-    activity_data = stats.get_activity_data(request.user, start_date, end_date)
-
     context = {
         "start_date": start_date,
         "end_date": end_date,
-        "media_count": media_count,
-        "activity_data": activity_data,
-        "media_type_distribution": media_type_distribution,
-        "score_distribution": score_distribution,
-        "top_rated": top_rated,
-        "status_distribution": status_distribution,
-        "status_pie_chart_data": status_pie_chart_data,
-        "timeline": timeline,
+        **stats.get_statistics(request.user, start_date, end_date),
     }
 
     return render(request, "app/statistics.html", context)
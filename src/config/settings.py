@@ -139,6 +139,7 @@ MIDDLEWARE = [
     "simple_history.middleware.HistoryRequestMiddleware",
     "allauth.account.middleware.AccountMiddleware",
     "app.middleware.ProviderAPIErrorMiddleware",
+    "app.middleware.MetadataMemoMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -213,12 +214,34 @@ CACHE_TIMEOUT = 86400  # 24 hours
 REDIS_URL = config("REDIS_URL", default="redis://localhost:6379")
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "app.cache.TwoTierRedisCache",
         "LOCATION": REDIS_URL,
         "TIMEOUT": CACHE_TIMEOUT,
         "VERSION": 10,
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # per-process LRU in front of Redis for repeated metadata lookups
+            "LOCAL_CACHE_MAX_ENTRIES": config(
+                "LOCAL_CACHE_MAX_ENTRIES",
+                default=1000,
+                cast=int,
+            ),
+            "LOCAL_CACHE_TIMEOUT": config("LOCAL_CACHE_TIMEOUT", default=300, cast=int),
+            # only provider metadata is kept locally, keys coordinating workers
+            # like the IGDB access token are always read from Redis
+            "LOCAL_CACHE_KEY_PREFIXES": (
+                "tmdb_",
+                "mal_",
+                "mangaupdates_",
+                "igdb_game_",
+                "openlibrary_",
+                "hardcover_",
+                "comicvine_",
+                "search_",
+                "find_",
+                "external_game_",
+                "tvmaze_map_",
+            ),
         },
     },
 }
@@ -324,6 +347,33 @@ IMG_NONE = "https://www.themoviedb.org/assets/2/v4/glyphicons/basic/glyphicons-b
 REQUEST_TIMEOUT = 120  # seconds
 PER_PAGE = 24
 
+# threads fetching provider metadata concurrently during calendar reloads
+CALENDAR_FETCH_WORKERS = config("CALENDAR_FETCH_WORKERS", default=8, cast=int)
+# threads fetching provider metadata concurrently during Trakt imports
+IMPORT_FETCH_WORKERS = config("IMPORT_FETCH_WORKERS", default=8, cast=int)
+# rows of CSV imports processed before their media are created
+IMPORT_BATCH_SIZE = config("IMPORT_BATCH_SIZE", default=1000, cast=int)
+# without history, imports record an ImportSummary instead of a historical
+# record per imported media
+IMPORT_HISTORY = config("IMPORT_HISTORY", default=True, cast=bool)
+# seconds a statistics snapshot is kept, they are dropped on media changes
+STATISTICS_CACHE_TIMEOUT = config(
+    "STATISTICS_CACHE_TIMEOUT",
+    default=CACHE_TIMEOUT,
+    cast=int,
+)
+# items reloaded by each calendar subtask, chunks can run on separate workers
+CALENDAR_RELOAD_CHUNK_SIZE = config(
+    "CALENDAR_RELOAD_CHUNK_SIZE",
+    default=200,
+    cast=int,
+)
+
+# answer webhooks with 202 and process their payloads in a Celery task
+WEBHOOK_QUEUE = config("WEBHOOK_QUEUE", default=False, cast=bool)
+# seconds during which repeated events for the same playback are dropped
+WEBHOOK_DEDUPE_WINDOW = config("WEBHOOK_DEDUPE_WINDOW", default=30, cast=int)
+
 TMDB_API = config(
     "TMDB_API",
     default=secret(
@@ -4,17 +4,28 @@ from .settings import *  # noqa: F403
 
 CACHES = {
     "default": {
-        "BACKEND": "django_redis.cache.RedisCache",
+        "BACKEND": "app.cache.TwoTierRedisCache",
         "LOCATION": REDIS_URL,  # noqa: F405
         "TIMEOUT": 18000,  # 5 hours
         "OPTIONS": {
             "CONNECTION_POOL_KWARGS": {"connection_class": FakeConnection},
+            "LOCAL_CACHE_PUBSUB": False,
+            "LOCAL_CACHE_KEY_PREFIXES": CACHES["default"]["OPTIONS"][  # noqa: F405
+                "LOCAL_CACHE_KEY_PREFIXES"
+            ],
         },
     },
 }
 
 CELERY_TASK_ALWAYS_EAGER = True
 
+# fetch sequentially so tests only see the provider calls they patch
+CALENDAR_FETCH_WORKERS = 1
+IMPORT_FETCH_WORKERS = 1
+
+# webhook tests repeat payloads, the dedupe window is tested on its own
+WEBHOOK_DEDUPE_WINDOW = 0
+
 TESTING = True
 
 # Steam API key for testing
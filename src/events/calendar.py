@@ -1,9 +1,13 @@
 import logging
-from datetime import datetime
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime, timedelta
 from zoneinfo import ZoneInfo
 
 import requests
+from django.conf import settings
 from django.core.cache import cache
+from django.db import connections
 from django.db.models import Exists, OuterRef, Q, Subquery
 from django.utils import timezone
 
@@ -14,6 +18,12 @@ from events.models import Event, SentinelDatetime
 
 logger = logging.getLogger(__name__)
 
+# how long the scheduled reload waits before fetching an item's releases again
+REFRESH_INTERVAL = timedelta(days=7)
+RELEASED_REFRESH_INTERVAL = timedelta(days=30)
+# single releases that came out, like finished anime, are not fetched again
+NEVER_REFRESH = datetime(SentinelDatetime.YEAR, 1, 1, tzinfo=UTC)
+
 
 def fetch_releases(user=None, items_to_process=None):
     """Fetch and process releases for the calendar."""
@@ -24,15 +34,88 @@ def fetch_releases(user=None, items_to_process=None):
     if not items_to_process:
         return "No items to process"
 
-    events_bulk = process_items(items_to_process)
+    items_updated = reload_items(items_to_process)
+
+    return generate_final_message(items_to_process, items_updated)
+
+
+def reload_items(items):
+    """Fetch and save the releases of the items, return the updated ones."""
+    events_bulk = process_items(items)
     items_updated = save_events(events_bulk)
     cleanup_invalid_events(events_bulk)
+    schedule_refreshes(items)
 
-    return generate_final_message(items_to_process, items_updated)
+    return items_updated
+
+
+def schedule_refreshes(items):
+    """Store when the scheduled reload should fetch each item again.
+
+    The schedule follows the saved events, TV shows use the events of their
+    seasons.
+    """
+    items = list(items)
+    if not items:
+        return
+
+    tv_keys = {
+        (item.source, item.media_id)
+        for item in items
+        if item.media_type == MediaTypes.TV.value
+    }
+    events = Event.objects.filter(
+        Q(item__in=items)
+        | Q(
+            item__media_type=MediaTypes.SEASON.value,
+            item__media_id__in={media_id for _, media_id in tv_keys},
+        ),
+    ).values_list("item_id", "item__source", "item__media_id", "datetime")
+
+    datetimes = defaultdict(list)
+    for item_id, source, media_id, event_datetime in events:
+        datetimes[item_id].append(event_datetime)
+        if (source, media_id) in tv_keys:
+            datetimes[(source, media_id)].append(event_datetime)
+
+    now = timezone.now()
+    for item in items:
+        key = (
+            (item.source, item.media_id)
+            if item.media_type == MediaTypes.TV.value
+            else item.id
+        )
+        item.next_refresh = get_next_refresh(item, datetimes[key], now)
+
+    Item.objects.bulk_update(items, ["next_refresh"], batch_size=500)
+
+
+def get_next_refresh(item, event_datetimes, now):
+    """Return when the releases of an item should be fetched again.
+
+    Airing media are fetched the day after their next release, when the
+    following one is usually announced, and at least weekly.
+    """
+    unknown_datetime = datetime.min.replace(tzinfo=ZoneInfo("UTC"))
+    dated = [dt for dt in event_datetimes if dt != unknown_datetime]
+    upcoming = [dt for dt in dated if dt > now]
+
+    if upcoming:
+        return min(min(upcoming) + timedelta(days=1), now + REFRESH_INTERVAL)
+
+    if not dated or item.media_type == MediaTypes.COMIC.value:
+        return now + REFRESH_INTERVAL
+
+    if item.media_type in (MediaTypes.ANIME.value, MediaTypes.MOVIE.value):
+        return NEVER_REFRESH
+
+    return now + RELEASED_REFRESH_INTERVAL
 
 
 def process_items(items_to_process):
     """Process items and categorize them."""
+    prefetch_metadata(items_to_process)
+
     events_bulk = []
     anime_to_process = []
 
@@ -50,6 +133,74 @@ def process_items(items_to_process):
     return events_bulk
 
 
+def prefetch_metadata(items):
+    """Fetch the provider metadata of the items concurrently.
+
+    The providers cache their responses, so the sequential processing that
+    follows reads them from the cache and database writes stay in a single
+    thread. The worker threads share the provider session, so the per-host
+    LimiterAdapter budgets still apply. Anime are fetched in bulk from AniList
+    and don't need a prefetch.
+    """
+    workers = settings.CALENDAR_FETCH_WORKERS
+    items = [item for item in items if item.media_type != MediaTypes.ANIME.value]
+    if workers <= 1 or len(items) <= 1:
+        return
+
+    seasons_with_events = get_seasons_with_events(
+        [item for item in items if item.media_type == MediaTypes.TV.value],
+    )
+
+    with ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix="calendar-fetch",
+    ) as executor:
+        futures = {
+            executor.submit(
+                prefetch_item_metadata,
+                item,
+                seasons_with_events.get((item.media_id, item.source), set()),
+            ): item
+            for item in items
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception:  # noqa: BLE001
+                # processing the item will retry and report the error
+                logger.info("Failed to prefetch metadata for %s", futures[future])
+
+    logger.info("Prefetched metadata for %d items", len(items))
+
+
+def prefetch_item_metadata(item, seasons_with_events):
+    """Fetch the metadata process_items will need for an item."""
+    try:
+        if item.media_type == MediaTypes.TV.value:
+            tv_metadata = tmdb.tv(item.media_id)
+            season_numbers = select_seasons_to_process(
+                tv_metadata,
+                seasons_with_events,
+            )
+            if not season_numbers:
+                return
+
+            seasons_data = tmdb.tv_with_seasons(item.media_id, season_numbers)
+            for season_number in season_numbers:
+                season_metadata = seasons_data.get(f"season/{season_number}", {})
+                if season_metadata.get("tvdb_id"):
+                    get_tvmaze_episode_map(season_metadata["tvdb_id"])
+        else:
+            services.get_media_metadata(
+                item.media_type,
+                item.media_id,
+                item.source,
+            )
+    finally:
+        # the worker threads have their own database connections
+        connections.close_all()
+
+
 def save_events(events_bulk):
     """Save events in bulk with proper conflict handling."""
     items_updated = set()
@@ -191,6 +342,10 @@ def get_items_to_process(user=None):
     # Exclude manual sources
     query &= ~Q(source=Sources.MANUAL.value)
 
+    # the scheduled reload of all users skips items that aren't due yet
+    if not user:
+        query &= Q(next_refresh__isnull=True) | Q(next_refresh__lte=timezone.now())
+
     items = Item.objects.filter(query).distinct()
 
     return filter_items_to_fetch(items)
@@ -430,26 +585,51 @@ def get_seasons_to_process(tv_item):
         logger.warning("No seasons found for TV show: %s", tv_item)
         return []
 
-    # Get all season numbers
-    season_numbers = [
-        season["season_number"] for season in tv_metadata["related"]["seasons"]
-    ]
+    seasons_with_events = get_seasons_with_events([tv_item]).get(
+        (tv_item.media_id, tv_item.source),
+        set(),
+    )
+    seasons_to_process = select_seasons_to_process(tv_metadata, seasons_with_events)
 
-    if not season_numbers:
-        logger.warning("No valid seasons found for TV show: %s", tv_item)
+    if not seasons_to_process:
         return []
 
-    next_episode_season = tv_metadata.get("next_episode_season")
+    logger.info(
+        "%s - Processing %d seasons (Next episode season: %s)",
+        tv_item,
+        len(seasons_to_process),
+        tv_metadata.get("next_episode_season"),
+    )
+
+    return seasons_to_process
+
+
+def get_seasons_with_events(tv_items):
+    """Return the season numbers with events, keyed by (media_id, source)."""
+    if not tv_items:
+        return {}
+
+    seasons_with_events = {}
+    for media_id, source, season_number in (
+        Event.objects.filter(
+            item__media_id__in={tv_item.media_id for tv_item in tv_items},
+            item__media_type=MediaTypes.SEASON.value,
+        )
+        .values_list("item__media_id", "item__source", "item__season_number")
+        .distinct()
+    ):
+        seasons_with_events.setdefault((media_id, source), set()).add(season_number)
+
+    return seasons_with_events
 
-    # Get existing events for this TV show's seasons
-    existing_season_events = Event.objects.filter(
-        item__media_id=tv_item.media_id,
-        item__source=tv_item.source,
-        item__media_type=MediaTypes.SEASON.value,
-    ).select_related("item")
 
-    # Create a set of seasons that already have events
-    seasons_with_events = {event.item.season_number for event in existing_season_events}
+def select_seasons_to_process(tv_metadata, seasons_with_events):
+    """Return the seasons without events and the currently airing ones."""
+    season_numbers = [
+        season["season_number"]
+        for season in tv_metadata.get("related", {}).get("seasons", [])
+    ]
+    next_episode_season = tv_metadata.get("next_episode_season")
 
     seasons_to_process = []
 
@@ -461,16 +641,6 @@ def get_seasons_to_process(tv_item):
             # Current or future season, process it
             seasons_to_process.append(season_num)
 
-    if not seasons_to_process:
-        return []
-
-    logger.info(
-        "%s - Processing %d seasons (Next episode season: %s)",
-        tv_item,
-        len(seasons_to_process),
-        next_episode_season,
-    )
-
     return seasons_to_process
 
 
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.11 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0013_delete_single_anime_events'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['item', 'datetime'], name='event_item_datetime_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.11 on 2026-10-17 08:21
+
+import django.db.models.deletion
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+def remove_duplicate_checkpoints(apps, schema_editor):
+    """Keep the latest checkpoint of each reload scope."""
+    ReloadCheckpoint = apps.get_model("events", "ReloadCheckpoint")
+
+    seen = set()
+    for checkpoint in ReloadCheckpoint.objects.order_by("-updated_at", "-id"):
+        if checkpoint.user_id in seen:
+            checkpoint.delete()
+        else:
+            seen.add(checkpoint.user_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0015_reloadcheckpoint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_checkpoints,
+            reverse_code=migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name='reloadcheckpoint',
+            name='user',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name='reloadcheckpoint',
+            constraint=models.UniqueConstraint(django.db.models.functions.comparison.Coalesce('user', models.Value(0)), condition=models.Q(('user__isnull', True)), name='unique_reload_checkpoint_all_users'),
+        ),
+    ]
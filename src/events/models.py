@@ -1,6 +1,7 @@
 from datetime import UTC, datetime
 
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
 from django.db.models import (
     Case,
     IntegerField,
@@ -12,6 +13,7 @@ from django.db.models import (
     Value,
     When,
 )
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from app import media_type_config
@@ -196,6 +198,11 @@ class Event(models.Model):
                 name="unique_item_null_content_number",
             ),
         ]
+        indexes = [
+            # next/released event lookups, (item, content_number) is covered
+            # by the unique constraint
+            models.Index(fields=["item", "datetime"], name="event_item_datetime_idx"),
+        ]
 
     def __str__(self):
         """Return event title."""
@@ -250,3 +257,66 @@ class Event(models.Model):
 
         localized_value = timezone.localtime(self.datetime)
         return f"at {localized_value.strftime('%H:%M')}"
+
+
+class ReloadCheckpoint(models.Model):
+    """Progress of a chunked calendar reload.
+
+    Items are reloaded in chunks ordered by id. last_item_id is the end of the
+    longest run of completed chunks, so a restarted reload resumes after it.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    last_item_id = models.PositiveBigIntegerField(default=0)
+    chunk_ends = models.JSONField(default=list)
+    completed_chunk_ends = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Meta class for ReloadCheckpoint model."""
+
+        constraints = [
+            # user is unique, but NULLs are distinct so the reload for all
+            # users needs its own constraint
+            UniqueConstraint(
+                Coalesce("user", Value(0)),
+                condition=Q(user__isnull=True),
+                name="unique_reload_checkpoint_all_users",
+            ),
+        ]
+
+    def __str__(self):
+        """Return the scope and progress of the reload."""
+        scope = self.user or "all users"
+        return f"Calendar reload for {scope} after item {self.last_item_id}"
+
+    @classmethod
+    def complete_chunk(cls, checkpoint_id, chunk_end):
+        """Mark the chunk ending at the item id as completed.
+
+        Chunks finish in any order when processed in parallel, the row lock
+        keeps concurrent updates from overwriting each other.
+        """
+        with transaction.atomic():
+            checkpoint = (
+                cls.objects.select_for_update().filter(id=checkpoint_id).first()
+            )
+            if checkpoint is None:
+                return None
+
+            if chunk_end not in checkpoint.completed_chunk_ends:
+                checkpoint.completed_chunk_ends.append(chunk_end)
+
+            for end in sorted(checkpoint.chunk_ends):
+                if end not in checkpoint.completed_chunk_ends:
+                    break
+                checkpoint.last_item_id = end
+
+            checkpoint.save()
+            return checkpoint
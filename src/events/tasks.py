@@ -1,25 +1,112 @@
 import logging
+from datetime import timedelta
 
-from celery import shared_task
+from celery import chord, shared_task
+from django.conf import settings
+from django.utils import timezone
 
+from app.models import Item
 from events import calendar, notifications
+from events.models import ReloadCheckpoint
 
 logger = logging.getLogger(__name__)
 
 
 @shared_task(name="Reload calendar")
 def reload_calendar(user=None, items_to_process=None):
-    """Refresh the calendar with latest dates for all users."""
+    """Refresh the calendar with latest dates for all users.
+
+    Specific items are reloaded in place. Otherwise the items are split in
+    chunks processed by separate subtasks, with a checkpoint so an interrupted
+    reload resumes after the last completed chunk.
+    """
+    if items_to_process:
+        return calendar.fetch_releases(
+            user=user,
+            items_to_process=items_to_process,
+        )
+
     if user:
         logger.info("Reloading calendar for user: %s", user.username)
     else:
         logger.info("Reloading calendar for all users")
 
-    return calendar.fetch_releases(
-        user=user,
-        items_to_process=items_to_process,
+    checkpoint, created = ReloadCheckpoint.objects.get_or_create(user=user)
+    if not created:
+        # chunks keep touching the checkpoint while the reload is running
+        stale_before = timezone.now() - timedelta(
+            seconds=settings.CELERY_TASK_TIME_LIMIT,
+        )
+        if checkpoint.updated_at > stale_before:
+            return "Calendar reload already in progress"
+        logger.info("Resuming calendar reload after item %s", checkpoint.last_item_id)
+
+    item_ids = list(
+        calendar.get_items_to_process(user)
+        .filter(id__gt=checkpoint.last_item_id)
+        .order_by("id")
+        .values_list("id", flat=True),
+    )
+    if not item_ids:
+        checkpoint.delete()
+        return "No items to process"
+
+    size = settings.CALENDAR_RELOAD_CHUNK_SIZE
+    chunks = [item_ids[i : i + size] for i in range(0, len(item_ids), size)]
+    checkpoint.chunk_ends = [chunk[-1] for chunk in chunks]
+    checkpoint.completed_chunk_ends = []
+    checkpoint.save()
+
+    # the callback doesn't run when a chunk fails, release the checkpoint then
+    callback = finish_calendar_reload.s(checkpoint.id)
+    callback.link_error(abort_calendar_reload.si(checkpoint.id))
+    chord(reload_calendar_chunk.s(checkpoint.id, chunk) for chunk in chunks)(
+        callback,
     )
 
+    return f"Reloading {len(item_ids)} items in {len(chunks)} chunks"
+
+
+@shared_task(name="Reload calendar chunk")
+def reload_calendar_chunk(checkpoint_id, item_ids):
+    """Reload the releases of a chunk of items and record its completion."""
+    items = list(Item.objects.filter(id__in=item_ids).order_by("id"))
+
+    items_updated = calendar.reload_items(items)
+
+    ReloadCheckpoint.complete_chunk(checkpoint_id, item_ids[-1])
+    logger.info(
+        "Reloaded calendar chunk ending at item %s, %s items updated",
+        item_ids[-1],
+        len(items_updated),
+    )
+    return {"processed": len(items), "updated": len(items_updated)}
+
+
+@shared_task(name="Finish calendar reload")
+def finish_calendar_reload(results, checkpoint_id):
+    """Clear the checkpoint once every chunk has completed."""
+    ReloadCheckpoint.objects.filter(id=checkpoint_id).delete()
+
+    processed = sum(result["processed"] for result in results)
+    updated = sum(result["updated"] for result in results)
+    return (
+        f"Processed {processed} items in {len(results)} chunks.\n"
+        f"Releases updated for {updated} items."
+    )
+
+
+@shared_task(name="Abort calendar reload")
+def abort_calendar_reload(checkpoint_id):
+    """Mark the checkpoint as stale after a chunk failed.
+
+    The next reload resumes after the last completed chunk instead of waiting
+    for the checkpoint to go stale.
+    """
+    stale_at = timezone.now() - timedelta(seconds=settings.CELERY_TASK_TIME_LIMIT)
+    ReloadCheckpoint.objects.filter(id=checkpoint_id).update(updated_at=stale_at)
+    logger.warning("Calendar reload failed, released checkpoint %s", checkpoint_id)
+
 
 @shared_task(name="Send release notifications")
 def send_release_notifications():
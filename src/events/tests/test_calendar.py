@@ -2,9 +2,11 @@ import datetime
 from unittest.mock import MagicMock, patch
 from zoneinfo import ZoneInfo
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
-from django.test import TestCase
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
 from django.utils import timezone
 
 from app.models import (
@@ -22,18 +24,22 @@ from app.models import (
 )
 from app.providers import services
 from events.calendar import (
+    NEVER_REFRESH,
     anilist_date_parser,
     date_parser,
     fetch_releases,
     get_anime_schedule_bulk,
     get_items_to_process,
+    get_next_refresh,
     get_tvmaze_episode_map,
+    prefetch_metadata,
     process_anime_bulk,
     process_comic,
     process_other,
     process_tv,
 )
-from events.models import Event
+from events.models import Event, ReloadCheckpoint
+from events.tasks import abort_calendar_reload, reload_calendar
 
 
 class ReloadCalendarTaskTests(TestCase):
@@ -245,6 +251,120 @@ class ReloadCalendarTaskTests(TestCase):
         self.assertNotIn("Breaking Bad", result)
         self.assertNotIn("Berserk", result)
 
+    def _process_items(self, items):
+        """Return one event for each item."""
+        return [
+            Event(item=item, content_number=1, datetime=timezone.now())
+            for item in items
+        ]
+
+    @override_settings(CALENDAR_RELOAD_CHUNK_SIZE=2)
+    @patch("events.calendar.process_items")
+    def test_reload_calendar_chunks(self, mock_process_items):
+        """Test that the reload processes every item in chunks."""
+        mock_process_items.side_effect = self._process_items
+        expected_ids = sorted(
+            get_items_to_process(self.user).values_list("id", flat=True),
+        )
+
+        reload_calendar(self.user)
+
+        chunks = [
+            [item.id for item in call.args[0]]
+            for call in mock_process_items.call_args_list
+        ]
+        self.assertTrue(all(len(chunk) <= 2 for chunk in chunks))  # noqa: PLR2004
+        self.assertEqual(
+            [item_id for chunk in chunks for item_id in chunk],
+            expected_ids,
+        )
+        self.assertEqual(
+            set(Event.objects.values_list("item_id", flat=True)),
+            set(expected_ids),
+        )
+        # the checkpoint is cleared once every chunk completed
+        self.assertFalse(ReloadCheckpoint.objects.exists())
+        self.assertFalse(
+            Item.objects.filter(id__in=expected_ids, next_refresh=None).exists(),
+        )
+
+    @override_settings(CALENDAR_RELOAD_CHUNK_SIZE=2)
+    @patch("events.calendar.process_items")
+    def test_reload_calendar_resumes(self, mock_process_items):
+        """Test that an interrupted reload resumes after the checkpoint."""
+        mock_process_items.side_effect = self._process_items
+        item_ids = sorted(get_items_to_process(self.user).values_list("id", flat=True))
+        checkpoint = ReloadCheckpoint.objects.create(
+            user=self.user,
+            last_item_id=item_ids[1],
+        )
+        ReloadCheckpoint.objects.filter(id=checkpoint.id).update(
+            updated_at=timezone.now() - datetime.timedelta(days=1),
+        )
+
+        reload_calendar(self.user)
+
+        processed = [
+            item.id
+            for call in mock_process_items.call_args_list
+            for item in call.args[0]
+        ]
+        self.assertEqual(processed, item_ids[2:])
+        self.assertFalse(ReloadCheckpoint.objects.exists())
+
+    @patch("events.calendar.process_items")
+    def test_reload_calendar_in_progress(self, mock_process_items):
+        """Test that a running reload isn't started twice."""
+        ReloadCheckpoint.objects.create(user=self.user)
+
+        result = reload_calendar(self.user)
+
+        self.assertEqual(result, "Calendar reload already in progress")
+        mock_process_items.assert_not_called()
+
+    @patch("events.tasks.chord")
+    def test_reload_calendar_links_abort(self, mock_chord):
+        """Test that a failed chunk releases the checkpoint."""
+        reload_calendar(self.user)
+
+        checkpoint = ReloadCheckpoint.objects.get(user=self.user)
+        callback = mock_chord.return_value.call_args.args[0]
+        self.assertEqual(
+            callback.options["link_error"],
+            [abort_calendar_reload.si(checkpoint.id)],
+        )
+
+        abort_calendar_reload(checkpoint.id)
+
+        checkpoint.refresh_from_db()
+        self.assertLess(
+            checkpoint.updated_at,
+            timezone.now()
+            - datetime.timedelta(seconds=settings.CELERY_TASK_TIME_LIMIT - 1),
+        )
+
+    def test_reload_checkpoint_unique_scope(self):
+        """Test that each user and all users have a single checkpoint."""
+        ReloadCheckpoint.objects.create(user=self.user)
+        ReloadCheckpoint.objects.create(user=None)
+
+        with transaction.atomic(), self.assertRaises(IntegrityError):
+            ReloadCheckpoint.objects.create(user=self.user)
+        with transaction.atomic(), self.assertRaises(IntegrityError):
+            ReloadCheckpoint.objects.create(user=None)
+
+    def test_complete_chunk_out_of_order(self):
+        """Test that the checkpoint only advances over contiguous chunks."""
+        checkpoint = ReloadCheckpoint.objects.create(chunk_ends=[2, 4, 6])
+
+        ReloadCheckpoint.complete_chunk(checkpoint.id, 4)
+        checkpoint.refresh_from_db()
+        self.assertEqual(checkpoint.last_item_id, 0)
+
+        ReloadCheckpoint.complete_chunk(checkpoint.id, 2)
+        checkpoint.refresh_from_db()
+        self.assertEqual(checkpoint.last_item_id, 4)
+
     def test_get_items_to_process(self):
         """Test the get_items_to_process function."""
         # Create a second user to verify user filtering
@@ -337,6 +457,64 @@ class ReloadCalendarTaskTests(TestCase):
         self.assertIn(self.anime_item, all_items)
         self.assertIn(user2_item, all_items)
 
+    def test_get_items_to_process_due(self):
+        """Test that the scheduled reload only selects items due a refresh."""
+        self.movie_item.next_refresh = timezone.now() + datetime.timedelta(days=1)
+        self.movie_item.save()
+        self.book_item.next_refresh = timezone.now() - datetime.timedelta(days=1)
+        self.book_item.save()
+
+        all_items = get_items_to_process()
+
+        self.assertNotIn(self.movie_item, all_items)
+        self.assertIn(self.book_item, all_items)
+        self.assertIn(self.anime_item, all_items)
+        # reloads requested by a user ignore the schedule
+        self.assertIn(self.movie_item, get_items_to_process(self.user))
+
+    def test_get_next_refresh(self):
+        """Test that the refresh follows the release cadence."""
+        now = timezone.now()
+        next_episode = now + datetime.timedelta(days=3)
+        unknown = datetime.datetime.min.replace(tzinfo=ZoneInfo("UTC"))
+
+        # airing, the day after the next release
+        self.assertEqual(
+            get_next_refresh(self.anime_item, [now, next_episode], now),
+            next_episode + datetime.timedelta(days=1),
+        )
+        # far releases and undated items, weekly
+        self.assertEqual(
+            get_next_refresh(
+                self.movie_item,
+                [now + datetime.timedelta(days=200)],
+                now,
+            ),
+            now + datetime.timedelta(days=7),
+        )
+        self.assertEqual(
+            get_next_refresh(self.movie_item, [unknown], now),
+            now + datetime.timedelta(days=7),
+        )
+        # finished anime, never
+        self.assertEqual(
+            get_next_refresh(
+                self.anime_item,
+                [now - datetime.timedelta(days=1)],
+                now,
+            ),
+            NEVER_REFRESH,
+        )
+        # released manga volumes, monthly
+        self.assertEqual(
+            get_next_refresh(
+                self.manga_item,
+                [now - datetime.timedelta(days=1)],
+                now,
+            ),
+            now + datetime.timedelta(days=30),
+        )
+
     @patch("events.calendar.tmdb.tv")
     @patch("events.calendar.tmdb.tv_with_seasons")
     @patch("events.calendar.get_tvmaze_episode_map")
@@ -411,6 +589,49 @@ class ReloadCalendarTaskTests(TestCase):
         expected_date = datetime.datetime.fromisoformat("2008-01-20T22:00:00+00:00")
         self.assertEqual(events_bulk[0].datetime, expected_date)
 
+    @override_settings(CALENDAR_FETCH_WORKERS=4)
+    @patch("events.calendar.services.get_media_metadata")
+    @patch("events.calendar.tmdb.tv")
+    @patch("events.calendar.tmdb.tv_with_seasons")
+    @patch("events.calendar.get_tvmaze_episode_map")
+    def test_prefetch_metadata(
+        self,
+        mock_get_tvmaze_episode_map,
+        mock_tv_with_seasons,
+        mock_tv,
+        mock_get_media_metadata,
+    ):
+        """Test the concurrent fetch stage requests what processing needs."""
+        Event.objects.create(
+            item=self.season_item,
+            content_number=1,
+            datetime=timezone.now() - datetime.timedelta(days=30),
+        )
+        mock_tv.return_value = {
+            "related": {"seasons": [{"season_number": 1}, {"season_number": 2}]},
+            "next_episode_season": None,
+        }
+        mock_tv_with_seasons.return_value = {
+            "season/2": {"season_number": 2, "tvdb_id": "81189"},
+        }
+        mock_get_media_metadata.side_effect = services.ProviderAPIError(
+            Sources.TMDB.value,
+            MagicMock(response=MagicMock(status_code=500, text="error")),
+        )
+
+        # failures are left for the sequential processing to report
+        prefetch_metadata([self.tv_item, self.movie_item, self.anime_item])
+
+        # season 1 already has events and isn't airing
+        mock_tv_with_seasons.assert_called_once_with(self.tv_item.media_id, [2])
+        mock_get_tvmaze_episode_map.assert_called_once_with("81189")
+        # anime are fetched in bulk during processing
+        mock_get_media_metadata.assert_called_once_with(
+            self.movie_item.media_type,
+            self.movie_item.media_id,
+            self.movie_item.source,
+        )
+
     @patch("events.calendar.services.get_media_metadata")
     def test_process_other_movie(self, mock_get_media_metadata):
         """Test process_other for a movie."""
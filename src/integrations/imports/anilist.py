@@ -45,6 +45,9 @@ class AniListImporter:
         # Track bulk creation lists for each media type
         self.bulk_media = defaultdict(list)
 
+        # Items referenced by the media, resolved before the bulk creation
+        self.items = helpers.ItemResolver()
+
         logger.info(
             "Initialized AniList importer for user %s with mode %s",
             username,
@@ -148,6 +151,7 @@ class AniListImporter:
         self._process_media_data(response["data"]["anime"], MediaTypes.ANIME.value)
         self._process_media_data(response["data"]["manga"], MediaTypes.MANGA.value)
 
+        self.items.resolve()
         helpers.cleanup_existing_media(self.to_delete, self.user)
         helpers.bulk_create_media(self.bulk_media, self.user)
 
@@ -195,7 +199,7 @@ class AniListImporter:
         else:
             status = content["status"].capitalize()
 
-        item, _ = app.models.Item.objects.get_or_create(
+        item = self.items.get(
             media_id=str(content["media"]["idMal"]),
             source=Sources.MAL.value,
             media_type=media_type,
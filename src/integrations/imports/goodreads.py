@@ -1,16 +1,15 @@
 import logging
 from collections import defaultdict
-from csv import DictReader
 from datetime import datetime
 
 from django.apps import apps
+from django.conf import settings
 from django.utils import timezone
 
-import app
 from app.models import MediaTypes, Sources, Status
 from app.providers import services
 from integrations.imports import helpers
-from integrations.imports.helpers import MediaImportError, MediaImportUnexpectedError
+from integrations.imports.helpers import MediaImportUnexpectedError
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +20,7 @@ def importer(file, user, mode):
     return csv_importer.import_data()
 
 
-class GoodReadsImporter:
+class GoodReadsImporter(helpers.BatchImportMixin):
     """Class to handle importing goodreads data from CSV files."""
 
     def __init__(self, file, user, mode):
@@ -46,6 +45,8 @@ class GoodReadsImporter:
         # Track bulk creation lists for each media type
         self.bulk_media = defaultdict(list)
 
+        self._init_batches()
+
         logger.info(
             "Initialized GoodReads CSV importer for user %s with mode %s",
             user.username,
@@ -54,15 +55,7 @@ class GoodReadsImporter:
 
     def import_data(self):
         """Import all GoodReads data from the CSV file."""
-        try:
-            decoded_file = self.file.read().decode("utf-8").splitlines()
-        except UnicodeDecodeError as e:
-            msg = "Invalid file format. Please upload a CSV file."
-            raise MediaImportError(msg) from e
-
-        reader = DictReader(decoded_file)
-
-        for row in reader:
+        for index, row in enumerate(helpers.read_csv(self.file), start=1):
             try:
                 self._process_row(row)
             except services.ProviderAPIError:
@@ -73,20 +66,13 @@ class GoodReadsImporter:
                 error_msg = f"Error processing entry: {row}"
                 raise MediaImportUnexpectedError(error_msg) from error
 
-        logger.debug("processed %s", self.bulk_media)
+            if index % settings.IMPORT_BATCH_SIZE == 0:
+                self._flush_media()
 
-        helpers.cleanup_existing_media(self.to_delete, self.user)
-        helpers.bulk_create_media(self.bulk_media, self.user)
-
-        logger.debug("processed %s", self.bulk_media)
-
-        imported_counts = {
-            media_type: len(media_list)
-            for media_type, media_list in self.bulk_media.items()
-        }
+        self._flush_media()
 
         deduplicated_messages = "\n".join(dict.fromkeys(self.warnings))
-        return imported_counts, deduplicated_messages
+        return dict(self.imported_counts), deduplicated_messages
 
     def _process_row(self, row):
         """Process a single row from the CSV file."""
@@ -103,7 +89,7 @@ class GoodReadsImporter:
 
         media_id = book["media_id"]
 
-        item, _ = self._create_or_update_item(book)
+        item = self._create_or_update_item(book)
 
         # Check if we should process this entry based on mode
         if not helpers.should_process_media(
@@ -150,15 +136,15 @@ class GoodReadsImporter:
     def _create_or_update_item(self, book):
         """Create or update the item in database."""
         media_type = MediaTypes.BOOK.value
-        return app.models.Item.objects.update_or_create(
+        return self.items.get(
             media_id=book["media_id"],
             source=Sources.HARDCOVER.value,
             media_type=media_type,
-            title=book["title"],
             defaults={
                 "title": book["title"],
                 "image": book["image"],
             },
+            update=True,
         )
 
     def _determine_status(self, row):
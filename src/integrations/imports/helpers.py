@@ -1,19 +1,22 @@
 import base64
+import codecs
 import datetime
 import hashlib
 import json
 import logging
 from collections import defaultdict
+from csv import DictReader
 
 from cryptography.fernet import Fernet
 from django.apps import apps
 from django.conf import settings
 from django.contrib import messages
+from django.db import transaction
 from django.utils import timezone
 from django_celery_beat.models import CrontabSchedule, PeriodicTask
-from simple_history.utils import bulk_create_with_history
 
 import app
+from app.history import bulk_create_with_history
 from app.models import MediaTypes
 
 logger = logging.getLogger(__name__)
@@ -27,20 +30,64 @@ class MediaImportUnexpectedError(Exception):
     """Custom exception for unexpected import errors."""
 
 
+CSV_READ_SIZE = 64 * 1024
+
+
+def read_csv(file):
+    """Return a DictReader over the rows of an uploaded CSV file.
+
+    The file is decoded incrementally, so only a chunk of it is held in memory.
+    """
+    return DictReader(_decode_lines(file))
+
+
+def _decode_lines(file):
+    """Yield the lines of a UTF-8 encoded file, reading it in chunks."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    final = False
+
+    while not final:
+        chunk = file.read(CSV_READ_SIZE)
+        final = not chunk
+        try:
+            text = decoder.decode(chunk, final=final)
+        except UnicodeDecodeError as e:
+            msg = "Invalid file format. Please upload a CSV file."
+            raise MediaImportError(msg) from e
+
+        lines = (pending + text).splitlines(keepends=True)
+        # hold back the last line until its line break, which may be "\r\n"
+        # split across two chunks
+        pending = lines.pop() if lines and not final else ""
+        yield from lines
+
+    if pending:
+        yield pending
+
+
 def get_existing_media(user):
-    """Get all existing media for the user to check against during import."""
+    """Get the keys of the existing media to check against during import.
+
+    Return the media IDs of the user's media by media type and source, fetched
+    with a single query instead of loading the media instances.
+    """
     excluded_types = [MediaTypes.SEASON.value, MediaTypes.EPISODE.value]
     valid_types = [value for value in MediaTypes.values if value not in excluded_types]
-    existing = defaultdict(lambda: defaultdict(dict))
-
-    for media_type in valid_types:
-        media_model = apps.get_model(app_label="app", model_name=media_type)
-
-        for media in media_model.objects.filter(user=user).select_related("item"):
-            existing[media_type][media.item.source][media.item.media_id] = media
+    existing = defaultdict(lambda: defaultdict(set))
+
+    querysets = [
+        apps.get_model(app_label="app", model_name=media_type)
+        .objects.filter(user=user)
+        .order_by()
+        .values_list("item__media_type", "item__source", "item__media_id")
+        for media_type in valid_types
+    ]
+    for media_type, source, media_id in querysets[0].union(*querysets[1:]):
+        existing[media_type][source].add(media_id)
 
     counts = [
-        f"{media_type}: {sum(len(source_dict) for source_dict in media_dict.values())}"
+        f"{media_type}: {sum(len(media_ids) for media_ids in media_dict.values())}"
         for media_type, media_dict in existing.items()
     ]
     logger.debug("Existing media for user %s: %s", user.username, ", ".join(counts))
@@ -72,33 +119,212 @@ def should_process_media(existing_media, to_delete, media_type, source, media_id
     return True
 
 
-def cleanup_existing_media(to_delete, user):
-    """Delete existing media if in overwrite mode."""
-    for media_type, sources in to_delete.items():
-        if not sources:
-            continue
+class ItemResolver:
+    """Resolve the items referenced by an import in bulk.
 
-        model = apps.get_model(app_label="app", model_name=media_type)
-        total_deleted = 0
+    get() hands out one unsaved item per key while the entries are processed,
+    resolve() then looks up the existing rows with one query per source and
+    media type and bulk creates the missing ones before the media are created.
+    """
 
-        for source, media_ids in sources.items():
-            if not media_ids:
+    def __init__(self, batch_size=500):
+        """Initialize the resolver."""
+        self.batch_size = batch_size
+        self.items = {}
+        self.updates = set()
+
+    def get(
+        self,
+        media_id,
+        source,
+        media_type,
+        season_number=None,
+        episode_number=None,
+        defaults=None,
+        *,
+        update=False,
+    ):
+        """Return the item of the key, like get_or_create or update_or_create.
+
+        With update, the defaults also overwrite the values of an existing item.
+        """
+        key = (str(media_id), source, media_type, season_number, episode_number)
+        item = self.items.get(key)
+
+        if item is None:
+            item = app.models.Item(
+                media_id=key[0],
+                source=source,
+                media_type=media_type,
+                season_number=season_number,
+                episode_number=episode_number,
+                **(defaults or {}),
+            )
+            self.items[key] = item
+        elif update and defaults:
+            for attr, value in defaults.items():
+                setattr(item, attr, value)
+
+        if update:
+            self.updates.add(key)
+        return item
+
+    def resolve(self):
+        """Assign the primary keys of all items, creating the missing ones."""
+        pending = defaultdict(list)
+        for key, item in self.items.items():
+            if item.pk is None:
+                pending[key[1:3]].append(key)
+
+        created = 0
+        for (source, media_type), keys in pending.items():
+            changed = self._assign_existing(source, media_type, keys)
+
+            missing = [self.items[key] for key in keys if self.items[key].pk is None]
+            if missing:
+                # rows inserted concurrently are skipped and looked up below
+                app.models.Item.objects.bulk_create(
+                    missing,
+                    batch_size=self.batch_size,
+                    ignore_conflicts=True,
+                )
+                self._assign_existing(
+                    source,
+                    media_type,
+                    [key for key in keys if self.items[key].pk is None],
+                )
+                created += len(missing)
+
+            if changed:
+                app.models.Item.objects.bulk_update(
+                    changed,
+                    ["title", "image"],
+                    batch_size=self.batch_size,
+                )
+
+        logger.info(
+            "Resolved %d items, %d of them created",
+            sum(len(keys) for keys in pending.values()),
+            created,
+        )
+
+    def _assign_existing(self, source, media_type, keys):
+        """Assign the primary keys of the existing rows of the keys.
+
+        Return the items to update whose values differ from the stored ones.
+        """
+        media_ids = list(dict.fromkeys(key[0] for key in keys))
+        changed = []
+
+        for start in range(0, len(media_ids), self.batch_size):
+            rows = app.models.Item.objects.filter(
+                source=source,
+                media_type=media_type,
+                media_id__in=media_ids[start : start + self.batch_size],
+            ).only(
+                "id",
+                "media_id",
+                "season_number",
+                "episode_number",
+                "title",
+                "image",
+            )
+
+            for row in rows:
+                key = (
+                    row.media_id,
+                    source,
+                    media_type,
+                    row.season_number,
+                    row.episode_number,
+                )
+                item = self.items.get(key)
+                if item is None or item.pk is not None:
+                    continue
+
+                item.pk = row.pk
+                item._state.adding = False
+                item._state.db = row._state.db
+
+                if key not in self.updates:
+                    item.title = row.title
+                    item.image = row.image
+                elif (item.title, item.image) != (row.title, row.image):
+                    changed.append(item)
+
+        return changed
+
+
+def cleanup_existing_media(to_delete, user, existing_media=None, *, signals=False):
+    """Delete existing media if in overwrite mode.
+
+    The media are deleted with set-based deletes in one transaction, see
+    delete_media. With signals, they go through the ORM collector instead,
+    which sends the delete signals but deletes their history row by row.
+
+    When imports create their media in batches, passing existing_media drops
+    the deleted media from it and clears to_delete, so a later batch doesn't
+    delete the media imported by an earlier one.
+    """
+    with transaction.atomic():
+        for media_type, sources in to_delete.items():
+            if not sources:
                 continue
 
-            deleted_count, _ = model.objects.filter(
-                item__media_id__in=media_ids,
-                item__source=source,
-                user=user,
-            ).delete()
-            total_deleted += deleted_count
+            model = apps.get_model(app_label="app", model_name=media_type)
+            total_deleted = 0
+
+            for source, media_ids in sources.items():
+                if not media_ids:
+                    continue
+
+                queryset = model.objects.filter(
+                    item__media_id__in=media_ids,
+                    item__source=source,
+                    user=user,
+                )
+                if signals:
+                    deleted_count, _ = queryset.delete()
+                else:
+                    deleted_count = delete_media(queryset)
+                total_deleted += deleted_count
+
+            if total_deleted > 0:
+                logger.info(
+                    "Deleted %s %s objects for user %s in overwrite mode",
+                    total_deleted,
+                    media_type,
+                    user,
+                )
+
+            if existing_media is not None:
+                for source, media_ids in sources.items():
+                    existing_media[media_type][source] -= media_ids
+                sources.clear()
+
+
+def delete_media(queryset):
+    """Delete the media of the queryset and return the number of deleted rows.
+
+    Seasons and episodes of the deleted TV shows and seasons are deleted too,
+    as their foreign keys cascade, along with the history of all of them. Each
+    table gets a single DELETE and no delete signals are sent.
+    """
+    querysets = [queryset]
+    if queryset.model is app.models.TV:
+        querysets.append(app.models.Season.objects.filter(related_tv__in=queryset))
+    if querysets[-1].model is app.models.Season:
+        querysets.append(
+            app.models.Episode.objects.filter(related_season__in=querysets[-1]),
+        )
 
-        if total_deleted > 0:
-            logger.info(
-                "Deleted %s %s objects for user %s in overwrite mode",
-                total_deleted,
-                media_type,
-                user,
-            )
+    deleted = 0
+    for media in querysets:
+        deleted += media.model.history.filter(id__in=media.values("id")).delete()[0]
+    # children first, their rows are selected through their parents
+    for media in reversed(querysets):
+        deleted += media._raw_delete(media.db)
+    return deleted
 
 
 def update_season_references(seasons, user):
@@ -187,8 +413,44 @@ def bulk_create_media(bulk_media_list, user):
             model,
             batch_size=500,
             default_user=user,
+            history=settings.IMPORT_HISTORY,
         )
 
+        if media_type == MediaTypes.EPISODE.value:
+            app.models.Season.refresh_watch_stats(
+                {episode.related_season_id for episode in bulk_media},
+            )
+        else:
+            model.refresh_latest(user.id, {media.item_id for media in bulk_media})
+
+
+class BatchImportMixin:
+    """Create the media of an importer in batches.
+
+    The importer provides user, existing_media, to_delete and bulk_media and
+    calls _init_batches() once. _flush_media() creates the media collected
+    since the previous flush.
+    """
+
+    def _init_batches(self):
+        """Initialize the state kept across the batches."""
+        # Items referenced by the media, resolved before the bulk creation
+        self.items = ItemResolver()
+
+        # Media created so far, the rows are imported in batches
+        self.imported_counts = defaultdict(int)
+
+    def _flush_media(self):
+        """Create the media of the rows processed since the last flush."""
+        self.items.resolve()
+        cleanup_existing_media(self.to_delete, self.user, self.existing_media)
+        bulk_create_media(self.bulk_media, self.user)
+
+        for media_type, media_list in self.bulk_media.items():
+            self.imported_counts[media_type] += len(media_list)
+        self.bulk_media.clear()
+        self.items = ItemResolver()
+
 
 def create_import_schedule(
     username,
@@ -1,16 +1,16 @@
 import logging
 from collections import defaultdict
-from csv import DictReader
 from datetime import UTC, datetime
 
 from django.apps import apps
+from django.conf import settings
 from django.utils import timezone
 
 import app
 import app.providers
 from app.models import MediaTypes, Sources, Status
 from integrations.imports import helpers
-from integrations.imports.helpers import MediaImportError, MediaImportUnexpectedError
+from integrations.imports.helpers import MediaImportUnexpectedError
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,7 @@ def importer(file, user, mode):
     return hltb_importer.import_data()
 
 
-class HowLongToBeatImporter:
+class HowLongToBeatImporter(helpers.BatchImportMixin):
     """Class to handle importing user data from HowLongToBeat CSV."""
 
     def __init__(self, file, user, mode):
@@ -46,6 +46,8 @@ class HowLongToBeatImporter:
         # Track bulk creation lists for each media type
         self.bulk_media = defaultdict(list)
 
+        self._init_batches()
+
         logger.info(
             "Initialized HowLongToBeat importer for user %s with mode %s",
             user.username,
@@ -54,48 +56,41 @@ class HowLongToBeatImporter:
 
     def import_data(self):
         """Import all user data from CSV."""
-        try:
-            decoded_file = self.file.read().decode("utf-8").splitlines()
-        except UnicodeDecodeError as e:
-            msg = "Invalid file format. Please upload a CSV file."
-            raise MediaImportError(msg) from e
-
-        reader = DictReader(decoded_file)
-        rows = list(reader)
-
         # Track media IDs and their titles from the import file
         media_id_counts = defaultdict(int)
         media_id_titles = defaultdict(list)
 
         # First pass: identify duplicates
-        for row in rows:
+        for row in helpers.read_csv(self.file):
             try:
                 self._process_first_pass(row, media_id_counts, media_id_titles)
             except Exception as error:
                 error_msg = f"Error processing entry: {row}"
                 raise MediaImportUnexpectedError(error_msg) from error
 
-        # Second pass: add non-duplicates to bulk_media
-        for row in rows:
+        # Second pass: add non-duplicates to bulk_media, reading the file again
+        # instead of keeping its rows in memory
+        self.file.seek(0)
+        for index, row in enumerate(helpers.read_csv(self.file), start=1):
             try:
                 self._process_second_pass(row, media_id_counts)
             except Exception as error:
                 error_msg = f"Error processing entry: {row}"
                 raise MediaImportUnexpectedError(error_msg) from error
 
+            if index % settings.IMPORT_BATCH_SIZE == 0:
+                self._flush_media()
+
         # Add consolidated warnings for duplicates
         self._add_duplicate_warnings(media_id_counts, media_id_titles)
 
-        helpers.cleanup_existing_media(self.to_delete, self.user)
-        helpers.bulk_create_media(self.bulk_media, self.user)
-
-        imported_counts = {
-            media_type: len(media_list)
-            for media_type, media_list in self.bulk_media.items()
-        }
+        self._flush_media()
 
         deduplicated_messages = "\n".join(dict.fromkeys(self.warnings))
-        return imported_counts, deduplicated_messages if self.warnings else None
+        return (
+            dict(self.imported_counts),
+            deduplicated_messages if self.warnings else None,
+        )
 
     def _process_first_pass(self, row, media_id_counts, media_id_titles):
         """First pass to identify duplicate games."""
@@ -123,7 +118,7 @@ class HowLongToBeatImporter:
         if media_id_counts[media_id] > 1:
             return
 
-        item, _ = self._create_or_update_item(game)
+        item = self._create_or_update_item(game)
 
         # Check if we should process this entry based on mode
         if not helpers.should_process_media(
@@ -187,15 +182,15 @@ class HowLongToBeatImporter:
     def _create_or_update_item(self, game):
         """Create or update the item in database."""
         media_type = MediaTypes.GAME.value
-        return app.models.Item.objects.update_or_create(
+        return self.items.get(
             media_id=game["media_id"],
             source=Sources.IGDB.value,
             media_type=media_type,
-            title=game["title"],
             defaults={
                 "title": game["title"],
                 "image": game["image"],
             },
+            update=True,
         )
 
     def _format_notes(self, row):
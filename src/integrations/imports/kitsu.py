@@ -49,6 +49,9 @@ class KitsuImporter:
         # Track bulk creation lists for each media type
         self.bulk_media = defaultdict(list)
 
+        # Items referenced by the media, resolved before the bulk creation
+        self.items = helpers.ItemResolver()
+
         # Load Kitsu-MU mapping data
         current_file_dir = Path(__file__).resolve().parent
         json_file_path = current_file_dir / "data" / "kitsu-mu-mapping.json"
@@ -72,6 +75,7 @@ class KitsuImporter:
         self._process_media_type(MediaTypes.ANIME.value)
         self._process_media_type(MediaTypes.MANGA.value)
 
+        self.items.resolve()
         helpers.cleanup_existing_media(self.to_delete, self.user)
         helpers.bulk_create_media(self.bulk_media, self.user)
 
@@ -320,7 +324,7 @@ class KitsuImporter:
 
         image_url = self._get_image_url(kitsu_metadata)
 
-        item, _ = app.models.Item.objects.get_or_create(
+        return self.items.get(
             media_id=media_id,
             source=source,
             media_type=media_type,
@@ -329,7 +333,6 @@ class KitsuImporter:
                 "image": image_url,
             },
         )
-        return item
 
     def _get_image_url(self, media):
         """Get the image URL for a media item."""
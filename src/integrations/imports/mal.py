@@ -48,6 +48,9 @@ class MyAnimeListImporter:
         # Track bulk creation lists for each media type
         self.bulk_media = defaultdict(list)
 
+        # Items referenced by the media, resolved before the bulk creation
+        self.items = helpers.ItemResolver()
+
         logger.info(
             "Initialized MyAnimeList importer for user %s with mode %s",
             username,
@@ -59,6 +62,7 @@ class MyAnimeListImporter:
         self._process_media_type(MediaTypes.ANIME.value)
         self._process_media_type(MediaTypes.MANGA.value)
 
+        self.items.resolve()
         helpers.cleanup_existing_media(self.to_delete, self.user)
         helpers.bulk_create_media(self.bulk_media, self.user)
 
@@ -145,7 +149,7 @@ class MyAnimeListImporter:
         ):
             return
 
-        item, _ = app.models.Item.objects.get_or_create(
+        item = self.items.get(
             media_id=str(content["node"]["id"]),
             source=Sources.MAL.value,
             media_type=media_type,
@@ -109,6 +109,9 @@ class SimklImporter:
         # Track bulk creation lists for each media type
         self.bulk_media = defaultdict(list)
 
+        # Items referenced by the media, resolved before the bulk creation
+        self.items = helpers.ItemResolver()
+
         logger.info(
             "Initialized Simkl importer for user %s with mode %s",
             user.username,
@@ -124,6 +127,7 @@ class SimklImporter:
 
         self._process_media_lists(data)
 
+        self.items.resolve()
         helpers.cleanup_existing_media(self.to_delete, self.user)
         helpers.bulk_create_media(self.bulk_media, self.user)
 
@@ -219,7 +223,7 @@ class SimklImporter:
                         continue
                     raise
 
-                tv_item, _ = app.models.Item.objects.get_or_create(
+                tv_item = self.items.get(
                     media_id=tmdb_id,
                     source=Sources.TMDB.value,
                     media_type=MediaTypes.TV.value,
@@ -262,7 +266,7 @@ class SimklImporter:
             episodes = season["episodes"]
             season_metadata = metadata[f"season/{season_number}"]
 
-            season_item, _ = app.models.Item.objects.get_or_create(
+            season_item = self.items.get(
                 media_id=tmdb_id,
                 source=Sources.TMDB.value,
                 media_type=MediaTypes.SEASON.value,
@@ -290,7 +294,7 @@ class SimklImporter:
             # Process episodes
             for episode in episodes:
                 ep_img = self._get_episode_image(episode, season_number, metadata)
-                episode_item, _ = app.models.Item.objects.get_or_create(
+                episode_item = self.items.get(
                     media_id=tmdb_id,
                     source=Sources.TMDB.value,
                     media_type=MediaTypes.EPISODE.value,
@@ -370,7 +374,7 @@ class SimklImporter:
                         continue
                     raise
 
-                movie_item, _ = app.models.Item.objects.get_or_create(
+                movie_item = self.items.get(
                     media_id=tmdb_id,
                     source=Sources.TMDB.value,
                     media_type=MediaTypes.MOVIE.value,
@@ -445,7 +449,7 @@ class SimklImporter:
                         continue
                     raise
 
-                anime_item, _ = app.models.Item.objects.get_or_create(
+                anime_item = self.items.get(
                     media_id=mal_id,
                     source=Sources.MAL.value,
                     media_type=MediaTypes.ANIME.value,
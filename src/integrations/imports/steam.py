@@ -49,6 +49,7 @@ class SteamImporter:
         self.to_delete = defaultdict(lambda: defaultdict(set))
 
         self.bulk_media = defaultdict(list)
+        self.items = helpers.ItemResolver()
 
         logger.info(
             "Initialized Steam importer for Steam ID %s with mode %s",
@@ -68,6 +69,7 @@ class SteamImporter:
             for game_data in owned_games:
                 self._process_game(game_data)
 
+            self.items.resolve()
             helpers.cleanup_existing_media(self.to_delete, self.user)
             helpers.bulk_create_media(self.bulk_media, self.user)
 
@@ -192,7 +194,7 @@ class SteamImporter:
                     return
 
                 # Use IGDB data if found
-                item, _ = app.models.Item.objects.get_or_create(
+                item = self.items.get(
                     media_id=str(igdb_game["media_id"]),
                     source=Sources.IGDB.value,
                     media_type=MediaTypes.GAME.value,
@@ -219,7 +221,8 @@ class SteamImporter:
                 else:
                     image_url = settings.IMG_NONE
 
-                # Create manual entry if no IGDB match
+                # Create manual entry if no IGDB match, saved right away as
+                # the next manual ID is generated from the stored ones
                 item, _ = app.models.Item.objects.get_or_create(
                     media_id=manual_media_id,
                     source=Sources.MANUAL.value,
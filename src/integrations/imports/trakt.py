@@ -1,6 +1,7 @@
 import json
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 from django.conf import settings
@@ -159,9 +160,15 @@ class TraktImporter:
         # Track bulk creation lists for each media type
         self.bulk_media = defaultdict(list)
 
+        # Items referenced by the media, resolved before the bulk creation
+        self.items = helpers.ItemResolver()
+
         # Track media instances being created
         self.media_instances = defaultdict(lambda: defaultdict(list))
 
+        # Metadata fetched ahead of processing, keyed by (type, id, season)
+        self.prefetched_metadata = {}
+
         logger.info(
             "Initialized Trakt importer for user %s with mode %s",
             username,
@@ -175,6 +182,7 @@ class TraktImporter:
         self.process_ratings()
         self.process_comments()
 
+        self.items.resolve()
         helpers.cleanup_existing_media(self.to_delete, self.user)
         helpers.bulk_create_media(self.bulk_media, self.user)
 
@@ -253,6 +261,7 @@ class TraktImporter:
         logger.info("Importing watch history for user %s", self.username)
         history_endpoint = f"{self.user_base_url}/history"
         full_history = self._get_paginated_data(history_endpoint, "history entries")
+        self._prefetch_metadata(full_history)
 
         # Process in chronological order (oldest first)
         for entry in reversed(full_history):
@@ -278,6 +287,108 @@ class TraktImporter:
                 msg = f"Error processing history entry: {entry}"
                 raise MediaImportUnexpectedError(msg) from e
 
+    def _prefetch_metadata(self, entries):
+        """Fetch the metadata of every movie and show in the entries concurrently.
+
+        The seasons of a show are fetched together with TMDB's
+        append_to_response. The threads share the provider session, so its
+        rate limits still apply. Failed fetches are left for the sequential
+        processing to retry and report.
+        """
+        workers = settings.IMPORT_FETCH_WORKERS
+        movies, shows = self._collect_tmdb_ids(entries)
+
+        requests_to_make = [
+            (MediaTypes.MOVIE.value, tmdb_id, None)
+            for tmdb_id in movies
+            if not self._is_prefetch_skipped(MediaTypes.MOVIE.value, tmdb_id)
+        ] + [
+            (MediaTypes.TV.value, tmdb_id, tuple(sorted(seasons)))
+            for tmdb_id, seasons in shows.items()
+            if not self._is_prefetch_skipped(MediaTypes.TV.value, tmdb_id)
+        ]
+        if workers <= 1 or len(requests_to_make) <= 1:
+            return
+
+        logger.info("Prefetching metadata of %d titles", len(requests_to_make))
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="trakt-fetch",
+        ) as executor:
+            futures = {
+                executor.submit(self._fetch_metadata, *request): request
+                for request in requests_to_make
+            }
+            for future in as_completed(futures):
+                media_type, tmdb_id, _ = futures[future]
+                try:
+                    self.prefetched_metadata.update(future.result())
+                except (
+                    services.ProviderAPIError,
+                    requests.exceptions.RequestException,
+                ):
+                    logger.debug("Prefetch of %s %s failed", media_type, tmdb_id)
+
+    def _collect_tmdb_ids(self, entries):
+        """Return the TMDB ids of the movies and shows with their season numbers."""
+        movies = set()
+        shows = defaultdict(set)
+
+        for entry in entries:
+            if entry["type"] == "movie":
+                tmdb_id = entry["movie"].get("ids", {}).get("tmdb")
+                if tmdb_id:
+                    movies.add(str(tmdb_id))
+            elif entry["type"] in ("show", "season", "episode"):
+                tmdb_id = entry["show"].get("ids", {}).get("tmdb")
+                if not tmdb_id:
+                    continue
+                seasons = shows[str(tmdb_id)]
+                if entry["type"] == "season":
+                    seasons.add(entry["season"]["number"])
+                elif entry["type"] == "episode":
+                    seasons.add(entry["episode"]["season"])
+
+        return movies, shows
+
+    def _is_prefetch_skipped(self, media_type, tmdb_id):
+        """Check if the media will be skipped or was already prefetched."""
+        if (media_type, tmdb_id, None) in self.prefetched_metadata:
+            return True
+        return (
+            self.mode == "new"
+            and tmdb_id in self.existing_media[media_type][Sources.TMDB.value]
+        )
+
+    def _fetch_metadata(self, media_type, tmdb_id, season_numbers):
+        """Return the metadata of a movie or a show with its seasons."""
+        if not season_numbers:
+            metadata = services.get_media_metadata(
+                media_type,
+                tmdb_id,
+                Sources.TMDB.value,
+            )
+            return {(media_type, tmdb_id, None): metadata}
+
+        metadata = services.get_media_metadata(
+            "tv_with_seasons",
+            tmdb_id,
+            Sources.TMDB.value,
+            season_numbers=list(season_numbers),
+        )
+        results = {
+            (media_type, tmdb_id, None): {
+                key: value
+                for key, value in metadata.items()
+                if not key.startswith("season/")
+            },
+        }
+        for season_number in season_numbers:
+            results[(MediaTypes.SEASON.value, tmdb_id, season_number)] = metadata[
+                f"season/{season_number}"
+            ]
+        return results
+
     def _get_tmdb_id(self, entry_data):
         """Extract TMDB ID from entry data."""
         if (
@@ -294,6 +405,10 @@ class TraktImporter:
 
     def _get_metadata(self, media_type, tmdb_id, title, season_number=None):
         """Get metadata for a media item."""
+        prefetched = self.prefetched_metadata.get((media_type, tmdb_id, season_number))
+        if prefetched is not None:
+            return prefetched
+
         try:
             kwargs = {}
             if season_number is not None:
@@ -341,12 +456,7 @@ class TraktImporter:
             "image": metadata["image"],
         }
 
-        item, _ = app.models.Item.objects.get_or_create(
-            **item_kwargs,
-            defaults=defaults,
-        )
-
-        return item
+        return self.items.get(**item_kwargs, defaults=defaults)
 
     def process_watched_movie(self, entry):
         """Process a single movie watch event."""
@@ -541,6 +651,7 @@ class TraktImporter:
         logger.info("Importing watchlist for user %s", self.username)
         watchlist_endpoint = f"{self.user_base_url}/watchlist"
         watchlist_data = self._make_api_request(watchlist_endpoint)
+        self._prefetch_metadata(watchlist_data)
 
         for entry in watchlist_data:
             try:
@@ -558,6 +669,7 @@ class TraktImporter:
         logger.info("Importing ratings for user %s", self.username)
         ratings_endpoint = f"{self.user_base_url}/ratings"
         ratings_data = self._make_api_request(ratings_endpoint)
+        self._prefetch_metadata(ratings_data)
 
         for entry in ratings_data:
             try:
@@ -575,6 +687,7 @@ class TraktImporter:
         logger.info("Importing comments for user %s", self.username)
         comments_endpoint = f"{self.user_base_url}/comments"
         full_comments = self._get_paginated_data(comments_endpoint, "comments")
+        self._prefetch_metadata(full_comments)
 
         for entry in full_comments:
             try:
@@ -1,6 +1,5 @@
 import logging
 from collections import defaultdict
-from csv import DictReader
 
 from django.apps import apps
 from django.conf import settings
@@ -23,7 +22,7 @@ def importer(file, user, mode):
     return csv_importer.import_data()
 
 
-class YamtrackImporter:
+class YamtrackImporter(helpers.BatchImportMixin):
     """Class to handle importing user data from CSV files."""
 
     def __init__(self, file, user, mode):
@@ -48,6 +47,8 @@ class YamtrackImporter:
         # Track bulk creation lists for each media type
         self.bulk_media = defaultdict(list)
 
+        self._init_batches()
+
         logger.info(
             "Initialized Yamtrack CSV importer for user %s with mode %s",
             user.username,
@@ -56,15 +57,7 @@ class YamtrackImporter:
 
     def import_data(self):
         """Import all user data from the CSV file."""
-        try:
-            decoded_file = self.file.read().decode("utf-8").splitlines()
-        except UnicodeDecodeError as e:
-            msg = "Invalid file format. Please upload a CSV file."
-            raise MediaImportError(msg) from e
-
-        reader = DictReader(decoded_file)
-
-        for row in reader:
+        for index, row in enumerate(helpers.read_csv(self.file), start=1):
             try:
                 self._process_row(row)
             except services.ProviderAPIError as error:
@@ -78,16 +71,13 @@ class YamtrackImporter:
                 error_msg = f"Error processing entry: {row}"
                 raise MediaImportUnexpectedError(error_msg) from error
 
-        helpers.cleanup_existing_media(self.to_delete, self.user)
-        helpers.bulk_create_media(self.bulk_media, self.user)
+            if index % settings.IMPORT_BATCH_SIZE == 0:
+                self._flush_media()
 
-        imported_counts = {
-            media_type: len(media_list)
-            for media_type, media_list in self.bulk_media.items()
-        }
+        self._flush_media()
 
         deduplicated_messages = "\n".join(dict.fromkeys(self.warnings))
-        return imported_counts, deduplicated_messages
+        return dict(self.imported_counts), deduplicated_messages
 
     def _process_row(self, row):
         """Process a single row from the CSV file."""
@@ -128,7 +118,7 @@ class YamtrackImporter:
                 episode_number,
             )
 
-        item, _ = app.models.Item.objects.update_or_create(
+        item = self.items.get(
             media_id=row["media_id"],
             source=row["source"],
             media_type=media_type,
@@ -138,6 +128,7 @@ class YamtrackImporter:
                 "title": row["title"],
                 "image": row["image"],
             },
+            update=True,
         )
 
         model = apps.get_model(app_label="app", model_name=media_type)
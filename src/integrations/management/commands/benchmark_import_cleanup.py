@@ -0,0 +1,118 @@
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app.history import bulk_create_with_history
+from app.models import TV, Episode, Item, MediaTypes, Season, Sources, Status
+from integrations.imports.helpers import cleanup_existing_media
+
+
+class Command(BaseCommand):
+    """Time the overwrite cleanup of imports with and without delete signals.
+
+    Each run creates TV shows with a season and episodes, history included,
+    for a temporary user inside a transaction that is rolled back afterwards.
+    """
+
+    help = "Benchmark the set-based overwrite cleanup against the ORM collector"
+
+    def add_arguments(self, parser):
+        """Add the command arguments."""
+        parser.add_argument(
+            "--shows",
+            type=int,
+            default=200,
+            help="Number of TV shows to delete",
+        )
+        parser.add_argument(
+            "--episodes",
+            type=int,
+            default=20,
+            help="Number of episodes of the season of each TV show",
+        )
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        """Run the cleanup through both paths and print their timings."""
+        for signals in (True, False):
+            with transaction.atomic():
+                user, to_delete = self.create_media(
+                    options["shows"],
+                    options["episodes"],
+                )
+
+                start = time.perf_counter()
+                cleanup_existing_media(to_delete, user, signals=signals)
+                elapsed = time.perf_counter() - start
+
+                transaction.set_rollback(True)
+
+            label = "ORM collector with signals" if signals else "Set-based deletes"
+            self.stdout.write(f"{label}: {elapsed:.3f}s")
+
+    def create_media(self, shows, episodes):
+        """Create the TV shows to delete and return the user and to_delete."""
+        user = get_user_model().objects.create_user(
+            username=f"benchmark-{uuid.uuid4().hex[:8]}",
+        )
+        media_ids = [f"benchmark-{number}" for number in range(shows)]
+
+        def create_items(media_type, **numbers):
+            return Item.objects.bulk_create(
+                Item(
+                    media_id=media_id,
+                    source=Sources.TMDB.value,
+                    media_type=media_type,
+                    title=media_id,
+                    **numbers,
+                )
+                for media_id in media_ids
+            )
+
+        tv_shows = bulk_create_with_history(
+            [
+                TV(item=item, user=user, status=Status.IN_PROGRESS.value)
+                for item in create_items(MediaTypes.TV.value)
+            ],
+            TV,
+            default_user=user,
+        )
+        seasons = bulk_create_with_history(
+            [
+                Season(
+                    item=item,
+                    user=user,
+                    related_tv=tv,
+                    status=Status.IN_PROGRESS.value,
+                )
+                for item, tv in zip(
+                    create_items(MediaTypes.SEASON.value, season_number=1),
+                    tv_shows,
+                    strict=True,
+                )
+            ],
+            Season,
+            default_user=user,
+        )
+        for episode_number in range(1, episodes + 1):
+            bulk_create_with_history(
+                [
+                    Episode(item=item, related_season=season)
+                    for item, season in zip(
+                        create_items(
+                            MediaTypes.EPISODE.value,
+                            season_number=1,
+                            episode_number=episode_number,
+                        ),
+                        seasons,
+                        strict=True,
+                    )
+                ],
+                Episode,
+                default_user=user,
+            )
+
+        to_delete = {MediaTypes.TV.value: {Sources.TMDB.value: set(media_ids)}}
+        return user, to_delete
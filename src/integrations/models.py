@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import Q, UniqueConstraint
+
+
+class WebhookSources(models.TextChoices):
+    """Choices for the media server that sent a webhook."""
+
+    JELLYFIN = "jellyfin", "Jellyfin"
+    PLEX = "plex", "Plex"
+    EMBY = "emby", "Emby"
+
+
+class WebhookEvent(models.Model):
+    """Webhook payload queued for processing in the background."""
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    source = models.CharField(max_length=20, choices=WebhookSources.choices)
+    payload = models.JSONField()
+    payload_hash = models.CharField(max_length=64)
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        """Meta options for the model."""
+
+        ordering = ["id"]
+        constraints = [
+            # identical payloads are only queued once while pending
+            UniqueConstraint(
+                fields=["user", "payload_hash"],
+                condition=Q(processed_at__isnull=True),
+                name="unique_pending_webhook_event",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "id"],
+                condition=Q(processed_at__isnull=True),
+                name="webhook_event_pending_idx",
+            ),
+        ]
+
+    def __str__(self):
+        """Return the source and user of the event."""
+        return f"{self.get_source_display()} webhook for {self.user}"
+
+
+class ImportSummary(models.Model):
+    """Media counts of an import that didn't record the history of its media."""
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    source = models.CharField(max_length=20)
+    mode = models.CharField(max_length=20)
+    imported_counts = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """Meta options for the model."""
+
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        """Return the source and user of the import."""
+        return f"{self.source} import for {self.user}"
@@ -1,9 +1,13 @@
 import logging
 
 from celery import shared_task
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
 
 import events
+from app import statistics
 from app.mixins import disable_fetch_releases
 from app.models import MediaTypes
 from app.templatetags import app_tags
@@ -20,9 +24,13 @@ from integrations.imports import (
     trakt,
     yamtrack,
 )
+from integrations.models import ImportSummary, WebhookEvent
+from integrations.webhooks import queue
 
 logger = logging.getLogger(__name__)
 ERROR_TITLE = "\n\n\n Couldn't import the following media: \n\n"
+# processed webhook events are kept for troubleshooting
+WEBHOOK_EVENT_RETENTION = timezone.timedelta(days=7)
 
 
 def format_media_type_display(count, media_type):
@@ -71,6 +79,17 @@ def import_media(importer_func, identifier, user_id, mode, oauth_username=None):
                 username=oauth_username,
             )
 
+    if not settings.IMPORT_HISTORY:
+        ImportSummary.objects.create(
+            user=user,
+            # the importer modules are named after their source
+            source=importer_func.__module__.rsplit(".", 1)[-1],
+            mode=mode,
+            imported_counts=imported_counts,
+        )
+
+    # imports write in bulk, bypassing the signals that drop the snapshots
+    statistics.invalidate_statistics(user.id)
     events.tasks.reload_calendar.delay()
 
     return format_import_message(imported_counts, warnings)
@@ -131,3 +150,33 @@ def import_imdb(file, user_id, mode):
 def import_goodreads(file, user_id, mode):
     """Celery task for importing media data from GoodReads."""
     return import_media(goodreads.importer, file, user_id, mode)
+
+
+@shared_task(name="Process webhook events")
+def process_webhook_events(user_id):
+    """Process the queued webhook events of a user.
+
+    A per-user lock keeps a single consumer running so events are processed
+    in the order they were received.
+    """
+    user = get_user_model().objects.get(id=user_id)
+    lock_key = f"webhook_queue_lock_{user_id}"
+    if not cache.add(lock_key, 1, settings.CELERY_TASK_TIME_LIMIT):
+        # the running consumer picks up the new events
+        return "Webhook events are already being processed"
+
+    try:
+        processed = queue.process_pending(user)
+    finally:
+        cache.delete(lock_key)
+
+    WebhookEvent.objects.filter(
+        user=user,
+        processed_at__lt=timezone.now() - WEBHOOK_EVENT_RETENTION,
+    ).delete()
+
+    # events queued between the last check of the consumer and the release
+    if WebhookEvent.objects.filter(user=user, processed_at__isnull=True).exists():
+        process_webhook_events.delay(user_id)
+
+    return f"Processed {processed} webhook events"
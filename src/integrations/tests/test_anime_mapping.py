@@ -0,0 +1,43 @@
+from django.test import TestCase
+
+from integrations.webhooks.anime_mapping import AnimeMapping
+
+
+class AnimeMappingTests(TestCase):
+    """Test the indexed anime ID mapping."""
+
+    def setUp(self):
+        """Index a sample of the mapping file."""
+        self.mapping = AnimeMapping.build(
+            {
+                "1": {"mal_id": 1, "tvdb_id": 100, "tvdb_season": 1},
+                "2": {
+                    "mal_id": "2,3",
+                    "tvdb_id": 100,
+                    "tvdb_season": 1,
+                    "tvdb_epoffset": 12,
+                },
+                "3": {"mal_id": 4, "tvdb_id": 100, "tvdb_season": 2},
+                "4": {"mal_id": 5, "tmdb_movie_id": 200, "imdb_id": "tt1"},
+                "5": {"tvdb_id": 300, "tvdb_season": 1, "imdb_id": "tt2"},
+            },
+        )
+
+    def test_tvdb_episode_offsets(self):
+        """Test that episodes resolve to the entry covering their offset."""
+        self.assertEqual(self.mapping.get_mal_id_from_tvdb(100, 1, 5), (1, 5))
+        self.assertEqual(self.mapping.get_mal_id_from_tvdb(100, 1, 12), (1, 12))
+        self.assertEqual(self.mapping.get_mal_id_from_tvdb(100, 1, 13), ("2", 1))
+        self.assertEqual(self.mapping.get_mal_id_from_tvdb(100, 2, 1), (4, 1))
+
+    def test_tvdb_unknown(self):
+        """Test that unknown shows, seasons and entries without MAL ID miss."""
+        self.assertEqual(self.mapping.get_mal_id_from_tvdb(100, 3, 1), (None, None))
+        self.assertEqual(self.mapping.get_mal_id_from_tvdb(300, 1, 1), (None, None))
+        self.assertEqual(self.mapping.get_mal_id_from_tvdb(999, 1, 1), (None, None))
+
+    def test_movie_ids(self):
+        """Test the TMDB movie and IMDB lookups."""
+        self.assertEqual(self.mapping.get_mal_id_from_tmdb_movie(200), 5)
+        self.assertEqual(self.mapping.get_mal_id_from_imdb("tt1"), 5)
+        self.assertIsNone(self.mapping.get_mal_id_from_imdb("tt2"))
@@ -1,15 +1,17 @@
 import json
 from datetime import UTC, datetime
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from django_celery_beat.models import CrontabSchedule, PeriodicTask
 from requests import Response
 from requests.exceptions import HTTPError
+from simple_history.utils import bulk_create_with_history
 
 from app.models import (
     TV,
@@ -38,6 +40,8 @@ from integrations.imports import (
     yamtrack,
 )
 from integrations.imports.trakt import TraktImporter, importer
+from integrations.models import ImportSummary
+from integrations.tasks import import_mal
 
 mock_path = Path(__file__).resolve().parent / "mock_data"
 app_mock_path = (
@@ -100,6 +104,31 @@ class ImportMAL(TestCase):
             datetime(2022, 12, 28, 19, 20, 54, tzinfo=UTC),
         )
 
+    @override_settings(IMPORT_HISTORY=False)
+    @patch("events.tasks.reload_calendar.delay")
+    @patch("requests.Session.get")
+    def test_import_without_history(self, mock_request, mock_reload):
+        """Test that imports without history record a summary instead."""
+        responses = []
+        for file_name in ("import_mal_anime.json", "import_mal_manga.json"):
+            with Path(mock_path / file_name).open() as file:
+                response = MagicMock()
+                response.json.return_value = json.load(file)
+                responses.append(response)
+        mock_request.side_effect = responses
+
+        import_mal("bloodthirstiness", self.user.id, "new")
+
+        self.assertEqual(Anime.objects.filter(user=self.user).count(), 5)
+        self.assertFalse(Anime.history.exists())
+        summary = ImportSummary.objects.get(user=self.user)
+        self.assertEqual(summary.source, "mal")
+        self.assertEqual(
+            summary.imported_counts,
+            {MediaTypes.ANIME.value: 5, MediaTypes.MANGA.value: 3},
+        )
+        mock_reload.assert_called_once()
+
     def test_user_not_found(self):
         """Test that an error is raised if the user is not found."""
         self.assertRaises(
@@ -179,6 +208,19 @@ class ImportYamtrack(TestCase):
             24,
         )
 
+    @override_settings(IMPORT_BATCH_SIZE=5)
+    def test_import_in_batches(self):
+        """Test that importing the rows in batches creates the same media."""
+        user = get_user_model().objects.create_user(username="batches")
+        with Path(mock_path / "import_yamtrack.csv").open("rb") as file:
+            imported_counts, _ = yamtrack.importer(file, user, "new")
+
+        self.assertEqual(imported_counts, self.import_results[0])
+        self.assertEqual(
+            Episode.objects.filter(related_season__user=user).count(),
+            24,
+        )
+
     def test_historical_records(self):
         """Test historical records creation during import."""
         anime = Anime.objects.filter(user=self.user).first()
@@ -491,6 +533,54 @@ class ImportTrakt(TestCase):
         trakt_importer.process_watched_episode(episode_entry)
         self.assertEqual(len(trakt_importer.bulk_media[MediaTypes.EPISODE.value]), 2)
 
+    @override_settings(IMPORT_FETCH_WORKERS=4)
+    @patch("integrations.imports.trakt.services.get_media_metadata")
+    def test_prefetch_metadata(self, mock_get_media_metadata):
+        """Test that distinct titles are fetched once with their seasons."""
+
+        def metadata_side_effect(media_type, media_id, _, season_numbers=None):
+            if media_type == "tv_with_seasons":
+                return {"title": "Test Show"} | {
+                    f"season/{number}": {"title": f"Season {number}"}
+                    for number in season_numbers
+                }
+            return {"title": f"{media_type} {media_id}"}
+
+        mock_get_media_metadata.side_effect = metadata_side_effect
+        show = {"title": "Test Show", "ids": {"tmdb": 12345}}
+        entries = [
+            {"type": "movie", "movie": {"title": "Movie", "ids": {"tmdb": 1}}},
+            {"type": "episode", "show": show, "episode": {"season": 2, "number": 1}},
+            {"type": "episode", "show": show, "episode": {"season": 1, "number": 1}},
+            {"type": "episode", "show": show, "episode": {"season": 1, "number": 2}},
+        ]
+
+        trakt_importer = TraktImporter("testuser", self.user, "new")
+        trakt_importer._prefetch_metadata(entries)
+
+        self.assertEqual(mock_get_media_metadata.call_count, 2)
+        mock_get_media_metadata.assert_any_call(
+            "tv_with_seasons",
+            "12345",
+            Sources.TMDB.value,
+            season_numbers=[1, 2],
+        )
+        self.assertEqual(
+            trakt_importer._get_metadata(MediaTypes.TV.value, "12345", "Test Show"),
+            {"title": "Test Show"},
+        )
+        self.assertEqual(
+            trakt_importer._get_metadata(
+                MediaTypes.SEASON.value,
+                "12345",
+                "Test Show",
+                2,
+            ),
+            {"title": "Season 2"},
+        )
+        # served from the prefetched results
+        self.assertEqual(mock_get_media_metadata.call_count, 2)
+
     @patch("integrations.imports.trakt.TraktImporter._make_api_request")
     @patch("integrations.imports.trakt.TraktImporter._get_metadata")
     def test_process_watchlist(self, mock_get_metadata, mock_make_request):
@@ -1045,6 +1135,54 @@ class HelpersTest(TestCase):
         # Check if reference was updated
         self.assertEqual(new_episode.related_season.id, season.id)
 
+    def test_cleanup_existing_media(self):
+        """Test deleting TV shows with their seasons, episodes and history."""
+        items = {
+            media_type: Item.objects.create(
+                media_id="1",
+                source=Sources.TMDB.value,
+                media_type=media_type,
+                title="Test Show",
+                **numbers,
+            )
+            for media_type, numbers in (
+                (MediaTypes.TV.value, {}),
+                (MediaTypes.SEASON.value, {"season_number": 1}),
+                (
+                    MediaTypes.EPISODE.value,
+                    {"season_number": 1, "episode_number": 1},
+                ),
+            )
+        }
+        tv = TV.objects.create(
+            item=items[MediaTypes.TV.value],
+            user=self.user,
+            status=Status.PLANNING.value,
+        )
+        season = Season.objects.create(
+            item=items[MediaTypes.SEASON.value],
+            user=self.user,
+            related_tv=tv,
+            status=Status.PLANNING.value,
+        )
+        # bulk created, saving would update the season status
+        bulk_create_with_history(
+            [Episode(item=items[MediaTypes.EPISODE.value], related_season=season)],
+            Episode,
+        )
+        existing = helpers.get_existing_media(self.user)
+        to_delete = {MediaTypes.TV.value: {Sources.TMDB.value: {"1"}}}
+
+        helpers.cleanup_existing_media(to_delete, self.user, existing)
+
+        self.assertFalse(TV.objects.exists())
+        self.assertFalse(Season.objects.exists())
+        self.assertFalse(Episode.objects.exists())
+        for model in (TV, Season, Episode):
+            self.assertFalse(model.history.exists())
+        self.assertEqual(existing[MediaTypes.TV.value][Sources.TMDB.value], set())
+        self.assertEqual(to_delete[MediaTypes.TV.value], {})
+
     @patch("django.contrib.messages.error")
     def test_create_import_schedule(self, mock_messages):
         """Test creating import schedule."""
@@ -1118,6 +1256,99 @@ class HelpersTest(TestCase):
         schedule = CrontabSchedule.objects.first()
         self.assertEqual(schedule.day_of_week, "*/2")
 
+    def test_get_existing_media(self):
+        """Test that the existing media are fetched as keys in one query."""
+        other_user = get_user_model().objects.create_user(username="other")
+        Movie.objects.bulk_create(
+            Movie(
+                item=Item.objects.create(
+                    media_id=media_id,
+                    source=Sources.TMDB.value,
+                    media_type=MediaTypes.MOVIE.value,
+                    title="Test Movie",
+                ),
+                user=user,
+                status=Status.COMPLETED.value,
+            )
+            for media_id, user in (("1", self.user), ("2", other_user))
+        )
+
+        with self.assertNumQueries(1):
+            existing = helpers.get_existing_media(self.user)
+
+        self.assertEqual(existing[MediaTypes.MOVIE.value][Sources.TMDB.value], {"1"})
+        self.assertEqual(existing[MediaTypes.TV.value][Sources.TMDB.value], set())
+
+    @patch("integrations.imports.helpers.CSV_READ_SIZE", 4)
+    def test_read_csv(self):
+        """Test reading a CSV file decoded in small chunks."""
+        file = BytesIO('title,notes\r\nPokémon,"two\r\nlines"\r\nÉ,\r\n'.encode())
+
+        rows = list(helpers.read_csv(file))
+
+        self.assertEqual(
+            rows,
+            [
+                {"title": "Pokémon", "notes": "two\r\nlines"},
+                {"title": "É", "notes": ""},
+            ],
+        )
+
+    def test_read_csv_invalid(self):
+        """Test that a file which isn't UTF-8 raises an import error."""
+        with self.assertRaises(helpers.MediaImportError):
+            list(helpers.read_csv(BytesIO(b"title\n\xff\n")))
+
+    def test_item_resolver(self):
+        """Test resolving existing and new items in bulk."""
+        existing = Item.objects.create(
+            media_id="1",
+            source=Sources.TMDB.value,
+            media_type=MediaTypes.SEASON.value,
+            season_number=1,
+            title="Old Title",
+            image="old.jpg",
+        )
+        resolver = helpers.ItemResolver()
+
+        season = resolver.get(
+            1,
+            Sources.TMDB.value,
+            MediaTypes.SEASON.value,
+            season_number=1,
+            defaults={"title": "New Title", "image": "new.jpg"},
+            update=True,
+        )
+        episode = resolver.get(
+            "1",
+            Sources.TMDB.value,
+            MediaTypes.EPISODE.value,
+            season_number=1,
+            episode_number=1,
+            defaults={"title": "Episode", "image": "episode.jpg"},
+        )
+        self.assertIs(
+            resolver.get(
+                "1",
+                Sources.TMDB.value,
+                MediaTypes.EPISODE.value,
+                season_number=1,
+                episode_number=1,
+            ),
+            episode,
+        )
+        self.assertIsNone(season.pk)
+
+        with self.assertNumQueries(5):
+            resolver.resolve()
+
+        self.assertEqual(season.pk, existing.pk)
+        existing.refresh_from_db()
+        self.assertEqual(existing.title, "New Title")
+        self.assertEqual(existing.image, "new.jpg")
+        self.assertEqual(Item.objects.get(pk=episode.pk).title, "Episode")
+        self.assertEqual(Item.objects.count(), 2)
+
 
 class ImportSteam(TestCase):
     """Test importing media from Steam."""
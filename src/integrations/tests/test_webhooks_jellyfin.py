@@ -1,10 +1,13 @@
 import json
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
-from django.test import Client, TestCase
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
 from django.urls import reverse
 
 from app.models import TV, Anime, Episode, Item, MediaTypes, Movie, Season, Status
+from integrations.webhooks.base import SUPPRESSED_COUNTER_KEY
 from integrations.webhooks.jellyfin import JellyfinWebhookProcessor
 
 
@@ -24,7 +27,8 @@ class JellyfinWebhookTests(TestCase):
         response = self.client.post(url, data={}, content_type="application/json")
         self.assertEqual(response.status_code, 401)
 
-    def test_tv_episode_mark_played(self):
+    @patch("app.tasks.queue_season_status_update")
+    def test_tv_episode_mark_played(self, mock_queue_status_update):
         """Test webhook handles TV episode mark played event."""
         payload = {
             "Event": "Stop",
@@ -69,6 +73,8 @@ class JellyfinWebhookTests(TestCase):
             item__episode_number=1,
         )
         self.assertIsNotNone(episode.end_date)
+        # without the webhook queue the statuses are updated inline
+        mock_queue_status_update.assert_not_called()
 
     def test_movie_mark_played(self):
         """Test webhook handles movie mark played event."""
@@ -333,3 +339,30 @@ class JellyfinWebhookTests(TestCase):
         if result != expected:
             msg = f"Expected {expected}, got {result}"
             raise AssertionError(msg)
+
+    @override_settings(WEBHOOK_DEDUPE_WINDOW=30)
+    @patch.object(JellyfinWebhookProcessor, "_process_movie")
+    def test_duplicate_events_suppressed(self, mock_process_movie):
+        """Test that repeated events within the dedupe window are dropped."""
+        cache.clear()
+        payload = {
+            "Event": "Stop",
+            "Item": {
+                "Name": "The Matrix",
+                "ProductionYear": 1999,
+                "Type": "Movie",
+                "ProviderIds": {"Tmdb": "603"},
+                "UserData": {"Played": False},
+            },
+        }
+        processor = JellyfinWebhookProcessor()
+
+        processor.process_payload(payload, self.user)
+        processor.process_payload(payload, self.user)
+        self.assertEqual(mock_process_movie.call_count, 1)
+        self.assertEqual(cache.get(SUPPRESSED_COUNTER_KEY), 1)
+
+        # finishing the movie isn't a duplicate of the playback
+        payload["Item"]["UserData"]["Played"] = True
+        processor.process_payload(payload, self.user)
+        self.assertEqual(mock_process_movie.call_count, 2)
@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import Client, TestCase, override_settings
+from django.urls import reverse
+
+from integrations.models import WebhookEvent, WebhookSources
+from integrations.tasks import process_webhook_events
+from integrations.webhooks import queue
+
+
+@override_settings(WEBHOOK_QUEUE=True)
+class WebhookQueueTests(TestCase):
+    """Tests for the queued webhook ingestion."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.client = Client()
+        self.credentials = {"username": "testuser", "token": "test-token"}
+        self.user = get_user_model().objects.create_superuser(**self.credentials)
+        self.url = reverse("jellyfin_webhook", kwargs={"token": "test-token"})
+        self.payload = {"Event": "Stop", "Item": {"Type": "Movie", "Name": "Test"}}
+
+    @patch("integrations.webhooks.jellyfin.JellyfinWebhookProcessor.process_payload")
+    def test_webhook_accepted_and_processed(self, mock_process_payload):
+        """Test that the webhook is answered with 202 and processed by the task."""
+        response = self.client.post(
+            self.url,
+            data=self.payload,
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 202)
+        mock_process_payload.assert_called_once_with(self.payload, self.user)
+        event = WebhookEvent.objects.get()
+        self.assertIsNotNone(event.processed_at)
+        self.assertEqual(event.error, "")
+
+    @patch("integrations.tasks.process_webhook_events.delay")
+    def test_duplicate_pending_payload(self, mock_delay):
+        """Test that identical pending payloads are only queued once."""
+        for _ in range(2):
+            response = self.client.post(
+                self.url,
+                data=self.payload,
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, 202)
+
+        self.assertEqual(WebhookEvent.objects.count(), 1)
+        mock_delay.assert_called_once_with(self.user.id)
+
+    @patch("integrations.webhooks.jellyfin.JellyfinWebhookProcessor.process_payload")
+    def test_events_processed_in_order(self, mock_process_payload):
+        """Test that a failing event doesn't block the following ones."""
+        mock_process_payload.side_effect = [ValueError("bad payload"), None]
+        first = {**self.payload, "Event": "Play"}
+        queue.enqueue(self.user, WebhookSources.JELLYFIN.value, first)
+        queue.enqueue(self.user, WebhookSources.JELLYFIN.value, self.payload)
+
+        process_webhook_events(self.user.id)
+
+        self.assertEqual(
+            [call.args[0] for call in mock_process_payload.call_args_list],
+            [first, self.payload],
+        )
+        events = list(WebhookEvent.objects.all())
+        self.assertEqual(events[0].error, "bad payload")
+        self.assertFalse(WebhookEvent.objects.filter(processed_at=None).exists())
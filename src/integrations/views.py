@@ -18,7 +18,8 @@ from django.views.decorators.http import require_GET, require_POST
 import users
 from integrations import exports, tasks
 from integrations.imports import helpers, simkl, trakt
-from integrations.webhooks import emby, jellyfin, plex
+from integrations.models import WebhookSources
+from integrations.webhooks import queue
 
 logger = logging.getLogger(__name__)
 
@@ -356,9 +357,7 @@ def jellyfin_webhook(request, token):
         return HttpResponse("Missing payload", status=400)
 
     payload = json.loads(data)
-    processor = jellyfin.JellyfinWebhookProcessor()
-    processor.process_payload(payload, user)
-    return HttpResponse(status=200)
+    return process_webhook(user, WebhookSources.JELLYFIN.value, payload)
 
 
 @login_not_required
@@ -389,9 +388,7 @@ def plex_webhook(request, token):
         return HttpResponse("Missing payload", status=400)
 
     payload = json.loads(data)
-    processor = plex.PlexWebhookProcessor()
-    processor.process_payload(payload, user)
-    return HttpResponse(status=200)
+    return process_webhook(user, WebhookSources.PLEX.value, payload)
 
 
 @login_not_required
@@ -420,6 +417,19 @@ def emby_webhook(request, token):
         return HttpResponse("Missing payload", status=400)
 
     payload = json.loads(data)
-    processor = emby.EmbyWebhookProcessor()
-    processor.process_payload(payload, user)
+    return process_webhook(user, WebhookSources.EMBY.value, payload)
+
+
+def process_webhook(user, source, payload):
+    """Process a webhook payload, or queue it when the webhook queue is enabled.
+
+    Queued payloads are answered with 202 Accepted before any provider or
+    database work, so media servers don't time out during bursts.
+    """
+    if settings.WEBHOOK_QUEUE:
+        if queue.enqueue(user, source, payload):
+            tasks.process_webhook_events.delay(user.id)
+        return HttpResponse(status=202)
+
+    queue.PROCESSORS[source]().process_payload(payload, user)
     return HttpResponse(status=200)
@@ -0,0 +1,136 @@
+import bisect
+import logging
+import threading
+import uuid
+from operator import itemgetter
+
+from django.conf import settings
+from django.core.cache import cache
+
+import app
+
+logger = logging.getLogger(__name__)
+
+MAPPING_URL = "https://raw.githubusercontent.com/Kometa-Team/Anime-IDs/refs/heads/master/anime_ids.json"
+MAPPING_CACHE_KEY = "anime_mapping_index"
+VERSION_CACHE_KEY = "anime_mapping_version"
+
+_loaded = None
+_lock = threading.Lock()
+
+
+class AnimeMapping:
+    """Lookup tables of the Kometa anime ID mapping.
+
+    tvdb maps a TVDB ID to its (season, episode offset, MAL ID) entries sorted
+    by season and offset, tmdb_movies and imdb map the ID to the MAL ID.
+    """
+
+    def __init__(self, tvdb, tmdb_movies, imdb):
+        """Initialize the mapping with its lookup tables."""
+        self.tvdb = tvdb
+        self.tmdb_movies = tmdb_movies
+        self.imdb = imdb
+        self.version = uuid.uuid4().hex
+
+    @classmethod
+    def build(cls, mapping_data):
+        """Index the entries of the downloaded mapping file."""
+        tvdb = {}
+        tmdb_movies = {}
+        imdb = {}
+
+        for entry in mapping_data.values():
+            if "mal_id" not in entry:
+                continue
+            mal_id = parse_mal_id(entry["mal_id"])
+
+            season = entry.get("tvdb_season")
+            if entry.get("tvdb_id") is not None and isinstance(season, int):
+                tvdb.setdefault(entry["tvdb_id"], []).append(
+                    (season, entry.get("tvdb_epoffset", 0), mal_id),
+                )
+            if entry.get("tmdb_movie_id") is not None:
+                tmdb_movies.setdefault(entry["tmdb_movie_id"], mal_id)
+            if entry.get("imdb_id") is not None:
+                imdb.setdefault(entry["imdb_id"], mal_id)
+
+        # stable sort, entries sharing an offset keep the file order
+        for entries in tvdb.values():
+            entries.sort(key=itemgetter(0, 1))
+
+        logger.info(
+            "Indexed anime mapping: %d TVDB, %d TMDB movie and %d IMDB IDs",
+            len(tvdb),
+            len(tmdb_movies),
+            len(imdb),
+        )
+        return cls(tvdb, tmdb_movies, imdb)
+
+    def get_mal_id_from_tvdb(self, tvdb_id, season_number, episode_number):
+        """Return the MAL ID and episode number of a TVDB episode."""
+        entries = self.tvdb.get(tvdb_id)
+        if not entries:
+            return None, None
+
+        season_end = bisect.bisect_right(entries, season_number, key=itemgetter(0))
+        # last entry of the season whose offset is below the episode number
+        index = (
+            bisect.bisect_left(
+                entries,
+                (season_number, episode_number),
+                hi=season_end,
+                key=itemgetter(0, 1),
+            )
+            - 1
+        )
+        if index < 0 or entries[index][0] != season_number:
+            return None, None
+
+        _, offset, mal_id = entries[index]
+        return mal_id, episode_number - offset
+
+    def get_mal_id_from_tmdb_movie(self, tmdb_movie_id):
+        """Return the MAL ID of a TMDB movie."""
+        return self.tmdb_movies.get(tmdb_movie_id)
+
+    def get_mal_id_from_imdb(self, imdb_id):
+        """Return the MAL ID of an IMDB ID."""
+        return self.imdb.get(imdb_id)
+
+
+def parse_mal_id(mal_id):
+    """Parse MAL ID from potentially comma-separated string.
+
+    mal_id: Either a single ID (int) or comma-separated string of IDs
+    """
+    if isinstance(mal_id, str) and "," in mal_id:
+        return mal_id.split(",")[0].strip()
+    return mal_id
+
+
+def get_anime_mapping():
+    """Return the anime mapping, held in memory by each process.
+
+    The index is built once per download and cached in Redis. Processes only
+    load it again when its version changes or the version key expires, which
+    also revalidates the mapping file.
+    """
+    global _loaded  # noqa: PLW0603
+
+    version = cache.get(VERSION_CACHE_KEY)
+    if _loaded is not None and version == _loaded.version:
+        return _loaded
+
+    with _lock:
+        if _loaded is None or version != _loaded.version:
+            mapping = app.providers.services.cached_request(
+                "GITHUB",
+                MAPPING_URL,
+                MAPPING_CACHE_KEY,
+                process=AnimeMapping.build,
+            )
+            cache.set(VERSION_CACHE_KEY, mapping.version, settings.CACHE_TIMEOUT)
+            _loaded = mapping
+
+    return _loaded
@@ -1,13 +1,20 @@
+import hashlib
+import json
 import logging
 
+from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
 
 import app
+from app.mixins import defer_episode_status_updates
 from app.models import MediaTypes, Sources, Status
+from integrations.webhooks.anime_mapping import get_anime_mapping
 
 logger = logging.getLogger(__name__)
 
+SUPPRESSED_COUNTER_KEY = "webhook_dedupe_suppressed"
+
 
 class BaseWebhookProcessor:
     """Base class for webhook processors."""
@@ -41,6 +48,10 @@ class BaseWebhookProcessor:
         """Get media title from payload."""
         raise NotImplementedError
 
+    def _get_episode_numbers(self, payload):
+        """Get season and episode numbers from payload."""
+        raise NotImplementedError
+
     def _process_media(self, payload, user, ids):
         """Route processing based on media type."""
         media_type = self._get_media_type(payload)
@@ -49,6 +60,10 @@ class BaseWebhookProcessor:
             return
 
         title = self._get_media_title(payload)
+        if self._is_duplicate(payload, user, ids, media_type):
+            logger.info("Ignoring duplicate webhook for %s: %s", media_type, title)
+            return
+
         logger.info("Received webhook for %s: %s", media_type, title)
 
         if media_type == MediaTypes.TV.value:
@@ -56,6 +71,37 @@ class BaseWebhookProcessor:
         elif media_type == MediaTypes.MOVIE.value:
             self._process_movie(payload, user, ids)
 
+    def _is_duplicate(self, payload, user, ids, media_type):
+        """Check if the same event was received within the dedupe window.
+
+        Media servers often send several events for the same playback within
+        seconds, they are dropped before any provider or database work.
+        """
+        window = settings.WEBHOOK_DEDUPE_WINDOW
+        if window <= 0:
+            return False
+
+        episode_numbers = (
+            self._get_episode_numbers(payload)
+            if media_type == MediaTypes.TV.value
+            else None
+        )
+        key_data = [
+            user.id,
+            sorted(ids.items()),
+            episode_numbers,
+            self._is_played(payload),
+        ]
+        digest = hashlib.sha256(json.dumps(key_data).encode()).hexdigest()
+
+        if cache.add(f"webhook_dedupe_{digest}", 1, window):
+            return False
+
+        cache.add(SUPPRESSED_COUNTER_KEY, 0, None)
+        suppressed = cache.incr(SUPPRESSED_COUNTER_KEY)
+        logger.debug("Suppressed %d duplicate webhook events so far", suppressed)
+        return True
+
     def _process_tv(self, payload, user, ids):
         media_id, season_number, episode_number = self._find_tv_media_id(ids)
         if not media_id:
@@ -71,9 +117,7 @@ class BaseWebhookProcessor:
             return
 
         if user.anime_enabled:
-            mapping_data = self._fetch_mapping_data()
-            mal_id, episode_offset = self._get_mal_id_from_tvdb(
-                mapping_data,
+            mal_id, episode_offset = get_anime_mapping().get_mal_id_from_tvdb(
                 int(tvdb_id),
                 season_number,
                 episode_number,
@@ -101,16 +145,16 @@ class BaseWebhookProcessor:
 
         # Try to detect anime first if user has anime enabled
         if user.anime_enabled:
-            mapping_data = self._fetch_mapping_data()
+            mapping = get_anime_mapping()
             mal_id = None
             source = None
 
             if tmdb_id:
-                mal_id = self._get_mal_id_from_tmdb_movie(mapping_data, tmdb_id)
+                mal_id = mapping.get_mal_id_from_tmdb_movie(tmdb_id)
                 source = "TMDB"
 
             if not mal_id and imdb_id:
-                mal_id = self._get_mal_id_from_imdb(mapping_data, imdb_id)
+                mal_id = mapping.get_mal_id_from_imdb(imdb_id)
                 source = "IMDB"
 
             if mal_id:
@@ -159,71 +203,6 @@ class BaseWebhookProcessor:
                     )
         return None, None, None
 
-    def _fetch_mapping_data(self):
-        """Fetch anime mapping data with caching."""
-        data = cache.get("anime_mapping_data")
-        if data is None:
-            url = "https://raw.githubusercontent.com/Kometa-Team/Anime-IDs/refs/heads/master/anime_ids.json"
-            data = app.providers.services.api_request("GITHUB", "GET", url)
-            cache.set("anime_mapping_data", data)
-        return data
-
-    def _get_mal_id_from_tvdb(
-        self,
-        mapping_data,
-        tvdb_id,
-        season_number,
-        episode_number,
-    ):
-        matching_entries = [
-            entry
-            for entry in mapping_data.values()
-            if entry.get("tvdb_id") == tvdb_id
-            and entry.get("tvdb_season") == season_number
-            and "mal_id" in entry
-        ]
-
-        if not matching_entries:
-            return None, None
-
-        matching_entries.sort(key=lambda x: x.get("tvdb_epoffset", 0))
-        for i, entry in enumerate(matching_entries):
-            current_offset = entry.get("tvdb_epoffset", 0)
-            next_offset = (
-                matching_entries[i + 1].get("tvdb_epoffset", float("inf"))
-                if i < len(matching_entries) - 1
-                else float("inf")
-            )
-
-            if current_offset < episode_number <= next_offset:
-                mal_id = self._parse_mal_id(entry["mal_id"])
-                return mal_id, episode_number - current_offset
-
-        return None, None
-
-    def _get_mal_id_from_tmdb_movie(self, mapping_data, tmdb_movie_id):
-        """Find MAL ID from TMDB movie mapping."""
-        for entry in mapping_data.values():
-            if entry.get("tmdb_movie_id") == tmdb_movie_id and "mal_id" in entry:
-                return self._parse_mal_id(entry["mal_id"])
-        return None
-
-    def _get_mal_id_from_imdb(self, mapping_data, imdb_id):
-        """Find MAL ID from IMDB ID mapping."""
-        for entry in mapping_data.values():
-            if entry.get("imdb_id") == imdb_id and "mal_id" in entry:
-                return self._parse_mal_id(entry["mal_id"])
-        return None
-
-    def _parse_mal_id(self, mal_id):
-        """Parse MAL ID from potentially comma-separated string.
-
-        mal_id: Either a single ID (int) or comma-separated string of IDs
-        """
-        if isinstance(mal_id, str) and "," in mal_id:
-            return mal_id.split(",")[0].strip()
-        return mal_id
-
     def _handle_movie(self, media_id, payload, user):
         """Handle movie playback event."""
         movie_metadata = app.providers.tmdb.movie(media_id)
@@ -386,11 +365,14 @@ class BaseWebhookProcessor:
                     )
 
             if should_create:
-                app.models.Episode.objects.create(
-                    item=episode_item,
-                    related_season=season_instance,
-                    end_date=now,
-                )
+                # queued webhooks coalesce the status updates of bursts for the
+                # same season, synchronous ones update the statuses inline
+                with defer_episode_status_updates(batch=settings.WEBHOOK_QUEUE):
+                    app.models.Episode.objects.create(
+                        item=episode_item,
+                        related_season=season_instance,
+                        end_date=now,
+                    )
                 logger.info(
                     "Marked episode as played: %s S%02dE%02d",
                     tv_metadata["title"],
@@ -41,14 +41,19 @@ class JellyfinWebhookProcessor(BaseWebhookProcessor):
     def _get_media_type(self, payload):
         return self.MEDIA_TYPE_MAPPING.get(payload["Item"].get("Type"))
 
+    def _get_episode_numbers(self, payload):
+        return (
+            payload["Item"].get("ParentIndexNumber"),
+            payload["Item"].get("IndexNumber"),
+        )
+
     def _get_media_title(self, payload):
         """Get media title from payload."""
         title = None
 
         if self._get_media_type(payload) == MediaTypes.TV.value:
             series_name = payload["Item"].get("SeriesName")
-            season_number = payload["Item"].get("ParentIndexNumber")
-            episode_number = payload["Item"].get("IndexNumber")
+            season_number, episode_number = self._get_episode_numbers(payload)
             title = f"{series_name} S{season_number:02d}E{episode_number:02d}"
 
         elif self._get_media_type(payload) == MediaTypes.MOVIE.value:
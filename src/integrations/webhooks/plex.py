@@ -63,14 +63,19 @@ class PlexWebhookProcessor(BaseWebhookProcessor):
 
         return self.MEDIA_TYPE_MAPPING.get(media_type.title())
 
+    def _get_episode_numbers(self, payload):
+        return (
+            payload["Metadata"].get("parentIndex"),
+            payload["Metadata"].get("index"),
+        )
+
     def _get_media_title(self, payload):
         """Get media title from payload."""
         title = None
 
         if self._get_media_type(payload) == MediaTypes.TV.value:
             series_name = payload["Metadata"].get("grandparentTitle")
-            season_number = payload["Metadata"].get("parentIndex")
-            episode_number = payload["Metadata"].get("index")
+            season_number, episode_number = self._get_episode_numbers(payload)
             title = f"{series_name} S{season_number:02d}E{episode_number:02d}"
 
         elif self._get_media_type(payload) == MediaTypes.MOVIE.value:
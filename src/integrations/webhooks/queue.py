@@ -0,0 +1,76 @@
+import hashlib
+import json
+import logging
+
+from django.db import IntegrityError, transaction
+from django.http import HttpRequest
+from django.utils import timezone
+from simple_history.models import HistoricalRecords
+
+from integrations.models import WebhookEvent, WebhookSources
+from integrations.webhooks import emby, jellyfin, plex
+
+logger = logging.getLogger(__name__)
+
+PROCESSORS = {
+    WebhookSources.JELLYFIN.value: jellyfin.JellyfinWebhookProcessor,
+    WebhookSources.PLEX.value: plex.PlexWebhookProcessor,
+    WebhookSources.EMBY.value: emby.EmbyWebhookProcessor,
+}
+
+
+def enqueue(user, source, payload):
+    """Queue a webhook payload, return False if an identical one is pending."""
+    payload_hash = hashlib.sha256(
+        json.dumps([source, payload], sort_keys=True).encode(),
+    ).hexdigest()
+
+    try:
+        with transaction.atomic():
+            WebhookEvent.objects.create(
+                user=user,
+                source=source,
+                payload=payload,
+                payload_hash=payload_hash,
+            )
+    except IntegrityError:
+        logger.info("Ignoring duplicate %s webhook for %s", source, user)
+        return False
+
+    return True
+
+
+def process_pending(user):
+    """Process the pending webhook events of the user in the order received.
+
+    A failing event is marked as processed with its error so it doesn't block
+    the ones behind it.
+    """
+    # the request user populates history_user_id, as in the webhook views
+    request = HttpRequest()
+    request.user = user
+    previous_request = getattr(HistoricalRecords.context, "request", None)
+    HistoricalRecords.context.request = request
+
+    processed = 0
+    try:
+        while event := WebhookEvent.objects.filter(
+            user=user,
+            processed_at__isnull=True,
+        ).first():
+            try:
+                PROCESSORS[event.source]().process_payload(event.payload, user)
+            except Exception as error:
+                logger.exception("Failed to process %s", event)
+                event.error = str(error)
+
+            event.processed_at = timezone.now()
+            event.save(update_fields=["processed_at", "error"])
+            processed += 1
+    finally:
+        if previous_request is None:
+            del HistoricalRecords.context.request
+        else:
+            HistoricalRecords.context.request = previous_request
+
+    return processed
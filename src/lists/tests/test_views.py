@@ -524,6 +524,54 @@ class ListDetailViewTests(TestCase):
         self.assertTemplateUsed(response, "lists/components/media_grid.html")
         self.assertNotIn("form", response.context)
 
+    def _get_all_pages(self, sort):
+        """Follow the cursors of the list detail and return the item ids."""
+        url = reverse("list_detail", args=[self.custom_list.id])
+        pages = []
+        cursor = None
+        while True:
+            params = f"?sort={sort}" + (f"&cursor={cursor}" if cursor else "")
+            response = self.client.get(url + params, HTTP_HX_REQUEST="true")
+            self.assertEqual(response.status_code, 200)
+            pages.append([item.id for item in response.context["items"]])
+            if not response.context["has_next"]:
+                return pages
+            cursor = response.context["next_cursor"]
+
+    @patch.object(get_user_model(), "update_preference")
+    def test_list_detail_view_cursor_pages(self, mock_update_preference):
+        """Test that following next_cursor returns every item exactly once."""
+        items = Item.objects.bulk_create(
+            Item(
+                media_id=str(1000 + number),
+                source=Sources.TMDB.value,
+                media_type=MediaTypes.MOVIE.value,
+                # repeated titles and dates make the primary key break ties
+                title=f"Movie {number % 4}",
+            )
+            for number in range(20)
+        )
+        CustomListItem.objects.bulk_create(
+            CustomListItem(custom_list=self.custom_list, item=item) for item in items
+        )
+        CustomListItem.objects.filter(item__in=items[:10]).update(
+            date_added=CustomListItem.objects.get(item=self.movie_item).date_added,
+        )
+        expected_ids = set(self.custom_list.items.values_list("id", flat=True))
+
+        for sort in ("title", "date_added"):
+            with self.subTest(sort=sort):
+                mock_update_preference.side_effect = lambda field, _value, sort=sort: (
+                    sort if field == "list_detail_sort" else None
+                )
+
+                pages = self._get_all_pages(sort)
+
+                self.assertEqual([len(page) for page in pages], [16, 7])
+                item_ids = [item_id for page in pages for item_id in page]
+                self.assertEqual(len(item_ids), len(set(item_ids)))
+                self.assertEqual(set(item_ids), expected_ids)
+
 
 class CreateListViewTest(TestCase):
     """Test case for the create list view."""
@@ -10,6 +10,7 @@ from django.views.decorators.http import require_GET, require_POST
 
 from app import helpers
 from app.models import Item, MediaManager, MediaTypes
+from app.pagination import keyset_paginate
 from app.providers import services
 from lists.forms import CustomListForm
 from lists.models import CustomList, CustomListItem
@@ -111,7 +112,7 @@ def list_detail(request, list_id):
             "list_detail_status",
             request.GET.get("status"),
         ),
-        "page": int(request.GET.get("page", 1)),
+        "cursor": request.GET.get("cursor"),
         "search_query": request.GET.get("q", ""),
     }
 
@@ -168,9 +169,8 @@ def list_detail(request, list_id):
         *sort_mapping.get(params["sort_by"], ["-customlistitem__date_added"]),
     )
 
-    # Paginate and prepare media objects
-    paginator = Paginator(items, 16)
-    items_page = paginator.get_page(params["page"])
+    # Paginate and prepare media objects, infinite scroll continues after the cursor
+    items_page = keyset_paginate(items, params["cursor"], 16)
 
     media_by_item_id = {}
     media_types_in_page = {item.media_type for item in items_page}
@@ -208,9 +208,7 @@ def list_detail(request, list_id):
         "custom_list": custom_list,
         "items": items_page,
         "has_next": items_page.has_next(),
-        "next_page_number": items_page.next_page_number()
-        if items_page.has_next()
-        else None,
+        "next_cursor": items_page.next_cursor,
         "current_sort": params["sort_by"],
         "current_status": params["status_filter"],
         "sort_choices": ListDetailSortChoices.choices,
@@ -223,7 +221,7 @@ def list_detail(request, list_id):
             {
                 "form": CustomListForm(instance=custom_list),
                 "media_types": MediaTypes.values,
-                "items_count": paginator.count,
+                "items_count": items.count(),
                 "collaborators_count": custom_list.collaborators.count() + 1,
             },
         )